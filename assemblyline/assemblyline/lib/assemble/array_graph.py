@@ -0,0 +1,231 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+'''
+import collections
+import numpy as np
+import networkx as nx
+
+NODE_DTYPE = np.int32
+
+def build_csr(num_nodes, u, v):
+    '''
+    returns (ptr, idx) arrays where idx[ptr[n]:ptr[n+1]] contains the
+    sorted neighbors 'v' of node 'n' given arrays of edges (u,v)
+    '''
+    order = np.lexsort((v, u))
+    idx = v[order].astype(NODE_DTYPE)
+    ptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=num_nodes), out=ptr[1:])
+    return ptr, idx
+
+def connected_components(num_nodes, u, v):
+    '''
+    find the connected components of an undirected graph with edges (u,v)
+    using union-find. returns a list containing the sorted nodes of each 
+    component ordered by the smallest node of each component
+    '''
+    parent = range(num_nodes)
+    def find(n):
+        while parent[n] != n:
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+        return n
+    for a, b in zip(u.tolist(), v.tolist()):
+        a = find(a)
+        b = find(b)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+    components = collections.OrderedDict()
+    for n in xrange(num_nodes):
+        components.setdefault(find(n), []).append(n)
+    return components.values()
+
+class ArrayGraph(object):
+    '''
+    compact directed graph with integer nodes numbered 0..n-1. successors
+    and predecessors are stored as compressed sparse row (CSR) arrays and
+    node attributes are stored as numpy arrays (or lists) indexed by
+    node. the structure of the graph cannot be changed after creation
+
+    node attributes are registered with 'add_node_attr' so that they are
+    carried over to subgraphs
+    '''
+    def __init__(self, num_nodes, edges=()):
+        self.num_nodes = num_nodes
+        if not isinstance(edges, np.ndarray):
+            edges = list(edges)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        # remove duplicate edges
+        keys = np.unique(edges[:,0] * max(1, num_nodes) + edges[:,1])
+        u = keys // max(1, num_nodes)
+        v = keys % max(1, num_nodes)
+        self.succ_ptr, self.succ_idx = build_csr(num_nodes, u, v)
+        self.pred_ptr, self.pred_idx = build_csr(num_nodes, v, u)
+        self.node_attrs = []
+        self.graph = {}
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __iter__(self):
+        return iter(xrange(self.num_nodes))
+
+    def add_node_attr(self, name, values):
+        setattr(self, name, values)
+        if name not in self.node_attrs:
+            self.node_attrs.append(name)
+
+    def number_of_edges(self):
+        return len(self.succ_idx)
+
+    def successors(self, n):
+        return self.succ_idx[self.succ_ptr[n]:self.succ_ptr[n+1]]
+
+    def predecessors(self, n):
+        return self.pred_idx[self.pred_ptr[n]:self.pred_ptr[n+1]]
+
+    def out_degree(self):
+        return np.diff(self.succ_ptr)
+
+    def in_degree(self):
+        return np.diff(self.pred_ptr)
+
+    def edges(self):
+        '''
+        returns arrays (u,v) of edges sorted by 'u' then 'v'
+        '''
+        u = np.repeat(np.arange(self.num_nodes, dtype=NODE_DTYPE),
+                      self.out_degree())
+        return u, self.succ_idx
+
+    def successor_lists(self):
+        ptr = self.succ_ptr.tolist()
+        idx = self.succ_idx.tolist()
+        return [idx[ptr[n]:ptr[n+1]] for n in xrange(self.num_nodes)]
+
+    def predecessor_lists(self):
+        ptr = self.pred_ptr.tolist()
+        idx = self.pred_idx.tolist()
+        return [idx[ptr[n]:ptr[n+1]] for n in xrange(self.num_nodes)]
+
+    def topological_sort(self, succ=None):
+        '''
+        returns a list of nodes in topological order. raises ValueError
+        if the graph contains a cycle. 'succ' may be set to the result of
+        'successor_lists' to avoid computing it again
+        '''
+        in_degree = self.in_degree().tolist()
+        if succ is None:
+            succ = self.successor_lists()
+        queue = collections.deque(n for n in xrange(self.num_nodes)
+                                  if in_degree[n] == 0)
+        order = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in succ[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
+        if len(order) != self.num_nodes:
+            raise ValueError("graph contains a cycle")
+        return order
+
+    def topological_levels(self):
+        '''
+        returns arrays (levels, reverse_levels) with the length of the 
+        longest path to each node from any node without predecessors, and
+        from each node to any node without successors. every edge points
+        from a lower to a higher level (and from a higher to a lower 
+        reverse level) so the nodes within a level can be processed 
+        together
+        '''
+        succ = self.successor_lists()
+        order = self.topological_sort(succ)
+        levels = [0] * self.num_nodes
+        for u in order:
+            level = levels[u] + 1
+            for v in succ[u]:
+                if levels[v] < level:
+                    levels[v] = level
+        reverse_levels = [0] * self.num_nodes
+        for u in reversed(order):
+            level = 0
+            for v in succ[u]:
+                if reverse_levels[v] >= level:
+                    level = reverse_levels[v] + 1
+            reverse_levels[u] = level
+        return (np.array(levels, dtype=np.int64), 
+                np.array(reverse_levels, dtype=np.int64))
+
+    def subgraph(self, nodes):
+        '''
+        returns a new graph induced by 'nodes', where node nodes[i] in
+        this graph becomes node 'i' in the subgraph. node attributes are
+        copied to the subgraph
+        '''
+        nodes = np.asarray(nodes, dtype=NODE_DTYPE)
+        node_map = np.empty(self.num_nodes, dtype=np.int64)
+        node_map.fill(-1)
+        node_map[nodes] = np.arange(len(nodes))
+        u, v = self.edges()
+        u = node_map[u]
+        v = node_map[v]
+        keep = (u >= 0) & (v >= 0)
+        H = ArrayGraph(len(nodes), np.column_stack((u[keep], v[keep])))
+        for name in self.node_attrs:
+            values = getattr(self, name)
+            if isinstance(values, np.ndarray):
+                H.add_node_attr(name, values[nodes])
+            else:
+                H.add_node_attr(name, [values[n] for n in nodes])
+        H.graph.update(self.graph)
+        return H
+
+    def weakly_connected_components(self):
+        '''
+        returns a list of arrays of the nodes in each weakly connected
+        component. components are ordered by their smallest node and
+        nodes are sorted within each component
+        '''
+        u, v = self.edges()
+        components = connected_components(self.num_nodes, u, v)
+        return [np.array(nodes, dtype=NODE_DTYPE)
+                for nodes in components]
+
+    def to_networkx(self):
+        '''
+        convert to a networkx DiGraph for debugging or export
+        '''
+        G = nx.DiGraph()
+        G.graph.update(self.graph)
+        for n in xrange(self.num_nodes):
+            attr_dict = {}
+            for name in self.node_attrs:
+                value = getattr(self, name)[n]
+                if isinstance(value, np.generic):
+                    value = value.item()
+                attr_dict[name] = value
+            G.add_node(n, attr_dict=attr_dict)
+        u, v = self.edges()
+        G.add_edges_from(zip(u.tolist(), v.tolist()))
+        return G
@@ -22,74 +22,144 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
 import logging
 import collections
-import networkx as nx
+import time
+import numpy as np
 
 from assemblyline.lib.transcript import Exon, NEG_STRAND
-from base import NODE_SCORE, CHAIN_NODES, \
-    SMOOTH_FWD, SMOOTH_REV, SMOOTH_TMP, PathInfo
+from base import NODE_SCORE, SMOOTH_FWD, SMOOTH_REV, SMOOTH_TMP, PathInfo
+from array_graph import ArrayGraph
 from path_finder import find_suboptimal_paths
 from smooth import smooth_graph
 
-SOURCE = -1
-SINK = -2
+SOURCE = 0
+SINK = 1
 
 def get_start_end_nodes(G):
     # get all leaf nodes
-    start_nodes = set()
-    end_nodes = set()
-    for n in G.nodes_iter():
-        if G.in_degree(n) == 0:
-            start_nodes.add(n)
-        if G.out_degree(n) == 0:
-            end_nodes.add(n)
+    start_nodes = set(np.flatnonzero(G.in_degree() == 0).tolist())
+    end_nodes = set(np.flatnonzero(G.out_degree() == 0).tolist())
     return start_nodes, end_nodes
 
-def init_node_attrs():
-    return {NODE_SCORE: 0.0, SMOOTH_FWD: 0.0, 
-            SMOOTH_REV: 0.0, SMOOTH_TMP: 0.0}
+class KmerGraphBuilder(object):
+    '''
+    accumulates the nodes, edges and scores of a k-mer graph before
+    creating an ArrayGraph. node 0 is the 'source' node, node 1 is the
+    'sink' node, and k-mers are numbered from 2
+    '''
+    def __init__(self):
+        self.scores = [0.0, 0.0]
+        self.smooth_fwd = [0.0, 0.0]
+        self.smooth_rev = [0.0, 0.0]
+        self.edges = []
 
-def add_path(K, path, score):
-    # add first kmer
-    from_id = path[0]
-    if from_id not in K:
-        K.add_node(from_id, attr_dict=init_node_attrs())
-    kmerattrs = K.node[from_id]
-    kmerattrs[NODE_SCORE] += score
-    # the first kmer should be "smoothed" in reverse direction
-    kmerattrs[SMOOTH_REV] += score
-    for to_id in path[1:]:
-        if to_id not in K:
-            K.add_node(to_id, attr_dict=init_node_attrs())
-        kmerattrs = K.node[to_id]
-        kmerattrs[NODE_SCORE] += score
-        # connect kmers
-        K.add_edge(from_id, to_id)
-        # update from_kmer to continue loop
-        from_id = to_id
-    # the last kmer should be "smoothed" in forward direction
-    kmerattrs[SMOOTH_FWD] += score
+    def __len__(self):
+        return len(self.scores)
 
-def hash_kmers(id_kmer_map, k, ksmall):
-    kmer_hash = collections.defaultdict(lambda: set())
-    for kmer_id,kmer in id_kmer_map.iteritems():
-        for i in xrange(k - (ksmall-1)):
-            kmer_hash[kmer[i:i+ksmall]].add(kmer_id)
-    return kmer_hash
+    def add_node(self):
+        self.scores.append(0.0)
+        self.smooth_fwd.append(0.0)
+        self.smooth_rev.append(0.0)
+        return len(self.scores) - 1
 
-def find_short_path_kmers(kmer_hash, K, path, score):
+    def add_path(self, path, score):
+        scores = self.scores
+        # add first kmer
+        from_id = path[0]
+        scores[from_id] += score
+        # the first kmer should be "smoothed" in reverse direction
+        self.smooth_rev[from_id] += score
+        for to_id in path[1:]:
+            scores[to_id] += score
+            # connect kmers
+            self.edges.append((from_id, to_id))
+            # update from_kmer to continue loop
+            from_id = to_id
+        # the last kmer should be "smoothed" in forward direction
+        self.smooth_fwd[from_id] += score
+
+    def create_graph(self):
+        '''
+        returns an ArrayGraph. fragmented transcripts can manifest as 
+        0-degree dangling ends of the overlap graph, so all nodes with 
+        degree zero are connected to the 'source' and/or 'sink' nodes
+        to account for fragmentation in the kmer graph when k > 2
+        '''
+        num_nodes = len(self.scores)
+        edges = np.array(self.edges, dtype=np.int64).reshape(-1, 2)
+        in_degree = np.bincount(edges[:,1], minlength=num_nodes)
+        out_degree = np.bincount(edges[:,0], minlength=num_nodes)
+        in_degree[[SOURCE, SINK]] = 1
+        out_degree[[SOURCE, SINK]] = 1
+        dangling_starts = np.flatnonzero(in_degree == 0)
+        dangling_ends = np.flatnonzero(out_degree == 0)
+        edges = np.concatenate((edges, 
+            np.column_stack((np.repeat(SOURCE, len(dangling_starts)), 
+                             dangling_starts)),
+            np.column_stack((dangling_ends, 
+                             np.repeat(SINK, len(dangling_ends))))))
+        K = ArrayGraph(num_nodes, edges)
+        K.add_node_attr(NODE_SCORE, np.array(self.scores, dtype=np.float64))
+        K.add_node_attr(SMOOTH_FWD, np.array(self.smooth_fwd, dtype=np.float64))
+        K.add_node_attr(SMOOTH_REV, np.array(self.smooth_rev, dtype=np.float64))
+        K.add_node_attr(SMOOTH_TMP, np.zeros(num_nodes, dtype=np.float64))
+        K.graph['source'] = SOURCE
+        K.graph['sink'] = SINK
+        return K
+
+class SubpathIndex(object):
+    '''
+    stores the positions of each node within a collection of paths (such
+    as k-mers) in order to find the paths that contain a subpath of any
+    length. paths are added as (path_id, path) tuples
+    '''
+    def __init__(self, items):
+        self.paths = {}
+        self.positions = collections.defaultdict(lambda: [])
+        for path_id, path in items:
+            self.paths[path_id] = path
+            for pos,n in enumerate(path):
+                self.positions[n].append((path_id, pos))
+
+    def find(self, subpath):
+        '''
+        returns the set of ids of the paths that contain 'subpath'. ids 
+        are added to the set in the order the paths were indexed
+        '''
+        # search the positions of the least frequent node of the subpath
+        # and compare the surrounding paths
+        candidates = None
+        offset = 0
+        for i,n in enumerate(subpath):
+            positions = self.positions.get(n)
+            if positions is None:
+                return set()
+            if (candidates is None) or (len(positions) < len(candidates)):
+                candidates = positions
+                offset = i
+        path_ids = set()
+        for path_id, pos in candidates:
+            start = pos - offset
+            if start < 0:
+                continue
+            if self.paths[path_id][start:start+len(subpath)] == subpath:
+                path_ids.add(path_id)
+        return path_ids
+
+def find_short_path_kmers(kmer_index, builder, path, score):
     """
     find kmers where 'path' is a subset and partition 'score'
     of path proportionally among all matching kmers
 
     generator function yields (kmer_id, score) tuples
     """
-    if path not in kmer_hash:
+    kmer_ids = kmer_index.find(path)
+    if len(kmer_ids) == 0:
         return
     matching_kmers = []
     total_score = 0.0
-    for kmer_id in kmer_hash[path]:
+    for kmer_id in kmer_ids:
         # compute total score at matching kmers
-        kmer_score = K.node[kmer_id][NODE_SCORE]      
+        kmer_score = builder.scores[kmer_id]
         total_score += kmer_score
         matching_kmers.append((kmer_id, kmer_score))
     # now calculate fractional densities for matching kmers
@@ -97,28 +167,6 @@ def find_short_path_kmers(kmer_hash, K, path, score):
         new_score = score * (kmer_score / float(total_score))
         yield ([kmer_id], new_score)
 
-def connect_dangling_ends(K):
-    """
-    fragmented transcripts can manifest as 0-degree dangling ends
-    of the overlap graph. this function connects these ends to the 
-    'source' and/or 'sink' nodes
-    """
-    source = K.graph['source']
-    sink = K.graph['sink']
-    # connect all nodes with degree zero to the source/sink nodes
-    # to account for fragmentation in the kmer graph when k > 2
-    edges_to_add = []
-    for n in K.nodes_iter():
-        if (n == source) or (n == sink):
-            continue
-        if K.in_degree(n) == 0:
-            edges_to_add.append((source, n))
-        if K.out_degree(n) == 0:
-            edges_to_add.append((n, sink))
-    # connect kmers
-    for u,v in edges_to_add:
-        K.add_edge(u,v)
-
 def create_kmer_graph(G, partial_paths, k):
     """
     create kmer graph from partial paths
@@ -129,11 +177,7 @@ def create_kmer_graph(G, partial_paths, k):
         for i in xrange(0, len(path) - (k-1)):
             yield path[i:i+k]
     # initialize k-mer graph
-    K = nx.DiGraph()
-    K.graph['source'] = SOURCE
-    K.graph['sink'] = SINK    
-    K.add_node(SOURCE, attr_dict=init_node_attrs())
-    K.add_node(SINK, attr_dict=init_node_attrs())               
+    builder = KmerGraphBuilder()
     # find all beginning/end nodes in linear graph
     start_nodes, end_nodes = get_start_end_nodes(G)
     # convert paths to k-mers and create a k-mer to 
@@ -141,7 +185,6 @@ def create_kmer_graph(G, partial_paths, k):
     kmer_id_map = {}
     id_kmer_map = {}
     kmer_paths = []
-    current_id = 0
     short_partial_path_dict = collections.defaultdict(lambda: [])
     for path, score in partial_paths:
         # check for start and end nodes
@@ -165,41 +208,119 @@ def create_kmer_graph(G, partial_paths, k):
         # convert to path of kmers
         for kmer in kmers:
             if kmer not in kmer_id_map:
-                kmer_id = current_id
-                kmer_id_map[kmer] = current_id
-                id_kmer_map[current_id] = kmer
-                current_id += 1
+                kmer_id = builder.add_node()
+                kmer_id_map[kmer] = kmer_id
+                id_kmer_map[kmer_id] = kmer
             else:
                 kmer_id = kmer_id_map[kmer]
             kmerpath.append(kmer_id)
         if is_end:
             kmerpath.append(SINK)
         kmer_paths.append((kmerpath, score))
-    # store mapping from kmer_id to subpath tuple
-    K.graph['id_kmer_map'] = id_kmer_map
     for path, score in kmer_paths:
-        add_path(K, path, score)
+        builder.add_path(path, score)
     # try to add short paths to graph if they are exact subpaths of 
     # existing kmers
     kmer_paths = []
     lost_paths = []
+    kmer_index = SubpathIndex(sorted(id_kmer_map.iteritems()))
     for ksmall, short_partial_paths in short_partial_path_dict.iteritems():
-        kmer_hash = hash_kmers(id_kmer_map, k, ksmall)
         for path, score in short_partial_paths:
-            matching_paths = list(find_short_path_kmers(kmer_hash, K, path, score))
+            matching_paths = list(find_short_path_kmers(kmer_index, builder, path, score))
             if len(matching_paths) == 0:
                 lost_paths.append((path,score))
             kmer_paths.extend(matching_paths)
     # add new paths
     for path, score in kmer_paths:
-        add_path(K, path, score)
-    # connect all kmer nodes with degree zero to the source/sink node
-    # to account for fragmentation in the kmer graph when k > 2
-    connect_dangling_ends(K)
+        builder.add_path(path, score)
+    # create graph and connect all kmer nodes with degree zero to the 
+    # source/sink node
+    K = builder.create_graph()
+    # store mapping from kmer_id to subpath tuple
+    K.graph['id_kmer_map'] = id_kmer_map
     # cleanup
     del kmer_id_map
     return K, lost_paths
 
+def get_short_path_thresholds(G, partial_paths):
+    """
+    fragmented (not full length) paths shorter than 'k' are added to the 
+    k-mer graph only when they are subpaths of a k-mer, which occurs when
+    they are contained within a full length path or within a path of 
+    length >= k. 
+
+    returns a list with the largest 'k' for which each partial path can 
+    be added to the k-mer graph, or None if the path is never lost
+    """
+    start_nodes, end_nodes = get_start_end_nodes(G)
+    paths = [path for path,score in partial_paths]
+    full_length = [(path[0] in start_nodes) and (path[-1] in end_nodes)
+                   for path in paths]
+    path_index = SubpathIndex(enumerate(paths))
+    thresholds = []
+    for i,path in enumerate(paths):
+        if full_length[i]:
+            thresholds.append(None)
+            continue
+        threshold = len(path)
+        for j in path_index.find(path):
+            if j == i:
+                continue
+            if full_length[j]:
+                threshold = None
+                break
+            threshold = max(threshold, len(paths[j]))
+        thresholds.append(threshold)
+    return thresholds
+
+def kmer_graph_statistics(G, partial_paths, kmin, kmax):
+    """
+    computes the number of nodes and the lost partial paths of the k-mer
+    graph for each 'k' between 'kmin' and 'kmax' without creating the 
+    k-mer graphs. the distinct k-mers are numbered incrementally by 
+    extending the (k-1)-mers by one node.
+
+    generator function yields (k, num_nodes, lost_paths) tuples where 
+    'num_nodes' and 'lost_paths' are equal to the results of 
+    'create_kmer_graph'
+    """
+    start_nodes, end_nodes = get_start_end_nodes(G)
+    paths = [path for path,score in partial_paths]
+    full_length = [(path[0] in start_nodes) and (path[-1] in end_nodes)
+                   for path in paths]
+    thresholds = get_short_path_thresholds(G, partial_paths)
+    # ids of the k-mers along each path (for k=1 the nodes themselves)
+    kmer_ids = [list(path) for path in paths]
+    num_kmers = len(set(n for path in paths for n in path))
+    for k in xrange(1, kmax+1):
+        if k > 1:
+            kmer_id_map = {}
+            for i,path in enumerate(paths):
+                ids = kmer_ids[i]
+                kmer_ids[i] = [kmer_id_map.setdefault((ids[j], path[j+k-1]),
+                                                      len(kmer_id_map))
+                               for j in xrange(len(path) - (k-1))]
+            num_kmers = len(kmer_id_map)
+        if k < kmin:
+            continue
+        # short full length paths are added to the graph as k-mers
+        num_short_full_length = sum(1 for i,path in enumerate(paths)
+                                    if full_length[i] and len(path) < k)
+        # group the short fragmented paths by length in the same order as
+        # 'create_kmer_graph'
+        short_partial_path_dict = collections.defaultdict(lambda: [])
+        for i,path in enumerate(paths):
+            if (len(path) < k) and (not full_length[i]):
+                short_partial_path_dict[len(path)].append(i)
+        lost_paths = []
+        for ksmall, indexes in short_partial_path_dict.iteritems():
+            for i in indexes:
+                if (thresholds[i] is not None) and (thresholds[i] < k):
+                    lost_paths.append(partial_paths[i])
+        # add 'source' and 'sink' nodes
+        num_nodes = num_kmers + num_short_full_length + 2
+        yield k, num_nodes, lost_paths
+
 def optimize_k(G, partial_paths, kmin, kmax, sensitivity_threshold):
     """
     determine optimal choice for parameter 'k' for assembly
@@ -207,62 +328,57 @@ def optimize_k(G, partial_paths, kmin, kmax, sensitivity_threshold):
     """
     total_score = sum(score for path,score in partial_paths)
     best_k = None
-    best_graph = None
-    for k in xrange(kmin, kmax+1):
-        # create k-mer graph and add partial paths
-        K, lost_paths = \
-            create_kmer_graph(G, partial_paths, k)
+    best_num_nodes = None
+    for k, num_nodes, lost_paths in \
+        kmer_graph_statistics(G, partial_paths, kmin, kmax):
         lost_path_score = sum(score for path,score in lost_paths)
         path_sensitivity = float(len(lost_paths)) / len(partial_paths)
         score_sensitivity = (total_score - lost_path_score) / total_score
         logging.debug("\t\toptimize k=%d n=%d e=%d p=%d kmers=%d "
                       "lost_paths=%d(%.1f%%) score=%.3f/%.3f(%.1f%%) "
                       "sens=%.3f" %
-                      (k, len(G), G.number_of_edges(), len(partial_paths), len(K),
-                       len(lost_paths), 100*path_sensitivity,
+                      (k, len(G), G.number_of_edges(), len(partial_paths), 
+                       num_nodes, len(lost_paths), 100*path_sensitivity,
                        lost_path_score, total_score, 
                        100.0*lost_path_score/total_score,
                        score_sensitivity))
         if score_sensitivity < sensitivity_threshold:
             break
-        if (best_k is None) or (len(K) >= len(best_graph)):
+        if (best_k is None) or (num_nodes >= best_num_nodes):
             best_k = k
-            best_graph = K
-    return best_graph, best_k
+            best_num_nodes = num_nodes
+    if best_k is None:
+        return None, None
+    # create k-mer graph for the chosen k
+    K, lost_paths = create_kmer_graph(G, partial_paths, best_k)
+    return K, best_k
 
 def expand_path_chains(G, strand, path):
     # reverse negative stranded data so that all paths go from 
     # small -> large genomic coords
     if strand == NEG_STRAND:
         path.reverse()
-    # get chains (children nodes) along path
-    newpath = []
+    # get exons of chains along path
+    exons = []
     for n in path:
-        nd = G.node[n]
-        if CHAIN_NODES in nd:
-            newpath.extend(nd[CHAIN_NODES])
-        else:
-            newpath.append(n)
-    path = newpath
-    # collapse contiguous nodes along path
+        exons.extend(G.chain_exons[n])
+    # collapse contiguous exons along path
     newpath = []
-    chain = [path[0]]
-    for v in path[1:]:
-        if chain[-1].end != v.start:
-            # update path with merge chain node
-            newpath.append(Exon(chain[0].start, 
-                                chain[-1].end))
-            # reset chain
-            chain = []
-        chain.append(v)
-    # add last chain
-    newpath.append(Exon(chain[0].start, chain[-1].end))
+    start, end = exons[0]
+    for e in exons[1:]:
+        if end != e[0]:
+            newpath.append(Exon(start, end))
+            start = e[0]
+        end = e[1]
+    # add last exon
+    newpath.append(Exon(start, end))
     return newpath
 
 def assemble_transcript_graph(G, strand, partial_paths, 
                               user_kmax, ksensitivity,
                               fraction_major_path, 
-                              max_paths):
+                              max_paths,
+                              report_ksearch_time=False):
     """
     enumerates individual transcript isoforms from transcript graph using
     a greedy algorithm
@@ -271,6 +387,7 @@ def assemble_transcript_graph(G, strand, partial_paths,
     fraction_major_path: only return isoforms with score greater than 
     some fraction of the highest score path
     max_paths: do not enumerate more than max_paths isoforms     
+    report_ksearch_time: log the time taken to optimize 'k'
     """
     # constrain sensitivity parameter
     ksensitivity = min(max(0.0, ksensitivity), 1.0)
@@ -288,7 +405,12 @@ def assemble_transcript_graph(G, strand, partial_paths,
     else:
         kmin = kmax
     logging.debug("\tConstructing k-mer graph")
+    tstart = time.time()
     K, k = optimize_k(G, partial_paths, kmin, kmax, ksensitivity)
+    if report_ksearch_time:
+        logging.info("\tk search: paths=%d kmin=%d kmax=%d k=%d "
+                     "time=%.6fs" % (len(partial_paths), kmin, kmax, k, 
+                                     time.time() - tstart))
     # smooth kmer graph
     smooth_graph(K)
     # find up to 'max_paths' paths through graph
@@ -29,12 +29,15 @@ STRAND_SCORE = 'strand_score'
 # assembler graph attributes
 NODE_SCORE = 'score'
 NODE_LENGTH = 'length'
-SMOOTH_FWD = 'smfwd'
-SMOOTH_REV = 'smrev'
-SMOOTH_TMP = 'smtmp'
+NODE_START = 'start'
+NODE_END = 'end'
+SMOOTH_FWD = 'smooth_fwd'
+SMOOTH_REV = 'smooth_rev'
+SMOOTH_TMP = 'smooth_tmp'
 CHAIN_NODES = 'chain'
 CHAIN_DATA = 'chain_data'
 CHAIN_EDGES = 'chain_edges'
+CHAIN_EXONS = 'chain_exons'
 
 class PathInfo(object):
     """object to store path finder results"""
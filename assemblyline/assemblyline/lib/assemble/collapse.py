@@ -20,141 +20,91 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
-import operator
-import networkx as nx
+import numpy as np
 
-from base import Exon, TRANSCRIPT_IDS, NODE_SCORE, NODE_LENGTH, \
-    CHAIN_NODES, CHAIN_EDGES, CHAIN_DATA
-
-def can_collapse(G,u,v):
-    # see if edge nodes have degree larger than '1'
-    if ((G.out_degree(u) > 1) or (G.in_degree(v) > 1)):
-        return False
-    return True
-
-def can_collapse_contiguous(G,u,v):
-    '''
-    same as can_collapse but does not allow introns to be collapsed
-    '''
-    # see if edge nodes have degree larger than '1'
-    if ((G.out_degree(u) > 1) or (G.in_degree(v) > 1)):
-        return False
-    # collapse non-intron edges    
-    if (u.end == v.start) or (v.end == u.start):
-        return True
-    return False
+from base import NODE_SCORE, NODE_LENGTH, NODE_START, NODE_END, CHAIN_EXONS
+from array_graph import ArrayGraph, connected_components
 
 def get_chains(G, introns=True):
     """
-    group nodes into chains
+    group nodes into chains. an edge (u,v) joins two nodes into the same
+    chain when 'u' has a single successor and 'v' has a single 
+    predecessor. when 'introns' is False only edges between contiguous
+    nodes are collapsed
     
-    returns a dict mapping node -> chain, as well as a 
-    dict mapping chains to nodes
+    returns an array mapping node -> chain, as well as a list with the 
+    nodes of each chain sorted by genome position. chains are numbered in
+    order of their first node
     """
-    if introns:
-        can_collapse_func = can_collapse
-    else:
-        can_collapse_func = can_collapse_contiguous
-    imin2 = lambda x,y: x if x<=y else y 
-    imax2 = lambda x,y: x if x>=y else y 
-    node_chain_map = {}
-    chains = {}
-    # initialize each node to be in a "chain" by itself
-    for n in G.nodes_iter():
-        node_chain_map[n] = n
-        chains[n] = set((n,))
-    for u,v in G.edges_iter():
-        if not can_collapse_func(G,u,v):
-            continue
-        # get chains containing these nodes
-        u_new = node_chain_map[u]
-        u_chain = chains[u_new]
-        del chains[u_new]
-        v_new = node_chain_map[v]
-        v_chain = chains[v_new]
-        del chains[v_new]
-        # merge chains        
-        merged_chain = u_chain.union(v_chain)
-        merged_node = Exon(imin2(u_new.start, v_new.start),
-                           imax2(u_new.end, v_new.end))
-        # point all nodes in chain to new parent
-        for n in merged_chain:
-            node_chain_map[n] = merged_node
-        chains[merged_node] = merged_chain
-    # sort chain nodes by genome position and store as list
-    for parent in chains:
-        chains[parent] = sorted(chains[parent], key=operator.attrgetter('start'))
+    u, v = G.edges()
+    out_degree = G.out_degree()
+    in_degree = G.in_degree()
+    mask = (out_degree[u] == 1) & (in_degree[v] == 1)
+    if not introns:
+        # do not collapse introns
+        starts = G.start
+        ends = G.end
+        mask &= (ends[u] == starts[v]) | (ends[v] == starts[u])
+    chains = connected_components(len(G), u[mask], v[mask])
+    node_chain_map = np.empty(len(G), dtype=np.int64)
+    for i,nodes in enumerate(chains):
+        node_chain_map[nodes] = i
     return node_chain_map, chains
 
-def add_chains(G, chains, node_chain_map):
-    H = nx.DiGraph()
-    # add chain nodes
-    for parent, nodes in chains.iteritems():
-        # if nodes have already been collapsed they
-        # might have chain attributes and these must
-        # be preserved
-        new_nodes = []
-        chain_data = {}
-        for n in nodes:
-            d = G.node[n]
-            if CHAIN_NODES in d:
-                new_nodes.extend(d[CHAIN_NODES])
-            if CHAIN_DATA in d:
-                chain_data.update(d[CHAIN_DATA])
-        new_nodes.extend(nodes)
-        # sort nodes by genome position and find the min/max
-        sorted_nodes = sorted(new_nodes, key=operator.attrgetter('start'))
-        # add node attributes
-        chain_data.update(dict((n, G.node[n]) for n in nodes))
-        attr_dict = {CHAIN_NODES: sorted_nodes,
-                     CHAIN_DATA: chain_data,
-                     CHAIN_EDGES: []} 
-        H.add_node(parent, attr_dict=attr_dict)
-    # add chain edges
-    for u,v,d in G.edges_iter(data=True):
-        u_chain_node = node_chain_map[u]
-        v_chain_node = node_chain_map[v]
-        if u_chain_node != v_chain_node:
-            H.add_edge(u_chain_node, v_chain_node, attr_dict=d)
-        else:
-            # add internal chain edge attribute data
-            # as 'chain_edges' attribute of parent node
-            H.node[u_chain_node][CHAIN_EDGES].append((u,v,d))
-    return H
-
-def recalc_strand_specific_graph_attributes(G):
+def get_chain_exons(starts, ends):
     """
-    computes score, length, and transcript ids after graph
-    is divided into strand-specific subgraphs and collapsed
+    merge contiguous nodes of a chain into exons
     """
-    for n,d in G.nodes_iter(data=True):
-        chain_nodes = d[CHAIN_NODES]
-        chain_data = d[CHAIN_DATA]
-        total_length = 0
-        max_score = 0.0
-        for cn in chain_nodes:
-            total_length += (cn.end - cn.start)
-            score = chain_data[cn][NODE_SCORE]
-            if score > max_score:
-                max_score = score
-        # set attributes
-        d[NODE_LENGTH] = total_length       
-        d[NODE_SCORE] = max_score
+    exons = []
+    exon_start, exon_end = starts[0], ends[0]
+    for start, end in zip(starts[1:], ends[1:]):
+        if start != exon_end:
+            exons.append((exon_start, exon_end))
+            exon_start = start
+        exon_end = end
+    exons.append((exon_start, exon_end))
+    return tuple(exons)
 
 def collapse_strand_specific_graph(G, introns=True):
     """
     find groups of nodes that have a single path through them
     and merges them into chains
     
-    NOTE: assumes a strand-specific graph.
+    NOTE: assumes a strand-specific graph with nodes numbered in 
+    genomic order
   
-    returns new DiGraph object.  each node has a 'chain' attribute 
-    containing the child nodes making up the chain.  nodes also 
-    have 'chain_data' and 'chain_edges' attributes with node 
-    attribute data and edge data of child nodes  
+    returns new ArrayGraph object and an array mapping the nodes of G to
+    chain nodes. each chain node has 'start', 'end', 'length' and 'score' 
+    attributes computed from the child nodes, and a 'chain_exons' 
+    attribute containing the (start, end) exons formed by the child nodes
     """
-    # TODO: may not need transcript map here
     node_chain_map, chains = get_chains(G, introns)
-    H = add_chains(G, chains, node_chain_map)
-    recalc_strand_specific_graph_attributes(H)
+    # add chain edges
+    u, v = G.edges()
+    u = node_chain_map[u]
+    v = node_chain_map[v]
+    keep = (u != v)
+    H = ArrayGraph(len(chains), np.column_stack((u[keep], v[keep])))
+    # compute chain attributes
+    starts = G.start.tolist()
+    ends = G.end.tolist()
+    scores = G.score.tolist()
+    chain_starts = []
+    chain_ends = []
+    chain_lengths = []
+    chain_scores = []
+    chain_exons = []
+    for nodes in chains:
+        node_starts = [starts[n] for n in nodes]
+        node_ends = [ends[n] for n in nodes]
+        chain_starts.append(node_starts[0])
+        chain_ends.append(node_ends[-1])
+        chain_lengths.append(sum(node_ends) - sum(node_starts))
+        chain_scores.append(max(0.0, max(scores[n] for n in nodes)))
+        chain_exons.append(get_chain_exons(node_starts, node_ends))
+    H.add_node_attr(NODE_START, np.array(chain_starts, dtype=np.int64))
+    H.add_node_attr(NODE_END, np.array(chain_ends, dtype=np.int64))
+    H.add_node_attr(NODE_LENGTH, np.array(chain_lengths, dtype=np.int64))
+    H.add_node_attr(NODE_SCORE, np.array(chain_scores, dtype=np.float64))
+    H.add_node_attr(CHAIN_EXONS, chain_exons)
     return H, node_chain_map
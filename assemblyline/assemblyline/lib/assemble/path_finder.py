@@ -22,109 +22,111 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
 import logging
 import collections
-import networkx as nx
-
-from base import NODE_SCORE
+import heapq
 
 # constant minimum path score
 MIN_SCORE = 1.0e-10
 
-# for dynamic programming algorithm
-TMP_NODE_SCORE = 'tmpns'
-PATH_MIN_SCORE = 'pmin'
-PATH_PREV = 'pprev'
-
 imax2 = lambda x,y: x if x>=y else y
 imin2 = lambda x,y: x if x<=y else y
 
-def init_tmp_attributes(G):
-    '''
-    set node attributes that are added to the graph temporarily
-    '''
-    # copy the node weights to a temporary variable so that we can
-    # manipulation them in the algorithm and create path attributes
-    # for dynamic programming
-    for n,d in G.nodes_iter(data=True):
-        d[TMP_NODE_SCORE] = d[NODE_SCORE]
-        d[PATH_MIN_SCORE] = MIN_SCORE
-        d[PATH_PREV] = None
-
-def clear_tmp_attributes(G):
-    '''
-    remove node attributes that are added to the graph temporarily
-    '''
-    for n,d in G.nodes_iter(data=True):
-        del d[TMP_NODE_SCORE]
-        del d[PATH_MIN_SCORE]
-        del d[PATH_PREV]
-
-def reset_path_attributes(G):
-    """
-    must call this before calling the dynamic programming algorithm
-    """
-    # reset path attributes
-    for n,d in G.nodes_iter(data=True):
-        d[PATH_MIN_SCORE] = MIN_SCORE
-        d[PATH_PREV] = None
-
-def dynprog_search(G, source):
+class PathFinder(object):
     """
     Find the highest scoring path by dynamic programming    
     # Adapted from NetworkX source code http://networkx.lanl.gov    
+
+    the score of a path is the minimum node score along the path. the
+    graph structure does not change so the topological order and the
+    predecessors of each node (sorted by topological order) are computed
+    once, and the dynamic programming state is kept in flat lists. when
+    node scores change only the nodes downstream of the changed nodes
+    whose path score is affected are recomputed
     """
-    # setup initial path attributes
-    reset_path_attributes(G)
-    G.node[source][PATH_MIN_SCORE] = G.node[source][TMP_NODE_SCORE] 
-    # topological sort allows each node to be visited exactly once
-    queue = collections.deque(nx.topological_sort(G))
-    while queue:
-        u = queue.popleft()
-        path_min_score = G.node[u][PATH_MIN_SCORE]
-        for v in G.successors_iter(u):
-            v_attrs = G.node[v]
-            v_score = v_attrs[TMP_NODE_SCORE]
+    def __init__(self, G, source):
+        self.succ = G.successor_lists()
+        order = G.topological_sort(self.succ)
+        rank = [0] * len(G)
+        for i,n in enumerate(order):
+            rank[n] = i
+        self.order = order
+        self.rank = rank
+        self.pred = [sorted(preds, key=rank.__getitem__) 
+                     for preds in G.predecessor_lists()]
+        self.source = source
+        # copy the node scores so that they can be manipulated 
+        self.node_scores = G.score.tolist()
+        self.path_min_scores = [MIN_SCORE] * len(G)
+        self.path_prev = [None] * len(G)
+        for n in order:
+            self._update_node(n)
+
+    def _update_node(self, v):
+        """
+        recompute the best path to node 'v' from its predecessors and 
+        return True if the path score of 'v' changed. the path is taken
+        through the earliest predecessor in topological order that 
+        achieves the best score
+        """
+        v_score = self.node_scores[v]
+        path_min_scores = self.path_min_scores
+        best_score = MIN_SCORE
+        best_prev = None
+        if v == self.source:
+            best_score = v_score
+        for u in self.pred[v]:
             # compute minimum score that would occur if path
-            # traversed through node 'v'
-            new_min_score = imin2(path_min_score, v_score)
+            # traversed through node 'u'
+            new_min_score = imin2(path_min_scores[u], v_score)
             # update if score is larger
-            if ((v_attrs[PATH_PREV] is None) or
-                (new_min_score > v_attrs[PATH_MIN_SCORE])):
-                v_attrs[PATH_MIN_SCORE] = new_min_score
-                v_attrs[PATH_PREV] = u
-
-def traceback(G, sink):
-    """
-    compute path and its score
-    """
-    path = [sink]
-    score = G.node[sink][PATH_MIN_SCORE]
-    prev = G.node[sink][PATH_PREV]
-    while prev is not None:
-        path.append(prev)
-        prev = G.node[prev][PATH_PREV]
-    path.reverse()
-    return tuple(path), score
-                
-def find_path(G, source, sink):
-    """
-    G - graph
-    source, sink - start/end nodes
-    """    
-    # dynamic programming search for best path
-    dynprog_search(G, source)
-    # traceback to get path
-    path, score = traceback(G, sink)
-    return path, score
-
-def subtract_path(G, path, score):
-    """
-    subtract score from nodes along path 
-    """
-    for i in xrange(len(path)):
-        u = path[i]
-        d = G.node[u]
-        d[TMP_NODE_SCORE] = imax2(MIN_SCORE, 
-                                  d[TMP_NODE_SCORE] - score)
+            if (best_prev is None) or (new_min_score > best_score):
+                best_score = new_min_score
+                best_prev = u
+        self.path_prev[v] = best_prev
+        if best_score != path_min_scores[v]:
+            path_min_scores[v] = best_score
+            return True
+        return False
+
+    def _update(self, nodes):
+        """
+        recompute the path scores of 'nodes' and all nodes downstream
+        of them in topological order
+        """
+        rank = self.rank
+        queued = set(nodes)
+        heap = [(rank[n], n) for n in queued]
+        heapq.heapify(heap)
+        while heap:
+            r, u = heapq.heappop(heap)
+            queued.remove(u)
+            if not self._update_node(u):
+                continue
+            for v in self.succ[u]:
+                if v not in queued:
+                    queued.add(v)
+                    heapq.heappush(heap, (rank[v], v))
+
+    def traceback(self, sink):
+        """
+        compute path and its score
+        """
+        path = [sink]
+        score = self.path_min_scores[sink]
+        prev = self.path_prev[sink]
+        while prev is not None:
+            path.append(prev)
+            prev = self.path_prev[prev]
+        path.reverse()
+        return tuple(path), score
+
+    def subtract_path(self, path, score):
+        """
+        subtract score from nodes along path 
+        """
+        node_scores = self.node_scores
+        for u in path:
+            node_scores[u] = imax2(MIN_SCORE, node_scores[u] - score)
+        self._update(path)
 
 def find_suboptimal_paths(G, source, sink, fraction_major_path=1e-3, 
                           max_paths=1000):
@@ -137,22 +139,21 @@ def find_suboptimal_paths(G, source, sink, fraction_major_path=1e-3,
     returned.  algorithm may stop prematurely if 'max_paths' iterations
     have completed.
     """
-    # setup temporary graph attributes
-    init_tmp_attributes(G)
+    finder = PathFinder(G, source)
     # store paths in a dictionary in order to avoid redundant paths
     # that arise when the heuristic assumptions of the algorithm fail
     path_results = collections.OrderedDict()
     # find highest score path
-    path, score = find_path(G, source, sink)
+    path, score = finder.traceback(sink)
     path_results[path] = score
-    subtract_path(G, path, score)
+    finder.subtract_path(path, score)
     # iterate to find suboptimal paths
     iterations = 1
     highest_score = score
     lowest_score = max(MIN_SCORE, highest_score * fraction_major_path)
     while iterations < max_paths:
         # find path
-        path, score = find_path(G, source, sink)
+        path, score = finder.traceback(sink)
         if score <= lowest_score:
             break
         # store path
@@ -161,10 +162,8 @@ def find_suboptimal_paths(G, source, sink, fraction_major_path=1e-3,
         # TODO: remove assert
         assert highest_score >= score
         # subtract path score from graph and resort seed nodes
-        subtract_path(G, path, score)
+        finder.subtract_path(path, score)
         iterations +=1
     logging.debug("\t\tpath finding iterations=%d" % iterations)
-    # cleanup graph attributes
-    clear_tmp_attributes(G) 
     # return (path,score) tuples sorted from high -> low score
     return path_results.items()
@@ -20,42 +20,81 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
-import networkx as nx
+import numpy as np
 
-from base import NODE_SCORE, SMOOTH_FWD, SMOOTH_REV, SMOOTH_TMP
+# levels with fewer edges are processed one edge at a time
+SMOOTH_MIN_BATCH_EDGES = 32
 
-def smooth_iteration(G, score_attr, smooth_attr):
-    nodes = nx.topological_sort(G)
-    for u in nodes:
-        ud = G.node[u]
-        smooth_score = ud[smooth_attr]
-        succ = G.successors(u)
-        if len(succ) == 0:
+def smooth_edges(u, v, fracs, smooth_scores, smooth_tmp):
+    '''
+    propagate 'smooth_scores' along edges (u,v) one edge at a time. edges
+    must be sorted by the level of 'u'
+    '''
+    nodes = np.unique(np.concatenate((u, v)))
+    node_list = nodes.tolist()
+    scores = dict(zip(node_list, smooth_scores[nodes].tolist()))
+    tmp = dict.fromkeys(node_list, 0.0)
+    for x, y, frac in zip(u.tolist(), v.tolist(), fracs.tolist()):
+        adj_score = frac * scores[x]
+        scores[y] += adj_score
+        tmp[y] += adj_score
+    smooth_scores[nodes] = [scores[n] for n in node_list]
+    smooth_tmp[nodes] += [tmp[n] for n in node_list]
+
+def smooth_pass(levels, u, v, scores, smooth_scores, smooth_tmp):
+    '''
+    propagate 'smooth_scores' along edges (u,v) to the neighbors of each 
+    node in proportion to the neighbor scores. the smooth score of a node
+    is final once all nodes at lower levels have been processed, so the
+    edges leaving each level are processed together
+    '''
+    num_nodes = len(scores)
+    if len(u) == 0:
+        return
+    # fraction of the smooth score of 'u' propagated along each edge
+    total_nbr_scores = np.bincount(u, weights=scores[v], minlength=num_nodes)
+    degrees = np.bincount(u, minlength=num_nodes)
+    edge_totals = total_nbr_scores[u]
+    zero = (edge_totals == 0)
+    # if all neighbors have zero score apply smoothing evenly
+    fracs = np.where(zero, 1.0 / degrees[u], 
+                     scores[v] / np.where(zero, 1.0, edge_totals))
+    # group edges by level of 'u'
+    order = np.argsort(levels[u], kind='mergesort')
+    u = u[order]
+    v = v[order]
+    fracs = fracs[order]
+    bounds = np.flatnonzero(np.diff(levels[u])) + 1
+    starts = np.concatenate(([0], bounds)).tolist()
+    ends = np.concatenate((bounds, [len(u)])).tolist()
+    i = 0
+    while i < len(starts):
+        start = starts[i]
+        if ends[i] - start >= SMOOTH_MIN_BATCH_EDGES:
+            end = ends[i]
+            i += 1
+            level_v = v[start:end]
+            adj_scores = fracs[start:end] * smooth_scores[u[start:end]]
+            np.add.at(smooth_tmp, level_v, adj_scores)
+            np.add.at(smooth_scores, level_v, adj_scores)
             continue
-        total_nbr_score = sum(G.node[v][score_attr] for v in succ)
-        if total_nbr_score == 0:
-            # if all successors have zero score apply smoothing evenly
-            avg_score = smooth_score / len(succ)
-            for v in succ:
-                vd = G.node[v]
-                vd[SMOOTH_TMP] += avg_score
-                vd[smooth_attr] += avg_score
-        else:
-            # apply smoothing proportionately
-            for v in succ:
-                vd = G.node[v]
-                frac = vd[score_attr]/float(total_nbr_score)
-                adj_score = frac * smooth_score
-                vd[SMOOTH_TMP] += adj_score
-                vd[smooth_attr] += adj_score
-
-def smooth_graph(G, score_attr=NODE_SCORE):
+        # process consecutive small levels together
+        while (i < len(starts)) and (ends[i] - starts[i] < SMOOTH_MIN_BATCH_EDGES):
+            i += 1
+        end = ends[i-1]
+        smooth_edges(u[start:end], v[start:end], fracs[start:end], 
+                     smooth_scores, smooth_tmp)
+
+def smooth_graph(G):
+    '''
+    smooth the 'score' attribute of the nodes of G using the 'smooth_fwd'
+    and 'smooth_rev' attributes
+    '''
+    u, v = G.edges()
+    levels, reverse_levels = G.topological_levels()
     # smooth in forward direction
-    smooth_iteration(G, score_attr, SMOOTH_FWD)
+    smooth_pass(levels, u, v, G.score, G.smooth_fwd, G.smooth_tmp)
     # smooth in reverse direction
-    G.reverse(copy=False)
-    smooth_iteration(G, score_attr, SMOOTH_REV)
-    G.reverse(copy=False)
+    smooth_pass(reverse_levels, v, u, G.score, G.smooth_rev, G.smooth_tmp)
     # apply densities to nodes
-    for n,d in G.nodes_iter(data=True):
-        d[score_attr] += d[SMOOTH_TMP]
+    G.score += G.smooth_tmp
@@ -20,16 +20,16 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
-import networkx as nx
 import logging
 import collections
-import operator
 import bisect
+import numpy as np
 
 from assemblyline.lib.bx.cluster import ClusterTree
-from assemblyline.lib.transcript import Exon, POS_STRAND, NEG_STRAND, NO_STRAND
+from assemblyline.lib.transcript import POS_STRAND, NEG_STRAND, NO_STRAND
 from assemblyline.lib.base import GTFAttr, FLOAT_PRECISION
-from base import NODE_SCORE, NODE_LENGTH
+from base import NODE_SCORE, NODE_LENGTH, NODE_START, NODE_END
+from array_graph import ArrayGraph
 from trim import trim_graph
 from collapse import collapse_strand_specific_graph
 
@@ -204,34 +204,40 @@ def partition_transcripts_by_strand(transcripts):
     return strand_transcript_lists, strand_ref_transcripts
 
 def create_directed_graph(strand, transcripts):
-    '''build strand-specific graph'''
-    def add_node_directed(G, n, score):
-        """add node to graph"""
-        if n not in G: 
-            G.add_node(n, attr_dict={NODE_LENGTH: (n.end - n.start), 
-                                     NODE_SCORE: 0.0})
-        nd = G.node[n]
-        nd[NODE_SCORE] += score
-    # initialize transcript graph
-    G = nx.DiGraph()
+    '''
+    build strand-specific graph. nodes are the intervals between 
+    consecutive exon boundaries that are covered by transcripts and are
+    numbered in genomic order
+    '''
     # find the intron domains of the transcripts
     boundaries = find_exon_boundaries(transcripts)
+    boundary_index = dict((pos,i) for i,pos in enumerate(boundaries))
     # add transcripts
+    node_scores = collections.defaultdict(lambda: 0.0)
+    edges = set()
     for t in transcripts:
         # split exons that cross boundaries and get the
         # nodes that made up the transcript
-        # TODO: can generate 
-        nodes = [Exon(start,end) for start,end in split_exons(t, boundaries)]
+        nodes = [boundary_index[start] 
+                 for start,end in split_exons(t, boundaries)]
         if strand == NEG_STRAND:
             nodes.reverse()
         # add nodes/edges to graph
-        u = nodes[0]
-        add_node_directed(G, u, t.score)
-        for i in xrange(1, len(nodes)):
-            v = nodes[i]
-            add_node_directed(G, v, t.score)
-            G.add_edge(u,v)
-            u = v
+        for n in nodes:
+            node_scores[n] += t.score
+        edges.update(zip(nodes[:-1], nodes[1:]))
+    # renumber nodes in genomic order
+    node_boundaries = sorted(node_scores)
+    node_ids = dict((b,i) for i,b in enumerate(node_boundaries))
+    G = ArrayGraph(len(node_boundaries), 
+                   [(node_ids[u], node_ids[v]) for u,v in edges])
+    starts = np.array([boundaries[b] for b in node_boundaries], dtype=np.int64)
+    ends = np.array([boundaries[b+1] for b in node_boundaries], dtype=np.int64)
+    G.add_node_attr(NODE_START, starts)
+    G.add_node_attr(NODE_END, ends)
+    G.add_node_attr(NODE_LENGTH, ends - starts)
+    G.add_node_attr(NODE_SCORE, np.array([node_scores[b] for b in node_boundaries],
+                                         dtype=np.float64))
     # set graph attributes
     G.graph['boundaries'] = boundaries
     return G
@@ -251,14 +257,16 @@ def create_transcript_graphs(chrom, transcripts,
                              bedgraph_filehs=None):
 
     '''
-    generates (graph, strand, transcript_map) tuples with transcript 
-    graphs
+    returns a list of TranscriptGraph objects containing independent
+    strand-specific subgraphs and the partial paths of the transcripts
+    in each subgraph
     '''
     def get_bedgraph_lines(chrom, G):
-        for n in sorted(G.nodes()):
-            if n.start < 0:
+        for start, end, score in zip(G.start.tolist(), G.end.tolist(),
+                                     G.score.tolist()):
+            if start < 0:
                 continue
-            fields = (chrom, n.start, n.end, G.node[n][NODE_SCORE]) 
+            fields = (chrom, start, end, score) 
             yield fields
     # partition transcripts by strand and resolve unstranded transcripts
     logging.debug("\tResolving unstranded transcripts")
@@ -279,21 +287,31 @@ def create_transcript_graphs(chrom, transcripts,
                                 min_trim_length, 
                                 trim_utr_fraction, 
                                 trim_intron_fraction)
-        G.remove_nodes_from(trim_nodes)
+        keep_nodes = [n for n in xrange(len(G)) if n not in trim_nodes]
+        Gtrim = G.subgraph(keep_nodes)
+        # map nodes of the original graph to nodes of the trimmed graph
+        trim_node_map = np.empty(len(G), dtype=np.int64)
+        trim_node_map.fill(-1)
+        trim_node_map[keep_nodes] = np.arange(len(keep_nodes))
         # collapse consecutive nodes in graph
-        H, node_chain_map = collapse_strand_specific_graph(G, introns=True)
+        H, node_chain_map = collapse_strand_specific_graph(Gtrim, introns=True)
         # get connected components of graph which represent independent genes
         # unconnected components are considered different genes
-        Gsubs = nx.weakly_connected_component_subgraphs(H)
-        # add components as separate transcript graphs
         strand_graphs = []
-        node_subgraph_map = {}
-        for i,Gsub in enumerate(Gsubs):
-            for n in Gsub:
-                node_subgraph_map[n] = i
-            tg = TranscriptGraph(chrom, strand, Gsub)
-            tg.partial_paths = collections.defaultdict(lambda: 0.0)
+        node_subgraph_map = np.empty(len(H), dtype=np.int64)
+        node_index_map = np.empty(len(H), dtype=np.int64)
+        for i,nodes in enumerate(H.weakly_connected_components()):
+            node_subgraph_map[nodes] = i
+            node_index_map[nodes] = np.arange(len(nodes))
+            tg = TranscriptGraph(chrom, strand, H.subgraph(nodes))
+            tg.partial_paths = collections.OrderedDict()
             strand_graphs.append(tg)
+        # compose the maps from original graph nodes to subgraph nodes
+        node_ids = dict((start,i) for i,start in enumerate(G.start.tolist()))
+        node_chain_map = node_chain_map.tolist()
+        node_subgraph_map = node_subgraph_map.tolist()
+        node_index_map = node_index_map.tolist()
+        trim_node_map = trim_node_map.tolist()
         # populate transcript graphs with partial paths
         for t in transcript_list:
             # get original transcript nodes and subtract trimmed nodes
@@ -301,25 +319,23 @@ def create_transcript_graphs(chrom, transcripts,
             # TODO: intronic transcripts may be split into multiple pieces,
             # should we allow this?
             subgraph_node_map = collections.defaultdict(lambda: set())
-            for n in split_exons(t, G.graph['boundaries']):
-                n = Exon(*n)
-                if n in trim_nodes:
+            for start,end in split_exons(t, G.graph['boundaries']):
+                n = trim_node_map[node_ids[start]]
+                if n < 0:
                     continue
                 cn = node_chain_map[n]
                 subgraph_id = node_subgraph_map[cn]
-                subgraph_node_map[subgraph_id].add(cn)
-            # add transcript node/score pairs to subgraphs
+                subgraph_node_map[subgraph_id].add(node_index_map[cn])
+            # add transcript node/score pairs to subgraphs. subgraph 
+            # nodes are numbered in genomic order
             for subgraph_id, subgraph_nodes in subgraph_node_map.iteritems():
                 subgraph_nodes = sorted(subgraph_nodes, 
-                                        key=operator.attrgetter('start'), 
                                         reverse=(strand == NEG_STRAND))
                 tg = strand_graphs[subgraph_id]
-                tg.partial_paths[tuple(subgraph_nodes)] += t.score
+                path = tuple(subgraph_nodes)
+                tg.partial_paths[path] = tg.partial_paths.get(path, 0.0) + t.score
         transcript_graphs.extend(strand_graphs)
     # convert 
     for tg in transcript_graphs:
         tg.partial_paths = tg.partial_paths.items()
     return transcript_graphs
-
-
-
@@ -25,7 +25,6 @@ import logging
 from assemblyline.lib.bx.intersection import Interval, IntervalTree
 from assemblyline.lib.transcript import NEG_STRAND, strand_int_to_str
 
-from base import NODE_SCORE
 from collapse import get_chains
 
 def trim_intron(G, nodes, cutoff_score):
@@ -34,7 +33,7 @@ def trim_intron(G, nodes, cutoff_score):
     '''
     trim_nodes = set()
     for n in nodes:
-        score = G.node[n][NODE_SCORE]
+        score = G.score[n]
         if score < cutoff_score:
             trim_nodes.add(n)
     return trim_nodes
@@ -42,7 +41,7 @@ def trim_intron(G, nodes, cutoff_score):
 def trim_intronic_utr(G, nodes, cutoff_score):
     trim_nodes = set()
     for n in nodes:
-        if G.node[n][NODE_SCORE] >= cutoff_score:
+        if G.score[n] >= cutoff_score:
             break
         trim_nodes.add(n)
     return trim_nodes
@@ -52,7 +51,7 @@ def trim_bidirectional(G, nodes, min_trim_length, coverage_fraction):
     seed_index = None
     seed_score = None
     for i,n in enumerate(nodes):
-        score = G.node[n][NODE_SCORE]
+        score = G.score[n]
         if (seed_index is None) or (score > seed_score):
             seed_index = i
             seed_score = score
@@ -61,24 +60,24 @@ def trim_bidirectional(G, nodes, min_trim_length, coverage_fraction):
     # extend seed nodes until length greater than min_length
     seed_start = seed_index
     seed_end = seed_index
-    seed_length = (nodes[seed_index].end - nodes[seed_index].start)
+    seed_length = G.length[nodes[seed_index]]
     while ((seed_length < min_trim_length) and
            ((seed_start > 0) or (seed_end < len(nodes)-1))):
         if seed_start == 0:
             pred_score = 0.0
         else:
-            pred_score = G.node[nodes[seed_start-1]][NODE_SCORE]
+            pred_score = G.score[nodes[seed_start-1]]
         if seed_end == (len(nodes)-1):
             succ_score = 0.0
         else:
-            succ_score = G.node[nodes[seed_end+1]][NODE_SCORE]
+            succ_score = G.score[nodes[seed_end+1]]
         if (succ_score > pred_score):
             seed_end += 1
-            seed_length += nodes[seed_end].end - nodes[seed_end].start
+            seed_length += G.length[nodes[seed_end]]
             seed_score += succ_score
         else:
             seed_start -= 1
-            seed_length += nodes[seed_start].end - nodes[seed_start].start
+            seed_length += G.length[nodes[seed_start]]
             seed_score += pred_score
         #print "extend", seed_start, seed_end, seed_length
     # compute seed score and trimming score cutoff
@@ -88,15 +87,15 @@ def trim_bidirectional(G, nodes, min_trim_length, coverage_fraction):
     # trim left
     if seed_start > 0:
         for i in xrange(seed_start-1, -1, -1):
-            #print nodes[i], G.node[nodes[i]][NODE_SCORE], score_cutoff
-            if G.node[nodes[i]][NODE_SCORE] < score_cutoff:
+            #print nodes[i], G.score[nodes[i]], score_cutoff
+            if G.score[nodes[i]] < score_cutoff:
                 trim_nodes.extend(nodes[:i+1])
                 break
     # trim_right
     if (seed_end+1) < len(nodes):
         for i in xrange(seed_end+1, len(nodes)):
-            #print nodes[i], G.node[nodes[i]][NODE_SCORE], score_cutoff
-            if G.node[nodes[i]][NODE_SCORE] < score_cutoff:
+            #print nodes[i], G.score[nodes[i]], score_cutoff
+            if G.score[nodes[i]] < score_cutoff:
                 trim_nodes.extend(nodes[i:])
                 break
     #print "trim", trim_nodes
@@ -108,23 +107,23 @@ def trim_utr(G, nodes, min_trim_length, coverage_fraction):
     """
     # establish seed nodes at least 'min_trim_length' long
     seed_end = 1
-    seed_score = G.node[nodes[0]][NODE_SCORE]
-    seed_length = (nodes[0].end - nodes[0].start)
+    seed_score = G.score[nodes[0]]
+    seed_length = G.length[nodes[0]]
     while ((seed_length < min_trim_length) and
            (seed_end < len(nodes))):
-        seed_score += G.node[nodes[seed_end]][NODE_SCORE]
-        seed_length += (nodes[seed_end].end - nodes[seed_end].start)
+        seed_score += G.score[nodes[seed_end]]
+        seed_length += G.length[nodes[seed_end]]
         seed_end += 1
     seed_avg_score = seed_score / float(seed_end)
     # find point where trimmed nodes have low score relative to seed
-    trim_score = sum(G.node[nodes[j]][NODE_SCORE] for j in xrange(seed_end, len(nodes)))
+    trim_score = sum(G.score[nodes[j]] for j in xrange(seed_end, len(nodes)))
     i = seed_end
     while i < len(nodes):
         trim_avg_score = trim_score / float(len(nodes) - i)
         frac = trim_avg_score / seed_avg_score
         if frac < coverage_fraction:
             break
-        score = G.node[nodes[i]][NODE_SCORE]        
+        score = G.score[nodes[i]]
         trim_score -= score
         i += 1
     return nodes[i:]
@@ -133,53 +132,54 @@ def trim_graph(G, strand,
                min_trim_length, 
                trim_utr_fraction,
                trim_intron_fraction):
+    '''
+    returns the set of nodes of the strand-specific graph G that should
+    be trimmed
+    '''
     # get 'chains' of contiguous non-intron nodes with edge degree of 
     # one or less
     node_chain_map, chains = get_chains(G, introns=False)
-    # setup dictionaries of predecessors and successors
-    successor_dict = {}
-    for n,nbrdict in G.adjacency_iter():
-        successor_dict[n] = nbrdict.keys()
-    predecessor_dict = {}
-    G.reverse(copy=False)
-    for n,nbrdict in G.adjacency_iter():
-        predecessor_dict[n] = nbrdict.keys()
-    G.reverse(copy=False)
+    # setup node degrees
+    in_degrees = G.in_degree()
+    out_degrees = G.out_degree()
+    # score of each chain is the maximum score of its nodes
+    chain_scores = [max(G.score[n] for n in nodes) for nodes in chains]
     # setup intron data structures
     introns = {}
     intron_tree = IntervalTree()
     reverse = (strand == NEG_STRAND)
-    for u,nbrdict in G.adjacency_iter():
-        for v in nbrdict:
-            if reverse:
-                left, right = v, u
-            else:
-                left, right = u, v
-            # skip contiguous nodes
-            if left.end == right.start:
-                continue
-            # calculate score of the chains
-            u_chain_nodes = chains[node_chain_map[u]]
-            u_score = max(G.node[n][NODE_SCORE] for n in u_chain_nodes)
-            v_chain_nodes = chains[node_chain_map[v]]
-            v_score = max(G.node[n][NODE_SCORE] for n in v_chain_nodes)
-            # store scores in intron data structures
-            introns[(left.end,right.start)] = (u_score, v_score)
-            intron_tree.insert_interval(Interval(left.end, right.start, 
-                                                 value=(u_score,v_score)))
+    starts = G.start
+    ends = G.end
+    for u,v in zip(*G.edges()):
+        if reverse:
+            left, right = v, u
+        else:
+            left, right = u, v
+        # skip contiguous nodes
+        if ends[left] == starts[right]:
+            continue
+        # calculate score of the chains
+        u_score = chain_scores[node_chain_map[u]]
+        v_score = chain_scores[node_chain_map[v]]
+        # store scores in intron data structures
+        intron = (int(ends[left]), int(starts[right]))
+        introns[intron] = (u_score, v_score)
+        intron_tree.insert_interval(Interval(intron[0], intron[1],
+                                             value=(u_score,v_score)))
     # trim chains
     all_trim_nodes = set()
-    for parent, nodes in chains.iteritems():
+    for nodes in chains:
+        parent = (int(starts[nodes[0]]), int(ends[nodes[-1]]))
         if strand == NEG_STRAND:
-            nodes.reverse()
-        in_degree = len(predecessor_dict[nodes[0]])
-        out_degree = len(successor_dict[nodes[-1]])
+            nodes = nodes[::-1]
+        in_degree = in_degrees[nodes[0]]
+        out_degree = out_degrees[nodes[-1]]
         trim_nodes = set()
         if ((in_degree == 1) and (out_degree == 1) and
-            (parent.start, parent.end) in introns): 
+            parent in introns): 
             # intron retention - a chain of nodes precisely matches an 
             # intron, so we can potentially remove the entire chain
-            pred_score, succ_score = introns[(parent.start, parent.end)]
+            pred_score, succ_score = introns[parent]
             cutoff_score = trim_intron_fraction * max(pred_score, succ_score)
             trim_nodes.update(trim_intron(G, nodes, cutoff_score))
         else:
@@ -188,9 +188,9 @@ def trim_graph(G, strand,
             found_intron = False
             max_pred_score = 0.0
             max_succ_score = 0.0
-            for hit in intron_tree.find(parent.start, parent.end):
+            for hit in intron_tree.find(parent[0], parent[1]):
                 # ignore contained introns
-                if (hit.start > parent.start) and (hit.end < parent.end):
+                if (hit.start > parent[0]) and (hit.end < parent[1]):
                     continue
                 # set intron flag and keep track of highest coverage 
                 # overlapping intron to make trimming conservative
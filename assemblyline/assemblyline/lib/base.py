@@ -51,6 +51,11 @@ class GTFAttr:
     RESOLVED_STRAND = 'resolvedstrand'
     LOG10LR = 'log10lr'
 
+# attributes of aggregated GTF files that are parsed as numbers
+GTF_ATTR_DEFS = {GTFAttr.REF: int,
+                 GTFAttr.SCORE: float,
+                 GTFAttr.PCTRANK: float}
+
 class Category(object):
     # constant transcript category values
     SAME_STRAND = 0    
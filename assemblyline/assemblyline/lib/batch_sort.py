@@ -2,6 +2,14 @@
 Created on Jul 21, 2011
 
 @author: mkiyer
+
+External merge sort of text files. Lines are read into chunks that fit
+within a memory budget, each chunk is sorted (in parallel when more than
+one processor is given) and spilled to a compressed temporary file, and
+the sorted spill files are merged with a heap. Lines are compared with
+their trailing newline removed so that when 'key' is None the order is
+the same as 'LC_ALL=C sort'. Lines whose keys are equal are ordered by
+the line itself.
 '''
 
 # based on Recipe 466302: Sorting big files the Python 2.4 way
@@ -9,13 +17,30 @@ Created on Jul 21, 2011
 #http://code.activestate.com/recipes/576755-sorting-big-files-the-python-26-way/
 
 import os
+import struct
+import zlib
+import marshal
+import tempfile
+import multiprocessing
 from tempfile import gettempdir
-from itertools import islice, cycle
+from itertools import cycle, chain
 from collections import namedtuple
 import heapq
 
 Keyed = namedtuple("Keyed", ["key", "obj"])
 
+# approximate memory used by each line in addition to its characters
+# (string, key and list overhead)
+SORT_LINE_OVERHEAD = 128
+# default memory budget of a sort in bytes
+DEFAULT_SORT_MEMORY = (1 << 28)
+# number of items compressed together in a spill file block
+SPILL_BLOCK_SIZE = 4096
+SPILL_BLOCK_HEADER = '<I'
+SPILL_BLOCK_HEADER_SIZE = struct.calcsize(SPILL_BLOCK_HEADER)
+# maximum number of spill files merged at once
+MAX_MERGE_FILES = 256
+
 def merge(key=None, *iterables):
     # based on code posted by Scott David Daniels in c.l.p.
     # http://groups.google.com/group/comp.lang.python/msg/484f01f1ea3c832d
@@ -28,32 +53,237 @@ def merge(key=None, *iterables):
     for element in heapq.merge(*keyed_iterables):
         yield element.obj
 
-def batch_sort(input, output, key=None, buffer_size=32000, tempdirs=None):
+def write_spill(items, filename, compresslevel=1):
+    '''
+    write sorted items to a spill file as blocks of marshalled and
+    compressed items. keys must be built from types that 'marshal'
+    supports (strings, numbers and tuples)
+    '''
+    fileh = open(filename, 'wb')
+    def write_block(block):
+        data = zlib.compress(marshal.dumps(block), compresslevel)
+        fileh.write(struct.pack(SPILL_BLOCK_HEADER, len(data)))
+        fileh.write(data)
+    block = []
+    for item in items:
+        block.append(item)
+        if len(block) >= SPILL_BLOCK_SIZE:
+            write_block(block)
+            block = []
+    if block:
+        write_block(block)
+    fileh.close()
+
+def iter_spill(filename):
+    '''
+    generator yielding the items of a spill file
+    '''
+    fileh = open(filename, 'rb')
+    while True:
+        header = fileh.read(SPILL_BLOCK_HEADER_SIZE)
+        if not header:
+            break
+        size, = struct.unpack(SPILL_BLOCK_HEADER, header)
+        for item in marshal.loads(zlib.decompress(fileh.read(size))):
+            yield item
+    fileh.close()
+
+def sort_chunk(lines, key=None):
+    '''
+    sort a list of lines (without newlines) in place when 'key' is None
+    or return a sorted list of (key, line) tuples. keys are computed once
+    per line
+    '''
+    if key is None:
+        lines.sort()
+        return lines
+    items = [(key(line), line) for line in lines]
+    items.sort()
+    return items
+
+def _sort_chunk_worker(args):
+    lines, key, filename, compresslevel = args
+    write_spill(sort_chunk(lines, key), filename, compresslevel)
+    return filename
+
+def _iter_lines(filenames, open_func):
+    for filename in filenames:
+        fileh = open_func(filename, 'rb')
+        for line in fileh:
+            if line.endswith('\n'):
+                line = line[:-1]
+            yield line
+        fileh.close()
+
+def _iter_chunks(line_iter, buffer_size, memory):
+    '''
+    generator yielding lists of lines that hold at most 'buffer_size'
+    lines or fit within 'memory' bytes
+    '''
+    chunk = []
+    chunk_size = 0
+    for line in line_iter:
+        chunk.append(line)
+        chunk_size += len(line) + SORT_LINE_OVERHEAD
+        if ((buffer_size is not None and len(chunk) >= buffer_size) or
+            (memory is not None and chunk_size >= memory)):
+            yield chunk
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield chunk
+
+def _write_items(items, keyed, fileh):
+    if keyed:
+        for item in items:
+            fileh.write(item[1])
+            fileh.write('\n')
+    else:
+        for line in items:
+            fileh.write(line)
+            fileh.write('\n')
+
+def _merge_spills(filenames, keyed, fileh):
+    iterables = [iter_spill(filename) for filename in filenames]
+    _write_items(heapq.merge(*iterables), keyed, fileh)
+
+def _iter_keyed_lines(filename, key, open_func):
+    for line in _iter_lines([filename], open_func):
+        yield (key(line), line)
+
+def batch_merge(input, output, key=None, tempdirs=None, compresslevel=1,
+                open_func=open):
+    '''
+    merge files whose lines are each sorted by 'key' into 'output' with a
+    streaming k-way merge. the order of the output is the same as that of
+    'batch_sort' on the same input. when there are more than 
+    MAX_MERGE_FILES input files they are merged in groups through spill
+    files in 'tempdirs'
+    '''
     if tempdirs is None:
         tempdirs = []
     if not tempdirs:
         tempdirs.append(gettempdir())
+    if isinstance(input, basestring):
+        input = [input]
+    keyed = (key is not None)
+    def iter_input(filename):
+        if not keyed:
+            return _iter_lines([filename], open_func)
+        return _iter_keyed_lines(filename, key, open_func)
+    tempdir_iter = cycle(tempdirs)
+    spills = []
+    try:
+        iterables = [iter_input(filename) for filename in input]
+        while len(iterables) > MAX_MERGE_FILES:
+            fd, filename = tempfile.mkstemp(suffix='.spill',
+                                            dir=next(tempdir_iter))
+            os.close(fd)
+            spills.append(filename)
+            write_spill(heapq.merge(*iterables[:MAX_MERGE_FILES]),
+                        filename, compresslevel)
+            iterables = iterables[MAX_MERGE_FILES:] + [iter_spill(filename)]
+        outfh = open_func(output, 'wb')
+        _write_items(heapq.merge(*iterables), keyed, outfh)
+        outfh.close()
+    finally:
+        for filename in spills:
+            if os.path.exists(filename):
+                os.remove(filename)
+    return 0
 
-    chunks = []
+def batch_sort(input, output, key=None, buffer_size=32000, tempdirs=None,
+               memory=None, num_processors=1, compresslevel=1,
+               open_func=open):
+    '''
+    sort the lines of 'input' (a filename or a list of filenames whose
+    lines are sorted together) and write them to 'output'.
+
+    key: function of a line (without its newline) returning the sort
+    key. with more than one processor the function must be defined at
+    module level so that it can be sent to worker processes
+    buffer_size: maximum number of lines sorted in memory at once
+    memory: approximate memory budget in bytes. when given, chunks are
+    sized by memory instead of by 'buffer_size'. with more than one
+    processor the budget is divided between the chunks being sorted
+    num_processors: number of processes sorting chunks
+    compresslevel: zlib compression level of the spill files
+    open_func: function called with (filename, mode) to open the input
+    and output files
+    '''
+    if tempdirs is None:
+        tempdirs = []
+    if not tempdirs:
+        tempdirs.append(gettempdir())
+    if isinstance(input, basestring):
+        input = [input]
+    num_processors = max(1, num_processors)
+    if memory is not None:
+        # the reading process holds one chunk and each sorting process
+        # holds another
+        buffer_size = None
+        if num_processors > 1:
+            memory = max(1, memory // (num_processors + 1))
+    keyed = (key is not None)
+    chunk_iter = _iter_chunks(_iter_lines(input, open_func), buffer_size,
+                              memory)
+    spills = []
+    pool = None
     try:
-        with open(input,'rb',64*1024) as input_file:
-            input_iterator = iter(input_file)
-            for tempdir in cycle(tempdirs):
-                current_chunk = list(islice(input_iterator,buffer_size))
-                if not current_chunk:
-                    break
-                current_chunk.sort(key=key)
-                output_chunk = open(os.path.join(tempdir,'%06i'%len(chunks)),'w+b',64*1024)
-                chunks.append(output_chunk)
-                output_chunk.writelines(current_chunk)
-                output_chunk.flush()
-                output_chunk.seek(0)
-        with open(output,'wb',64*1024) as output_file:
-            output_file.writelines(merge(key, *chunks))
+        # sort small inputs in memory without spilling
+        first_chunk = next(chunk_iter, [])
+        second_chunk = next(chunk_iter, None)
+        if second_chunk is None:
+            outfh = open_func(output, 'wb')
+            _write_items(sort_chunk(first_chunk, key), keyed, outfh)
+            outfh.close()
+            return 0
+        tempdir_iter = cycle(tempdirs)
+        def make_spill():
+            fd, filename = tempfile.mkstemp(suffix='.spill',
+                                            dir=next(tempdir_iter))
+            os.close(fd)
+            spills.append(filename)
+            return filename
+        chunks = chain([first_chunk, second_chunk], chunk_iter)
+        del first_chunk, second_chunk
+        tasks = ((chunk, key, make_spill(), compresslevel)
+                 for chunk in chunks)
+        if num_processors == 1:
+            for task in tasks:
+                _sort_chunk_worker(task)
+        else:
+            # limit the number of chunks in memory by waiting for the
+            # oldest chunk to be sorted before reading more input
+            pool = multiprocessing.Pool(processes=num_processors)
+            pending = []
+            for task in tasks:
+                pending.append(pool.apply_async(_sort_chunk_worker, (task,)))
+                if len(pending) >= num_processors:
+                    pending.pop(0).get()
+            for result in pending:
+                result.get()
+            pool.close()
+            pool.join()
+            pool = None
+        # merge spill files in groups when there are too many to open
+        merged = list(spills)
+        while len(merged) > MAX_MERGE_FILES:
+            group = merged[:MAX_MERGE_FILES]
+            filename = make_spill()
+            write_spill(heapq.merge(*[iter_spill(f) for f in group]),
+                        filename, compresslevel)
+            for f in group:
+                os.remove(f)
+            merged = merged[MAX_MERGE_FILES:] + [filename]
+        outfh = open_func(output, 'wb')
+        _merge_spills(merged, keyed, outfh)
+        outfh.close()
     finally:
-        for chunk in chunks:
-            try:
-                chunk.close()
-                os.remove(chunk.name)
-            except Exception:
-                pass
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        for filename in spills:
+            if os.path.exists(filename):
+                os.remove(filename)
+    return 0
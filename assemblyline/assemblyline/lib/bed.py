@@ -4,6 +4,9 @@ Created on Jan 19, 2013
 @author: mkiyer
 '''
 
+# number of characters buffered by BEDWriter before writing
+BED_WRITER_BUFSIZE = (1 << 20)
+
 class BEDFeature(object):
     __slots__ = ('chrom', 'tx_start', 'tx_end', 'name', 'score', 'strand',
                  'cds_start', 'cds_end', 'exon_count', 'exons', 'introns')
@@ -67,4 +70,46 @@ class BEDFeature(object):
             g = BEDFeature.parse_line(line)
             if g is None:
                 continue
-            yield g
\ No newline at end of file
+            yield g
+
+def format_bed12(chrom, strand, exons, name, score):
+    '''
+    returns a BED12 line (without a newline) for a transcript with
+    'exons' (objects with 'start' and 'end' attributes sorted by
+    position) and string 'strand'
+    '''
+    tx_start = exons[0].start
+    tx_end = exons[-1].end
+    block_sizes = ''.join('%d,' % (e.end - e.start) for e in exons)
+    block_starts = ''.join('%d,' % (e.start - tx_start) for e in exons)
+    return ('%s\t%d\t%d\t%s\t%s\t%s\t%d\t%d\t0\t%d\t%s\t%s' % 
+            (chrom, tx_start, tx_end, name, score, strand, tx_start, 
+             tx_start, len(exons), block_sizes, block_starts))
+
+class BEDWriter(object):
+    '''
+    buffered writer of BED12 transcript lines. lines are written to 
+    'fileh' in blocks of about 'bufsize' characters
+    '''
+    def __init__(self, fileh, bufsize=BED_WRITER_BUFSIZE):
+        self.fileh = fileh
+        self.bufsize = bufsize
+        self.parts = []
+        self.size = 0
+
+    def write_transcript(self, chrom, strand, exons, name, score):
+        s = format_bed12(chrom, strand, exons, name, score) + '\n'
+        self.parts.append(s)
+        self.size += len(s)
+        if self.size >= self.bufsize:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.fileh.write(''.join(self.parts))
+        self.parts = []
+        self.size = 0
+
+    def close(self):
+        self.flush()
+        self.fileh.close()
@@ -0,0 +1,266 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Reading and writing of BGZF (blocked gzip) files as created by 'bgzip'.
+A BGZF file is a series of gzip members that each hold at most 64kb of
+uncompressed data, so any gzip reader can decompress the file, and a
+position in the file can be addressed with a 'virtual offset' (the
+offset of the compressed block shifted left by 16 bits, plus the offset
+within the uncompressed block) without decompressing the preceding data.
+'''
+import struct
+import zlib
+import gzip
+
+# gzip magic number
+GZIP_MAGIC = '\x1f\x8b'
+# gzip header with the 'extra' flag set followed by the BGZF 'BC'
+# subfield holding the total block size minus 1
+BGZF_HEADER_FMT = '<BBBBIBBHBBHH'
+BGZF_HEADER_SIZE = struct.calcsize(BGZF_HEADER_FMT)
+BGZF_XLEN = 6
+# maximum uncompressed data per block (as used by bgzip)
+BGZF_BLOCK_SIZE = 0xff00
+BGZF_MAX_BLOCK_SIZE = 0x10000
+# empty block marking the end of a BGZF file
+BGZF_EOF = ('\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43'
+            '\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+
+class BGZFError(Exception):
+    pass
+
+def make_virtual_offset(block_offset, within_block_offset):
+    return (block_offset << 16) | within_block_offset
+
+def split_virtual_offset(virtual_offset):
+    return virtual_offset >> 16, virtual_offset & 0xffff
+
+def is_gzip_file(filename):
+    fileh = open(filename, 'rb')
+    magic = fileh.read(2)
+    fileh.close()
+    return magic == GZIP_MAGIC
+
+def is_bgzf_file(filename):
+    '''
+    returns True if the first block of the file has a BGZF header
+    '''
+    fileh = open(filename, 'rb')
+    header = fileh.read(BGZF_HEADER_SIZE)
+    fileh.close()
+    if len(header) < BGZF_HEADER_SIZE:
+        return False
+    fields = struct.unpack(BGZF_HEADER_FMT, header)
+    return (fields[:3] == (0x1f, 0x8b, 8) and bool(fields[3] & 4) and
+            fields[8:11] == (ord('B'), ord('C'), 2))
+
+def compress_block(data, compresslevel=6):
+    '''
+    returns a BGZF block containing 'data'
+    '''
+    c = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    cdata = c.compress(data) + c.flush()
+    bsize = BGZF_HEADER_SIZE + len(cdata) + 8
+    if bsize > BGZF_MAX_BLOCK_SIZE:
+        raise BGZFError("compressed block size %d too large" % (bsize))
+    header = struct.pack(BGZF_HEADER_FMT, 0x1f, 0x8b, 8, 4, 0, 0, 0xff,
+                         BGZF_XLEN, ord('B'), ord('C'), 2, bsize - 1)
+    trailer = struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data))
+    return header + cdata + trailer
+
+class BgzfWriter(object):
+    '''
+    file-like object that writes a BGZF file
+    '''
+    def __init__(self, filename, compresslevel=6):
+        self.fileh = open(filename, 'wb')
+        self.compresslevel = compresslevel
+        self.buf = []
+        self.buf_size = 0
+
+    def _write_block(self, data):
+        try:
+            self.fileh.write(compress_block(data, self.compresslevel))
+        except BGZFError:
+            # incompressible data can exceed the maximum block size
+            half = len(data) // 2
+            self._write_block(data[:half])
+            self._write_block(data[half:])
+
+    def write(self, data):
+        self.buf.append(data)
+        self.buf_size += len(data)
+        if self.buf_size >= BGZF_BLOCK_SIZE:
+            data = ''.join(self.buf)
+            end = BGZF_BLOCK_SIZE
+            while end <= len(data):
+                self._write_block(data[end-BGZF_BLOCK_SIZE:end])
+                end += BGZF_BLOCK_SIZE
+            data = data[end-BGZF_BLOCK_SIZE:]
+            self.buf = [data]
+            self.buf_size = len(data)
+
+    def tell(self):
+        '''
+        returns the virtual offset of the next byte written
+        '''
+        return make_virtual_offset(self.fileh.tell(), self.buf_size)
+
+    def flush(self):
+        if self.buf_size > 0:
+            self._write_block(''.join(self.buf))
+        self.buf = []
+        self.buf_size = 0
+        self.fileh.flush()
+
+    def close(self):
+        self.flush()
+        self.fileh.write(BGZF_EOF)
+        self.fileh.close()
+
+class BgzfReader(object):
+    '''
+    file-like object that reads a BGZF file. 'seek' and 'tell' use
+    virtual offsets and 'read' reads uncompressed bytes
+    '''
+    def __init__(self, filename):
+        self.name = filename
+        self.fileh = open(filename, 'rb')
+        self.block_offset = 0
+        self.next_block_offset = 0
+        self.data = ''
+        self.pos = 0
+        self._load_block(0)
+
+    def _load_block(self, block_offset):
+        '''
+        decompress the block at 'block_offset'. returns False at the
+        end of the file
+        '''
+        self.fileh.seek(block_offset)
+        header = self.fileh.read(BGZF_HEADER_SIZE)
+        self.block_offset = block_offset
+        self.pos = 0
+        if len(header) == 0:
+            self.data = ''
+            self.next_block_offset = block_offset
+            return False
+        if len(header) < BGZF_HEADER_SIZE:
+            raise BGZFError("truncated BGZF block at offset %d" %
+                            (block_offset))
+        fields = struct.unpack(BGZF_HEADER_FMT, header)
+        xlen = fields[7]
+        si1, si2, slen, bsize = fields[8:]
+        if ((fields[0], fields[1]) != (0x1f, 0x8b) or xlen != BGZF_XLEN or
+            (si1, si2, slen) != (ord('B'), ord('C'), 2)):
+            raise BGZFError("invalid BGZF block header at offset %d" %
+                            (block_offset))
+        block = self.fileh.read(bsize + 1 - BGZF_HEADER_SIZE)
+        cdata = block[:-8]
+        crc, isize = struct.unpack('<II', block[-8:])
+        data = zlib.decompress(cdata, -15)
+        if len(data) != isize:
+            raise BGZFError("BGZF block at offset %d has size %d "
+                            "(expected %d)" % (block_offset, len(data),
+                                               isize))
+        self.data = data
+        self.next_block_offset = block_offset + bsize + 1
+        return True
+
+    def _next_block(self):
+        '''
+        advance to the next block containing data and return False at
+        the end of the file
+        '''
+        while self.pos >= len(self.data):
+            if not self._load_block(self.next_block_offset):
+                return False
+        return True
+
+    def tell(self):
+        return make_virtual_offset(self.block_offset, self.pos)
+
+    def seek(self, virtual_offset):
+        block_offset, pos = split_virtual_offset(virtual_offset)
+        if block_offset != self.block_offset:
+            self._load_block(block_offset)
+        if pos > len(self.data):
+            raise BGZFError("invalid virtual offset %d" % (virtual_offset))
+        self.pos = pos
+
+    def read(self, size=-1):
+        chunks = []
+        while size != 0 and self._next_block():
+            if size < 0:
+                end = len(self.data)
+            else:
+                end = min(len(self.data), self.pos + size)
+                size -= (end - self.pos)
+            chunks.append(self.data[self.pos:end])
+            self.pos = end
+        return ''.join(chunks)
+
+    def readline(self):
+        chunks = []
+        while self._next_block():
+            i = self.data.find('\n', self.pos)
+            if i >= 0:
+                chunks.append(self.data[self.pos:i+1])
+                self.pos = i + 1
+                break
+            chunks.append(self.data[self.pos:])
+            self.pos = len(self.data)
+        return ''.join(chunks)
+
+    def __iter__(self):
+        while True:
+            line = self.readline()
+            if not line:
+                break
+            yield line
+
+    def iter_line_offsets(self):
+        '''
+        generator yielding (virtual_offset, line) tuples
+        '''
+        while True:
+            offset = self.tell()
+            line = self.readline()
+            if not line:
+                break
+            yield offset, line
+
+    def close(self):
+        self.fileh.close()
+
+def bgzf_open(filename, mode='r'):
+    '''
+    open a file for reading that may be BGZF compressed, gzip compressed
+    or uncompressed, or open a BGZF file for writing when mode is 'w'
+    '''
+    if mode.startswith('w'):
+        return BgzfWriter(filename)
+    if is_bgzf_file(filename):
+        return BgzfReader(filename)
+    if is_gzip_file(filename):
+        return gzip.open(filename, 'rb')
+    return open(filename, mode)
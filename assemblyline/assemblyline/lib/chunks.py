@@ -0,0 +1,292 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+'''
+import os
+import heapq
+import shutil
+import logging
+
+from bgzf import BgzfWriter
+
+# output files ending with this suffix are BGZF compressed
+BGZF_SUFFIX = '.gz'
+
+# suffix of file storing the location of each chunk
+CHUNK_INDEX_SUFFIX = '.chunks'
+
+# file in a chunk directory storing the parameters of the run
+CHUNK_PARAMS_FILE = 'params.txt'
+# subdirectories of a chunk directory holding each attempt at a run
+CHUNK_RUN_DIR_FMT = 'run%03d'
+
+class ChunkBuffer(object):
+    '''
+    file-like object that accumulates the lines of a single chunk
+    in memory
+    '''
+    def __init__(self):
+        self.parts = []
+
+    def write(self, s):
+        self.parts.append(s)
+
+    def getlines(self):
+        lines = ''.join(self.parts).splitlines(True)
+        self.parts = []
+        return lines
+
+class ChunkWriter(object):
+    '''
+    worker processes write the output for each unit of work (a locus)
+    as a contiguous 'chunk' of lines in one or more output files. the
+    location of every chunk is recorded in an index file together with
+    a key so that the chunks from many workers can be merged in key order
+    using 'merge_chunks'. keys are tuples of integers where the first 
+    element identifies the group (locus) the chunk belongs to, and any
+    further elements order multiple chunks within a group
+
+    lines are written to the file-like objects in 'buffers' and then
+    committed by calling 'write_chunk'. the index line of a chunk is 
+    written and flushed after its data, so the index is a journal of 
+    the chunks that were completely written if the process is killed
+    '''
+    def __init__(self, prefix, suffixes, sort_funcs=None):
+        if sort_funcs is None:
+            sort_funcs = [None] * len(suffixes)
+        self.sort_funcs = sort_funcs
+        self.filehs = [open(prefix + suffix, 'w') for suffix in suffixes]
+        self.offsets = [0] * len(suffixes)
+        self.buffers = [ChunkBuffer() for suffix in suffixes]
+        self.index_fileh = open(prefix + CHUNK_INDEX_SUFFIX, 'w')
+
+    def write_chunk(self, key, fields=()):
+        '''
+        write the lines accumulated in each buffer as a chunk. 'fields'
+        is an optional tuple of integers stored in the index alongside
+        the chunk
+        '''
+        index_fields = [','.join(map(str, key)), len(fields)]
+        index_fields.extend(fields)
+        for i,fileh in enumerate(self.filehs):
+            lines = self.buffers[i].getlines()
+            if self.sort_funcs[i] is not None:
+                self.sort_funcs[i](lines)
+            data = ''.join(lines)
+            fileh.write(data)
+            fileh.flush()
+            index_fields.extend((self.offsets[i], len(data)))
+            self.offsets[i] += len(data)
+        print >>self.index_fileh, '\t'.join(map(str, index_fields))
+        self.index_fileh.flush()
+
+    def close(self):
+        for fileh in self.filehs:
+            fileh.close()
+        self.index_fileh.close()
+
+def read_chunk_index(prefix):
+    '''
+    read the index written by a ChunkWriter and return a list of
+    (key, fields, extents) tuples sorted by key, where 'extents'
+    contains an (offset, length) tuple for each output file. a partial
+    last line left by a process that was killed is ignored
+    '''
+    chunks = []
+    for line in open(prefix + CHUNK_INDEX_SUFFIX):
+        if not line.endswith('\n'):
+            break
+        values = line.strip().split('\t')
+        key = tuple(map(int, values[0].split(',')))
+        values = map(int, values[1:])
+        i = 1 + values[0]
+        fields = tuple(values[1:i])
+        extents = zip(values[i::2], values[i+1::2])
+        chunks.append((key, fields, extents))
+    chunks.sort()
+    return chunks
+
+def write_chunk_index(prefix, chunks):
+    '''
+    replace the index of the chunks written with 'prefix' by the list 
+    of (key, fields, extents) tuples in 'chunks'
+    '''
+    index_file = prefix + CHUNK_INDEX_SUFFIX
+    tmp_file = index_file + '.tmp'
+    fileh = open(tmp_file, 'w')
+    for key, fields, extents in chunks:
+        index_fields = [','.join(map(str, key)), len(fields)]
+        index_fields.extend(fields)
+        for extent in extents:
+            index_fields.extend(extent)
+        print >>fileh, '\t'.join(map(str, index_fields))
+    fileh.close()
+    os.rename(tmp_file, index_file)
+
+def read_chunk_params(chunk_dir):
+    '''
+    returns the dictionary of run parameters stored in 'chunk_dir' or
+    None if there are none
+    '''
+    filename = os.path.join(chunk_dir, CHUNK_PARAMS_FILE)
+    if not os.path.exists(filename):
+        return None
+    params = {}
+    for line in open(filename):
+        name, value = line.rstrip('\n').split('\t', 1)
+        params[name] = value
+    return params
+
+def write_chunk_params(chunk_dir, params):
+    fileh = open(os.path.join(chunk_dir, CHUNK_PARAMS_FILE), 'w')
+    for name in sorted(params):
+        print >>fileh, '%s\t%s' % (name, params[name])
+    fileh.close()
+
+def prepare_chunk_dir(chunk_dir, params, resume=False, group_func=None):
+    '''
+    prepare a directory for the chunks written by the workers of a run.
+    'params' is a dictionary of strings describing the input and the 
+    options that affect the output of the run.
+
+    when 'resume' is True and the directory holds chunks written by 
+    earlier attempts at a run with the same parameters, the groups of
+    chunks (loci) that were completed are kept so that they need not 
+    be processed again. 'group_func(chunks)' returns True if a list of 
+    (key, fields) tuples forms a complete group (by default every group
+    is complete). otherwise the directory is emptied.
+
+    returns a tuple (run_dir, prefixes, chunk_indexes) where 'run_dir' 
+    is a new directory for the output of the workers of this attempt,
+    and 'prefixes' and 'chunk_indexes' locate the completed chunks of 
+    earlier attempts
+    '''
+    prefixes = []
+    chunk_indexes = []
+    if resume:
+        if not os.path.exists(chunk_dir):
+            logging.warning("No earlier run to resume in '%s'" % 
+                            (chunk_dir))
+            resume = False
+        elif read_chunk_params(chunk_dir) != params:
+            logging.warning("Cannot resume run in '%s' because its input "
+                            "or options have changed" % (chunk_dir))
+            resume = False
+    if not resume:
+        if os.path.exists(chunk_dir):
+            shutil.rmtree(chunk_dir)
+        os.makedirs(chunk_dir)
+        write_chunk_params(chunk_dir, params)
+    run_num = 0
+    while True:
+        run_dir = os.path.join(chunk_dir, CHUNK_RUN_DIR_FMT % (run_num))
+        if not os.path.exists(run_dir):
+            break
+        # groups are processed from the start by every attempt, so a 
+        # group is complete when all of its chunks were written by the
+        # workers of a single attempt
+        run_prefixes = []
+        for filename in sorted(os.listdir(run_dir)):
+            if filename.endswith(CHUNK_INDEX_SUFFIX):
+                filename = filename[:-len(CHUNK_INDEX_SUFFIX)]
+                run_prefixes.append(os.path.join(run_dir, filename))
+        run_indexes = [read_chunk_index(prefix) for prefix in run_prefixes]
+        groups = {}
+        for chunks in run_indexes:
+            for key, fields, extents in chunks:
+                groups.setdefault(key[0], []).append((key, fields))
+        complete = set(group for group, chunks in groups.iteritems()
+                       if (group_func is None) or group_func(chunks))
+        for prefix, chunks in zip(run_prefixes, run_indexes):
+            # only complete groups are kept so that the next attempt
+            # does not find the partial groups of this attempt
+            chunks = [c for c in chunks if c[0][0] in complete]
+            write_chunk_index(prefix, chunks)
+            prefixes.append(prefix)
+            chunk_indexes.append(chunks)
+        run_num += 1
+    os.makedirs(run_dir)
+    return run_dir, prefixes, chunk_indexes
+
+def merge_chunks(chunk_indexes, filenames, file_index, output_file,
+                 line_func=None, sort_func=None):
+    '''
+    merge the chunks written by several workers into a single output
+    file in order of key. 'chunk_indexes' is a list containing the result
+    of 'read_chunk_index' for each worker, and 'filenames' are the
+    corresponding worker output files. 'file_index' selects the output
+    file among those written by the ChunkWriter.
+
+    'line_func(line, key, fields)' may be specified to transform each
+    line as it is merged. when a group consists of more than one chunk,
+    or its lines are transformed by 'line_func', the lines of the group
+    are combined and sorted using 'sort_func'. output files ending with
+    '.gz' are BGZF compressed
+    '''
+    def iter_chunks(worker_index, chunks):
+        for key, fields, extents in chunks:
+            yield key, worker_index, fields, extents[file_index]
+    def read_chunk(worker_index, extent):
+        offset, length = extent
+        fileh = filehs[worker_index]
+        fileh.seek(offset)
+        return fileh.read(length)
+    def write_group(group):
+        if (len(group) == 1) and (line_func is None or sort_func is None):
+            key, worker_index, fields, extent = group[0]
+            data = read_chunk(worker_index, extent)
+            if line_func is None:
+                outfh.write(data)
+            else:
+                for line in data.splitlines(True):
+                    outfh.write(line_func(line, key, fields))
+            return
+        lines = []
+        for key, worker_index, fields, extent in group:
+            data = read_chunk(worker_index, extent)
+            if line_func is None:
+                lines.extend(data.splitlines(True))
+            else:
+                lines.extend(line_func(line, key, fields)
+                             for line in data.splitlines(True))
+        if sort_func is not None:
+            sort_func(lines)
+        outfh.writelines(lines)
+    filehs = [open(filename, 'rb') for filename in filenames]
+    iterables = [iter_chunks(i, chunks)
+                 for i,chunks in enumerate(chunk_indexes)]
+    if output_file.endswith(BGZF_SUFFIX):
+        outfh = BgzfWriter(output_file)
+    else:
+        outfh = open(output_file, 'wb')
+    group = []
+    for chunk in heapq.merge(*iterables):
+        if chunk[3][1] == 0:
+            continue
+        if (len(group) > 0) and (chunk[0][0] != group[0][0][0]):
+            write_group(group)
+            group = []
+        group.append(chunk)
+    if len(group) > 0:
+        write_group(group)
+    outfh.close()
+    for fileh in filehs:
+        fileh.close()
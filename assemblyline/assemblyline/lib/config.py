@@ -45,8 +45,11 @@ LIBRARY_ID_MAP = 'library_id.map'
 SAMPLE_ID_MAP = 'sample_id.map'
 TRANSCRIPTS_DROPPED_GTF_FILE = "transcripts.dropped.gtf"
 TRANSCRIPTS_GTF_FILE = "transcripts.gtf"
+TRANSCRIPTS_STORE = "transcripts.tstore"
 TRANSCRIPT_STATS_FILE = "aggregate_library_stats.txt"
+LIBRARY_CACHE_DIR = "library_cache"
 ANNOTATED_TRANSCRIPTS_GTF_FILE = 'transcripts.annotated.gtf'
+ANNOTATED_TRANSCRIPTS_STORE = 'transcripts.annotated.tstore'
 CATEGORY_STATS_FILE = "category_stats.txt"
 CLASSIFY_DIR = 'classify'
 REF_GTF_FILE = 'ref.gtf'
@@ -62,8 +65,11 @@ class AssemblylineResults(object):
         self.sample_id_map = os.path.join(output_dir, SAMPLE_ID_MAP)
         self.transcripts_dropped_gtf_file = os.path.join(output_dir, TRANSCRIPTS_DROPPED_GTF_FILE)
         self.transcripts_gtf_file = os.path.join(output_dir, TRANSCRIPTS_GTF_FILE)
+        self.transcripts_store = os.path.join(output_dir, TRANSCRIPTS_STORE)
         self.transcript_stats_file = os.path.join(output_dir, TRANSCRIPT_STATS_FILE)
+        self.library_cache_dir = os.path.join(output_dir, LIBRARY_CACHE_DIR)
         self.annotated_transcripts_gtf_file = os.path.join(output_dir, ANNOTATED_TRANSCRIPTS_GTF_FILE)
+        self.annotated_transcripts_store = os.path.join(output_dir, ANNOTATED_TRANSCRIPTS_STORE)
         self.classify_dir = os.path.join(output_dir, CLASSIFY_DIR)
         self.category_stats_file = os.path.join(output_dir, CATEGORY_STATS_FILE)
         self.ref_gtf_file = os.path.join(output_dir, REF_GTF_FILE)
@@ -21,42 +21,398 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
 import os
-import subprocess
-import shutil
+import re
+import heapq
+import bisect
+import multiprocessing
+
+from bgzf import BgzfWriter, BgzfReader, bgzf_open, is_gzip_file
+from batch_sort import batch_sort, batch_merge, DEFAULT_SORT_MEMORY
 
 GTF_EMPTY_FIELD = '.'
 GTF_ATTR_SEP = ';'
 GTF_ATTR_TAGVALUE_SEP = ' '
+# suffix of locus index file created alongside a GTF file
+LOCUS_INDEX_SUFFIX = '.loci'
+# suffix of BGZF compressed GTF files
+BGZF_SUFFIX = '.gz'
+LOCUS_INDEX_NUM_FIELDS = 7
+# number of characters buffered by GTFWriter before writing
+GTF_WRITER_BUFSIZE = (1 << 20)
+# actions taken on loci that exceed the limits of a LocusGuard
+GUARD_SPLIT = 'split'
+GUARD_QUARANTINE = 'quarantine'
+GUARD_MODES = (GUARD_SPLIT, GUARD_QUARANTINE)
+# smallest fraction of the transcripts of a super-locus that the locus
+# guard leaves on either side of a cut
+LOCUS_GUARD_MIN_CUT_FRAC = 0.125
+LOCUS_GUARD_FIELDS = ('locus', 'chrom', 'start', 'end', 'transcripts', 
+                      'action', 'loci', 'quarantined')
+# values of an attribute are interned until the attribute has this 
+# many distinct values
+ATTR_INTERN_MAX_VALUES = 4096
 
 class GTFError(Exception):
     pass
 
-def sort_gtf(filename, output_file, tmp_dir=None):
-    args = ["sort"]
-    if tmp_dir is not None:
-        args.extend(["-T", tmp_dir])
-    args.extend(["-k1,1", "-k4,4n", "-k3,3r", filename])
-    myenv = os.environ.copy()
-    myenv["LC_ALL"] = "C"
-    return subprocess.call(args, stdout=open(output_file, "w"), env=myenv)
-
-def merge_sort_gtf_files(gtf_files, output_file, tmp_dir=None):
-    tmp_file = os.path.splitext(output_file)[0] + ".unsorted.gtf"
-    outfh = open(tmp_file, "w")
-    for filename in gtf_files:
-        shutil.copyfileobj(open(filename), outfh)
-    outfh.close()
-    sort_gtf(tmp_file, output_file, tmp_dir)
-    os.remove(tmp_file)
+def open_gtf(filename, mode='r'):
+    '''
+    open a GTF file that may be BGZF (or gzip) compressed. files are 
+    written with BGZF compression when 'filename' ends with '.gz'
+    '''
+    if mode.startswith('w'):
+        if filename.endswith(BGZF_SUFFIX):
+            return BgzfWriter(filename)
+        return open(filename, mode)
+    return bgzf_open(filename, mode)
+
+# translation table that reverses the order of strings, used to sort
+# feature types in descending order
+_REVERSE_TABLE = ''.join(chr(255-i) for i in xrange(256))
+_NUMERIC_PREFIX_RE = re.compile(r'\s*(-?(?:\d+\.?\d*|\.\d+))')
+
+def _numeric_prefix(s):
+    m = _NUMERIC_PREFIX_RE.match(s)
+    if m is None:
+        return 0
+    return float(m.group(1))
+
+def gtf_sort_key(line):
+    '''
+    returns the key that orders GTF lines by (seqid, start, feature type
+    descending), which is the order of 'LC_ALL=C sort -k1,1 -k4,4n -k3,3r'
+    for tab-delimited lines
+    '''
+    fields = line.split('\t', 4)
+    if len(fields) < 4:
+        fields.extend([''] * (4 - len(fields)))
+    try:
+        start = int(fields[3])
+    except ValueError:
+        start = _numeric_prefix(fields[3])
+    # the terminator places longer feature types before their prefixes
+    return (fields[0], start, fields[2].translate(_REVERSE_TABLE) + '\xff')
+
+def sort_gtf(filename, output_file, tmp_dir=None, num_processors=1,
+             memory=DEFAULT_SORT_MEMORY):
+    '''
+    sort a GTF file by (seqid, start, feature type descending) using an
+    external merge sort with at most 'memory' bytes of lines in memory.
+    input files may be compressed and the output is BGZF compressed
+    when 'output_file' ends with '.gz'. returns zero on success
+    '''
+    tempdirs = None if tmp_dir is None else [tmp_dir]
+    return batch_sort(filename, output_file, key=gtf_sort_key,
+                      tempdirs=tempdirs, memory=memory,
+                      num_processors=num_processors, open_func=open_gtf)
+
+def merge_gtf(filenames, output_file, tmp_dir=None):
+    '''
+    merge GTF files that were each sorted by 'sort_gtf' into a single 
+    sorted file without sorting them again. the output is the same as
+    that of 'sort_gtf' on all of the files. returns zero on success
+    '''
+    tempdirs = None if tmp_dir is None else [tmp_dir]
+    return batch_merge(filenames, output_file, key=gtf_sort_key,
+                       tempdirs=tempdirs, open_func=open_gtf)
+
+def sort_gtf_lines(lines):
+    '''
+    sort a list of GTF lines from a single chromosome in place, in the
+    same order as 'sort_gtf' (by start position with 'transcript' features
+    before 'exon' features, then by the text of the line)
+    '''
+    lines.sort(key=lambda line: line.rstrip('\n'))
+    lines.sort(key=lambda line: line.split('\t', 3)[2], reverse=True)
+    lines.sort(key=lambda line: int(line.split('\t', 4)[3]))
+
+def merge_sort_gtf_files(gtf_files, output_file, tmp_dir=None,
+                         num_processors=1, memory=DEFAULT_SORT_MEMORY):
+    sort_gtf(gtf_files, output_file, tmp_dir=tmp_dir,
+             num_processors=num_processors, memory=memory)
+
+_TRANSCRIPT_ID_RE = re.compile(r'transcript_id "([^"]*)"')
+
+class LocusGuard(object):
+    '''
+    detects 'super-loci' whose span or number of transcripts exceeds
+    'max_span' or 'max_transcripts' (zero disables a limit), which occur 
+    when long read-through or spurious transcripts join many genes into
+    a single locus. super-loci are divided into smaller loci in one of 
+    two modes:
+
+    'split': loci are cut into as few pieces as the transcript limit 
+    needs, at the positions crossed by the fewest transcripts, and 
+    transcripts are assigned to the side where they start
+    'quarantine': transcripts crossing the cut positions, as well as 
+    transcripts longer than 'max_span', are removed from the locus and
+    returned as separate loci after the remaining ones
+
+    every super-locus is recorded in 'records' as a tuple with the
+    fields of LOCUS_GUARD_FIELDS
+    '''
+    def __init__(self, max_span=0, max_transcripts=0, mode=GUARD_SPLIT):
+        if mode not in GUARD_MODES:
+            raise GTFError("Unknown locus guard mode '%s'" % (mode))
+        self.max_span = max_span
+        self.max_transcripts = max_transcripts
+        self.mode = mode
+        self.records = []
+
+    def is_super_locus(self, span, num_transcripts):
+        if (self.max_span > 0) and (span > self.max_span):
+            return True
+        if (self.max_transcripts > 0) and (num_transcripts > self.max_transcripts):
+            return True
+        return False
 
-def parse_loci(line_iter):
+    def _is_oversized(self, interval):
+        return (self.max_span > 0) and (interval[1] - interval[0] > self.max_span)
+
+    def _within_limits(self, intervals, indexes):
+        if (self.max_transcripts > 0) and (len(indexes) > self.max_transcripts):
+            return False
+        if self.max_span > 0:
+            # transcripts that are longer than the maximum span by 
+            # themselves cannot be fixed by cutting the locus
+            ivs = [intervals[i] for i in indexes 
+                   if not self._is_oversized(intervals[i])]
+            if (len(ivs) > 0 and
+                (max(x[1] for x in ivs) - min(x[0] for x in ivs) > self.max_span)):
+                return False
+        return True
+
+    def _num_pieces(self, n):
+        '''
+        returns the number of pieces needed to divide 'n' transcripts
+        within the transcript limit
+        '''
+        m = self.max_transcripts
+        if m <= 0:
+            return 1
+        return max(1, (n + m - 1) // m)
+
+    def _find_cut(self, intervals, indexes):
+        '''
+        returns the position k (0 < k < len(indexes)) at which to cut a
+        list of interval indexes sorted by start. cuts are avoided that
+        leave more pieces than the transcript limit needs or that leave
+        less than LOCUS_GUARD_MIN_CUT_FRAC of the intervals on one side,
+        so that pieces stay balanced. among the other cuts the cut 
+        crosses the fewest intervals and, among those, is closest to the
+        middle. the ends of the intervals left of the cut are kept in a
+        heap so that finding a cut takes O(n log n) time
+        '''
+        n = len(indexes)
+        num_pieces = max(2, self._num_pieces(n))
+        min_size = n * LOCUS_GUARD_MIN_CUT_FRAC
+        ends = []
+        mid = n / 2.0
+        best = None
+        best_k = 1
+        for k in xrange(1, n):
+            heapq.heappush(ends, intervals[indexes[k-1]][1])
+            start = intervals[indexes[k]][0]
+            # intervals ending before the start of interval k do not
+            # cross this or any later cut
+            while (len(ends) > 0) and (ends[0] <= start):
+                heapq.heappop(ends)
+            unbalanced = ((k < min_size) or (n - k < min_size) or
+                          (self._num_pieces(k) + self._num_pieces(n - k) > 
+                           num_pieces))
+            score = (unbalanced, len(ends), abs(k - mid))
+            if (best is None) or (score < best):
+                best = score
+                best_k = k
+        return best_k
+
+    def _split(self, intervals, indexes, quarantine):
+        '''
+        returns a tuple (pieces, quarantined) where 'pieces' is a list
+        of lists of indexes within the limits of the guard (or that 
+        cannot be cut further)
+        '''
+        pieces = []
+        quarantined = []
+        stack = [indexes]
+        while len(stack) > 0:
+            piece = stack.pop()
+            if (len(piece) <= 1) or self._within_limits(intervals, piece):
+                if len(piece) > 0:
+                    pieces.append(piece)
+                continue
+            k = self._find_cut(intervals, piece)
+            left = piece[:k]
+            right = piece[k:]
+            if quarantine:
+                start = intervals[right[0]][0]
+                crossing = set(i for i in left if intervals[i][1] > start)
+                quarantined.extend(crossing)
+                left = [i for i in left if i not in crossing]
+            # process the left piece first to keep pieces in order
+            stack.append(right)
+            stack.append(left)
+        return pieces, quarantined
+
+    def split(self, chrom, intervals, key=None):
+        '''
+        divide a locus given a list of (start, end) transcript intervals
+        sorted by start position. returns a list of loci as lists of
+        indexes into 'intervals'. loci that are not super-loci are 
+        returned unchanged as a single list. 'key' identifies the locus 
+        in the records of the guard
+        '''
+        indexes = range(len(intervals))
+        if len(intervals) == 0:
+            return [indexes]
+        start = min(x[0] for x in intervals)
+        end = max(x[1] for x in intervals)
+        if not self.is_super_locus(end - start, len(intervals)):
+            return [indexes]
+        quarantined = []
+        if self.mode == GUARD_QUARANTINE:
+            quarantined = [i for i in indexes 
+                           if self._is_oversized(intervals[i])]
+            indexes = [i for i in indexes 
+                       if not self._is_oversized(intervals[i])]
+            pieces, crossing = self._split(intervals, indexes, True)
+            quarantined.extend(crossing)
+        else:
+            pieces, crossing = self._split(intervals, indexes, False)
+        # quarantined transcripts form separate loci that are split 
+        # rather than quarantined again
+        quarantined.sort(key=lambda i: intervals[i][0])
+        cluster = []
+        cluster_end = None
+        for i in quarantined:
+            if (len(cluster) > 0) and (intervals[i][0] > cluster_end):
+                pieces.extend(self._split(intervals, cluster, False)[0])
+                cluster = []
+            if len(cluster) == 0:
+                cluster_end = intervals[i][1]
+            cluster.append(i)
+            cluster_end = max(cluster_end, intervals[i][1])
+        if len(cluster) > 0:
+            pieces.extend(self._split(intervals, cluster, False)[0])
+        self.records.append((key, chrom, start, end, len(intervals), 
+                             self.mode, len(pieces), len(quarantined)))
+        return pieces
+
+    def split_transcripts(self, transcripts, key=None):
+        '''
+        divide a locus given as a list of objects with 'chrom', 'start' 
+        and 'end' attributes sorted by start position. returns a list of 
+        lists of transcripts
+        '''
+        if len(transcripts) == 0:
+            return [transcripts]
+        intervals = [(t.start, t.end) for t in transcripts]
+        pieces = self.split(transcripts[0].chrom, intervals, key)
+        if len(pieces) == 1:
+            return [transcripts]
+        return [[transcripts[i] for i in piece] for piece in pieces]
+
+    def split_lines(self, lines, key=None):
+        '''
+        divide a locus given as a list of GTF lines (as yielded by 
+        'parse_loci') into a list of lists of lines. the lines of each
+        transcript are kept together and in their original order
+        '''
+        # group lines by transcript id
+        transcript_dict = {}
+        intervals = []
+        owners = []
+        num_transcripts = 0
+        start, end = None, None
+        for line in lines:
+            fields = line.split('\t', 5)
+            line_start = int(fields[3]) - 1
+            line_end = int(fields[4])
+            start = line_start if start is None else min(start, line_start)
+            end = line_end if end is None else max(end, line_end)
+            if fields[2] == 'transcript':
+                num_transcripts += 1
+        if (start is None) or (not self.is_super_locus(end - start, num_transcripts)):
+            return [lines]
+        for line in lines:
+            fields = line.split('\t', 5)
+            m = _TRANSCRIPT_ID_RE.search(line)
+            t_id = None if m is None else m.group(1)
+            i = transcript_dict.get(t_id)
+            line_start = int(fields[3]) - 1
+            line_end = int(fields[4])
+            if i is None:
+                i = len(intervals)
+                transcript_dict[t_id] = i
+                intervals.append([line_start, line_end])
+            else:
+                intervals[i][0] = min(intervals[i][0], line_start)
+                intervals[i][1] = max(intervals[i][1], line_end)
+            owners.append(i)
+        pieces = self.split(fields[0], intervals, key)
+        if len(pieces) == 1:
+            return [lines]
+        piece_of = {}
+        for p, piece in enumerate(pieces):
+            for i in piece:
+                piece_of[i] = p
+        piece_lines = [[] for piece in pieces]
+        for line, i in zip(lines, owners):
+            piece_lines[piece_of[i]].append(line)
+        return piece_lines
+
+def write_locus_guard_stats(filename, records):
+    '''
+    write the records of one or more LocusGuard objects sorted by locus
+    to a tab-delimited file
+    '''
+    fileh = open(filename, 'w')
+    print >>fileh, '\t'.join(LOCUS_GUARD_FIELDS)
+    write_locus_guard_records(fileh, sorted(records))
+    fileh.close()
+
+def write_locus_guard_records(fileh, records):
+    '''
+    append records to a file started by 'write_locus_guard_stats'
+    '''
+    for record in records:
+        print >>fileh, '\t'.join(map(str, record))
+
+def read_locus_guard_stats(filename):
+    '''
+    read the records written by 'write_locus_guard_stats'. a partial
+    last line left by a process that was killed is ignored
+    '''
+    records = []
+    fileh = open(filename)
+    fileh.next()
+    for line in fileh:
+        if not line.endswith('\n'):
+            break
+        fields = line.rstrip('\n').split('\t')
+        key = None if fields[0] == 'None' else int(fields[0])
+        records.append((key, fields[1], int(fields[2]), int(fields[3]),
+                        int(fields[4]), fields[5], int(fields[6]), 
+                        int(fields[7])))
+    fileh.close()
+    return records
+
+def parse_loci(line_iter, guard=None):
     '''
     requires that GTF file has been sorted and formatted such that a
     single 'transcript' feature appears before individual 'exon' 
     features such that transcript boundaries can be ascertained. this
     greatly simplifies parsing. using this function without appropriately 
     formatted GTF files will result in undefined behavior
+
+    if a LocusGuard is specified super-loci are divided by the guard
+    and records are keyed by the (1-based) number of the locus
     '''
+    if guard is not None:
+        for i, window in enumerate(parse_loci(line_iter), start=1):
+            for lines in guard.split_lines(window, key=i):
+                yield lines
+        return
     def window_overlap(a, b):
         if a[0] != b[0]:
             return False
@@ -102,6 +458,344 @@ def parse_loci(line_iter):
     if len(window) > 0:
         yield window
 
+def iter_line_offsets(fileh):
+    '''
+    generator yielding (offset, line) tuples where 'offset' is the 
+    location of the line relative to the start of the file. offsets in 
+    BGZF files are virtual offsets
+    '''
+    if isinstance(fileh, BgzfReader):
+        for offset, line in fileh.iter_line_offsets():
+            yield offset, line
+        return
+    offset = 0
+    for line in fileh:
+        yield offset, line
+        offset += len(line)
+
+def _index_loci(line_offsets, pos=0):
+    '''
+    generator yielding the index tuples of 'index_loci' given an iterator
+    of (offset, line) tuples and the position of the first line in the 
+    uncompressed file
+    '''
+    def window_overlap(a, b):
+        if a[0] != b[0]:
+            return False
+        return (a[1] <= b[2]) and (b[1] <= a[2])
+    def window_tuple():
+        return (window_range[0], window_range[1], window_range[2],
+                window_offset, window_end_pos - window_pos,
+                num_transcripts, len(boundaries))
+    window_range = None
+    window_offset = 0
+    window_pos = 0
+    window_end_pos = 0
+    num_transcripts = 0
+    boundaries = set()
+    for line_offset, line in line_offsets:
+        line_pos = pos
+        pos += len(line)
+        if line.startswith("#"):
+            continue
+        fields = line.rstrip().split('\t', 5)
+        if len(fields) < 5:
+            continue
+        interval = (fields[0], int(fields[3])-1, int(fields[4]))
+        if window_range is None:
+            window_range = interval
+            window_offset = line_offset
+            window_pos = line_pos
+        elif not window_overlap(interval, window_range):
+            yield window_tuple()
+            window_range = interval
+            window_offset = line_offset
+            window_pos = line_pos
+            num_transcripts = 0
+            boundaries = set()
+        else:
+            newstart = min(interval[1], window_range[1])
+            newend = max(interval[2], window_range[2])
+            window_range = (interval[0], newstart, newend)
+        window_end_pos = pos
+        if fields[2] == 'transcript':
+            num_transcripts += 1
+        elif fields[2] == 'exon':
+            boundaries.add(interval[1])
+            boundaries.add(interval[2])
+    if window_range is not None:
+        yield window_tuple()
+
+def index_loci(fileh):
+    '''
+    same locus definition as 'parse_loci' but rather than yielding the
+    lines of each locus yields (seqid, start, end, offset, length, 
+    num_transcripts, num_boundaries) tuples where 'offset' gives the 
+    location of the locus relative to the start of the file (as returned
+    by 'iter_line_offsets') and 'length' the number of (uncompressed)
+    bytes of the locus, 'num_transcripts' is the number of 'transcript' 
+    features, and 'num_boundaries' is the number of distinct exon 
+    start/end positions. the file must be opened in binary mode (or 
+    with 'open_gtf') and positioned at the beginning
+    '''
+    return _index_loci(iter_line_offsets(fileh))
+
+def _iter_range_line_offsets(fileh, start, end):
+    '''
+    generator yielding (offset, line) tuples of the lines of an 
+    uncompressed file that begin at offsets start <= offset < end
+    '''
+    fileh.seek(start)
+    offset = start
+    while offset < end:
+        line = fileh.readline()
+        if not line:
+            break
+        yield offset, line
+        offset += len(line)
+
+def find_shard_offsets(filename, num_shards):
+    '''
+    returns a list of offsets that divide an uncompressed file into at
+    most 'num_shards' byte ranges of roughly equal size that begin at 
+    the start of a line. shard i is the range offsets[i]:offsets[i+1]
+    '''
+    size = os.path.getsize(filename)
+    offsets = [0]
+    fileh = open(filename, 'rb')
+    for i in xrange(1, num_shards):
+        pos = (size * i) // num_shards
+        if pos <= offsets[-1]:
+            continue
+        # move to the start of the next line
+        fileh.seek(pos - 1)
+        fileh.readline()
+        pos = fileh.tell()
+        if (pos > offsets[-1]) and (pos < size):
+            offsets.append(pos)
+    fileh.close()
+    offsets.append(size)
+    return offsets
+
+def _index_shard(args):
+    filename, start, end = args
+    fileh = open(filename, 'rb')
+    loci = list(_index_loci(_iter_range_line_offsets(fileh, start, end), 
+                            start))
+    fileh.close()
+    return loci
+
+def index_loci_parallel(filename, num_processors=1):
+    '''
+    returns the same list of locus index tuples as 'index_loci' for a 
+    GTF file. uncompressed files are divided into byte ranges that are
+    indexed by separate processes. loci that cross the boundary between
+    two ranges are joined and indexed again, so the result does not
+    depend on where the file is divided
+    '''
+    if (num_processors <= 1) or is_gzip_file(filename):
+        fileh = open_gtf(filename, 'rb')
+        loci = list(index_loci(fileh))
+        fileh.close()
+        return loci
+    offsets = find_shard_offsets(filename, num_processors)
+    tasks = [(filename, offsets[i], offsets[i+1]) 
+             for i in xrange(len(offsets) - 1)]
+    pool = multiprocessing.Pool(processes=len(tasks))
+    shards = pool.map(_index_shard, tasks)
+    pool.close()
+    pool.join()
+    # a locus at the end of one shard may extend into the next shards, 
+    # so index again from its first line until a locus begins at the 
+    # same line as one of the loci found by the later shards. from that
+    # line on the results are identical to a sequential scan
+    shard_loci = {}
+    for i in xrange(1, len(shards)):
+        for j, locus in enumerate(shards[i]):
+            shard_loci[locus[3]] = (i, j)
+    fileh = open(filename, 'rb')
+    loci = list(shards[0])
+    i = 1
+    while i < len(shards):
+        if len(loci) == 0:
+            loci.extend(shards[i])
+            i += 1
+            continue
+        boundary = tasks[i][1]
+        offset = loci.pop()[3]
+        line_offsets = _iter_range_line_offsets(fileh, offset, offsets[-1])
+        next_shard = len(shards)
+        for locus in _index_loci(line_offsets, offset):
+            if (locus[3] >= boundary) and (locus[3] in shard_loci):
+                shard_index, locus_index = shard_loci[locus[3]]
+                loci.extend(shards[shard_index][locus_index:])
+                next_shard = shard_index + 1
+                break
+            loci.append(locus)
+        i = next_shard
+    fileh.close()
+    return loci
+
+def write_locus_index(gtf_file, index_file, num_processors=1):
+    '''
+    scan a sorted GTF file and write a tab-delimited locus index with
+    fields (seqid, start, end, offset, length, num_transcripts, 
+    num_boundaries) for each locus. uncompressed files are scanned by
+    'num_processors' processes
+    '''
+    num_loci = 0
+    fileh = open_gtf(gtf_file, 'rb')
+    if is_gzip_file(gtf_file) and not isinstance(fileh, BgzfReader):
+        # gzip files cannot be read from an offset
+        raise GTFError("Cannot index gzip compressed GTF file '%s' (use "
+                       "BGZF compression instead)" % (gtf_file))
+    if (num_processors > 1) and not is_gzip_file(gtf_file):
+        fileh.close()
+        loci = index_loci_parallel(gtf_file, num_processors)
+    else:
+        loci = index_loci(fileh)
+    outfh = open(index_file, 'w')
+    for fields in loci:
+        print >>outfh, '\t'.join(map(str, fields))
+        num_loci += 1
+    outfh.close()
+    return num_loci
+
+def _parse_locus_index_line(index_file, line):
+    fields = line.rstrip().split('\t')
+    if len(fields) != LOCUS_INDEX_NUM_FIELDS:
+        raise GTFError("Locus index file '%s' has %d fields (expected "
+                       "%d)" % (index_file, len(fields), 
+                                LOCUS_INDEX_NUM_FIELDS))
+    return (fields[0],) + tuple(map(int, fields[1:]))
+
+def read_locus_index(index_file):
+    '''
+    generator yielding (seqid, start, end, offset, length, num_transcripts,
+    num_boundaries) tuples from a locus index file
+    '''
+    for line in open(index_file):
+        yield _parse_locus_index_line(index_file, line)
+
+def locus_index_is_current(gtf_file, index_file):
+    '''
+    returns True if the locus index exists, is newer than the GTF file,
+    and has the current format
+    '''
+    if not os.path.exists(index_file):
+        return False
+    if os.path.getmtime(index_file) < os.path.getmtime(gtf_file):
+        return False
+    line = open(index_file).readline()
+    if line and (len(line.rstrip().split('\t')) != LOCUS_INDEX_NUM_FIELDS):
+        return False
+    return True
+
+def query_locus_index(index_file, seqid, start, end):
+    '''
+    returns a list of the locus index tuples of the loci that overlap
+    the region seqid:start-end (zero-based, half-open). the loci of 
+    each chromosome are contiguous in the index, sorted, and do not 
+    overlap, so the index is only parsed from the first locus of 
+    'seqid' and read until the end of the region. the first locus that
+    overlaps the region is found by binary search
+    '''
+    prefix = seqid + '\t'
+    loci = []
+    for line in open(index_file):
+        if not line.startswith(prefix):
+            if len(loci) > 0:
+                break
+            continue
+        locus = _parse_locus_index_line(index_file, line)
+        if locus[1] >= end:
+            break
+        loci.append(locus)
+    ends = [x[2] for x in loci]
+    i = bisect.bisect_right(ends, start)
+    hits = []
+    while (i < len(loci)) and (loci[i][1] < end):
+        hits.append(loci[i])
+        i += 1
+    return hits
+
+def read_locus_lines(fileh, offset, length):
+    '''
+    read the GTF lines of a single locus given its 'offset' and 'length'
+    in the file (as determined by 'index_loci')
+    '''
+    fileh.seek(offset)
+    lines = []
+    for line in fileh.read(length).splitlines():
+        if line.startswith("#"):
+            continue
+        if len(line.split('\t', 5)) < 5:
+            continue
+        lines.append(line)
+    return lines
+
+class AttrTable(object):
+    '''
+    table of interned GTF attribute tags and values. features parsed with
+    the same table share a single copy of each tag and of each value of
+    low-cardinality attributes (such as library ids and flags). an
+    attribute stops being interned once it has more than 'max_values' 
+    distinct values (such as transcript ids)
+    '''
+    def __init__(self, max_values=ATTR_INTERN_MAX_VALUES):
+        self.max_values = max_values
+        self.tables = {}
+        self.unique_tags = set()
+
+    def intern_attr(self, tag, value):
+        '''
+        returns the interned (tag, value) tuple
+        '''
+        tag = intern(tag)
+        table = self.tables.get(tag)
+        if table is None:
+            if tag in self.unique_tags:
+                return tag, value
+            table = {}
+            self.tables[tag] = table
+        v = table.get(value)
+        if v is None:
+            if len(table) >= self.max_values:
+                # stop interning high-cardinality attributes
+                del self.tables[tag]
+                self.unique_tags.add(tag)
+                return tag, value
+            table[value] = value
+            v = value
+        return tag, v
+
+# table shared by all GTF parsers of a process
+ATTR_TABLE = AttrTable()
+
+def decode_attr_string(attr_string, attr_defs=None, attr_table=ATTR_TABLE):
+    '''
+    decode a GTF attribute string into a dictionary. tags and values are
+    interned through 'attr_table' and tags in 'attr_defs' are converted 
+    with the given function instead
+    '''
+    attrs = {}
+    if attr_string == GTF_EMPTY_FIELD:
+        return attrs
+    for a in attr_string.split(GTF_ATTR_SEP):
+        a = a.strip()
+        if len(a) == 0:
+            continue
+        tag, value = a.split(GTF_ATTR_TAGVALUE_SEP, 1)
+        # remove quotes
+        value = value.strip('"')
+        # apply parsing function
+        if (attr_defs is not None) and (attr_defs.get(tag) is not None):
+            attrs[intern(tag)] = attr_defs[tag](value)
+        else:
+            tag, value = attr_table.intern_attr(tag, value)
+            attrs[tag] = value
+    return attrs
+
 class GTFFeature(object):
     '''
     1. seqname - The name of the sequence. Must be a chromosome or scaffold.
@@ -136,9 +830,9 @@ class GTFFeature(object):
         f = GTFFeature()        
         # read the GTF line
         fields = line.strip().split('\t')
-        f.seqid = fields[0]
-        f.source = fields[1]
-        f.feature_type = fields[2]
+        f.seqid = intern(fields[0])
+        f.source = intern(fields[1])
+        f.feature_type = intern(fields[2])
         # convert from 1-based (inclusive) to 0-based (exclusive) intervals
         f.start = int(fields[3])-1
         f.end = int(fields[4])
@@ -148,22 +842,7 @@ class GTFFeature(object):
             strand = GTF_EMPTY_FIELD
         f.strand = strand        
         f.phase = fields[7]        
-        attrs = {}
-        if fields[8] != GTF_EMPTY_FIELD:
-            attr_strings = fields[8].split(GTF_ATTR_SEP)
-            for a in attr_strings:
-                a = a.strip()
-                if len(a) == 0:
-                    continue
-                tag, value = a.split(GTF_ATTR_TAGVALUE_SEP, 1)
-                # remove quotes
-                value = value.strip('"')
-                #value = value.split('"')[1]
-                # apply parsing function
-                if (attr_defs != None) and (tag in attr_defs) and (attr_defs[tag] != None):
-                    value = attr_defs[tag](value)
-                attrs[tag] = value
-        f.attrs = attrs
+        f.attrs = decode_attr_string(fields[8], attr_defs)
         return f
 
     @staticmethod
@@ -177,3 +856,80 @@ class GTFFeature(object):
             if line.startswith("#"):
                 continue
             yield GTFFeature.from_string(line, attr_defs)
+
+def format_gtf_attrs(attrs):
+    '''
+    returns the GTF attribute string of a dictionary or a sequence of
+    (tag, value) tuples in the same format as 'GTFFeature'
+    '''
+    if hasattr(attrs, 'iteritems'):
+        attrs = attrs.iteritems()
+    return ' '.join('%s "%s";' % (k, v) for (k, v) in attrs)
+
+class GTFWriter(object):
+    '''
+    buffered writer that formats a transcript feature and its exon
+    features in one step. the attributes shared by the transcript and
+    its exons are formatted once per transcript, and lines are written
+    to 'fileh' in blocks of about 'bufsize' characters
+    '''
+    def __init__(self, fileh, bufsize=GTF_WRITER_BUFSIZE):
+        self.fileh = fileh
+        self.bufsize = bufsize
+        self.parts = []
+        self.size = 0
+
+    def write_transcript(self, seqid, strand, exons, attrs, 
+                         source='assemblyline', score=1000, exon_score=None,
+                         transcript_attrs=None, first_exon_number=1,
+                         start=None, end=None, exon_scores=None):
+        '''
+        write a 'transcript' line followed by an 'exon' line for each of
+        'exons' (objects with 0-based 'start' and 'end'). 'attrs' are
+        written on every line, 'transcript_attrs' only on the transcript
+        line, and exons are numbered from 'first_exon_number' (or not
+        numbered if it is None). exons are written with 'exon_score', or
+        with the corresponding item of 'exon_scores' if given
+        '''
+        if exon_score is None:
+            exon_score = score
+        if exon_scores is None:
+            exon_scores = [exon_score] * len(exons)
+        if start is None:
+            start = exons[0].start
+        if end is None:
+            end = exons[-1].end
+        shared = format_gtf_attrs(attrs)
+        sep = ' ' if shared else ''
+        tx_attrs = shared
+        if transcript_attrs:
+            tx_attrs += sep + format_gtf_attrs(transcript_attrs)
+        head = '%s\t%s\t' % (seqid, source)
+        lines = ['%stranscript\t%d\t%d\t%s\t%s\t.\t%s\n' % 
+                 (head, start + 1, end, score, strand, tx_attrs)]
+        if first_exon_number is None:
+            exon_tail = '\t%s\t.\t%s\n' % (strand, shared)
+            for e, s in zip(exons, exon_scores):
+                lines.append('%sexon\t%d\t%d\t%s%s' % 
+                             (head, e.start + 1, e.end, s, exon_tail))
+        else:
+            exon_tail = '\t%s\t.\t%s%sexon_number "' % (strand, shared, sep)
+            for i, (e, s) in enumerate(zip(exons, exon_scores), 
+                                       start=first_exon_number):
+                lines.append('%sexon\t%d\t%d\t%s%s%d";\n' % 
+                             (head, e.start + 1, e.end, s, exon_tail, i))
+        s = ''.join(lines)
+        self.parts.append(s)
+        self.size += len(s)
+        if self.size >= self.bufsize:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.fileh.write(''.join(self.parts))
+        self.parts = []
+        self.size = 0
+
+    def close(self):
+        self.flush()
+        self.fileh.close()
@@ -0,0 +1,276 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Compiled GTF parser that decodes only a whitelist of attributes when
+each line is parsed. The remaining attributes are decoded the first
+time they are needed. The functions in this module are drop-in
+replacements for 'GTFFeature.parse', 'transcripts_from_gtf_lines' and
+'parse_gtf' with an additional 'attrs' parameter listing the wanted
+attributes.
+'''
+from assemblyline.lib.gtf import GTFFeature, GTF_EMPTY_FIELD, \
+    GTF_ATTR_SEP, GTF_ATTR_TAGVALUE_SEP, ATTR_TABLE, parse_loci
+from assemblyline.lib.transcript import TRANSCRIPT_ID, \
+    transcripts_from_gtf_features
+
+cdef dict decode_attrs(str attr_string, object attr_defs):
+    '''
+    decode all attributes in the same way (and in the same order)
+    as 'GTFFeature.from_string'
+    '''
+    cdef dict attrs = {}
+    cdef str a, tag, value
+    intern_attr = ATTR_TABLE.intern_attr
+    for a in attr_string.split(GTF_ATTR_SEP):
+        a = a.strip()
+        if len(a) == 0:
+            continue
+        tag, value = a.split(GTF_ATTR_TAGVALUE_SEP, 1)
+        # remove quotes
+        value = value.strip('"')
+        # apply parsing function
+        if (attr_defs is not None) and (tag in attr_defs) and (attr_defs[tag] is not None):
+            attrs[intern(tag)] = attr_defs[tag](value)
+        else:
+            tag, value = intern_attr(tag, value)
+            attrs[tag] = value
+    return attrs
+
+cdef object find_attr(str attr_string, str tag):
+    '''
+    returns the undecoded value of the last attribute named 'tag' or
+    None if the attribute does not exist
+    '''
+    cdef str key = tag + GTF_ATTR_TAGVALUE_SEP
+    cdef char *s = <bytes>attr_string
+    cdef Py_ssize_t n = len(attr_string)
+    cdef Py_ssize_t pos = 0, i, end
+    cdef object value = None
+    while True:
+        pos = attr_string.find(key, pos)
+        if pos < 0:
+            break
+        # the tag must be at the beginning of an attribute
+        i = pos - 1
+        while (i >= 0) and (s[i] == c' '):
+            i -= 1
+        pos += len(key)
+        if (i >= 0) and (s[i] != c';'):
+            continue
+        end = pos
+        while (end < n) and (s[end] != c';'):
+            end += 1
+        value = attr_string[pos:end].rstrip().strip('"')
+        pos = end
+    return value
+
+cdef class GTFAttrs:
+    '''
+    dictionary of GTF attributes where only the 'wanted' attributes are
+    decoded when the line is parsed. all attributes are decoded when an
+    attribute outside of 'wanted' is accessed or when the attributes are
+    iterated, copied or modified. decoded attributes behave exactly like
+    the dictionary created by 'GTFFeature.from_string'
+    '''
+    cdef dict attrs
+    cdef str attr_string
+    cdef object attr_defs
+    cdef frozenset wanted
+
+    def __cinit__(self, str attr_string, frozenset wanted, attr_defs=None):
+        cdef str tag
+        self.attrs = {}
+        self.attr_string = attr_string
+        self.attr_defs = attr_defs
+        self.wanted = wanted
+        for tag in wanted:
+            value = find_attr(attr_string, tag)
+            if value is None:
+                continue
+            if (attr_defs is not None) and (tag in attr_defs) and (attr_defs[tag] is not None):
+                value = attr_defs[tag](value)
+            else:
+                tag, value = ATTR_TABLE.intern_attr(tag, value)
+            self.attrs[tag] = value
+
+    cdef dict decode(self):
+        if self.attr_string is not None:
+            self.attrs = decode_attrs(self.attr_string, self.attr_defs)
+            self.attr_string = None
+        return self.attrs
+
+    def __getitem__(self, key):
+        if (self.attr_string is None) or (key in self.attrs):
+            return self.attrs[key]
+        if key in self.wanted:
+            raise KeyError(key)
+        return self.decode()[key]
+
+    def get(self, key, default=None):
+        if (self.attr_string is None) or (key in self.attrs):
+            return self.attrs.get(key, default)
+        if key in self.wanted:
+            return default
+        return self.decode().get(key, default)
+
+    def __contains__(self, key):
+        if (self.attr_string is None) or (key in self.attrs):
+            return key in self.attrs
+        if key in self.wanted:
+            return False
+        return key in self.decode()
+
+    def has_key(self, key):
+        return key in self
+
+    def __setitem__(self, key, value):
+        self.decode()[key] = value
+
+    def __delitem__(self, key):
+        del self.decode()[key]
+
+    def __len__(self):
+        return len(self.decode())
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __richcmp__(GTFAttrs self, other, int op):
+        if isinstance(other, GTFAttrs):
+            other = (<GTFAttrs>other).decode()
+        if op == 2:
+            return self.decode() == other
+        elif op == 3:
+            return self.decode() != other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.decode())
+
+    def __reduce__(self):
+        return (dict, (self.decode(),))
+
+    def keys(self):
+        return self.decode().keys()
+
+    def values(self):
+        return self.decode().values()
+
+    def items(self):
+        return self.decode().items()
+
+    def iterkeys(self):
+        return self.decode().iterkeys()
+
+    def itervalues(self):
+        return self.decode().itervalues()
+
+    def iteritems(self):
+        return self.decode().iteritems()
+
+    def copy(self):
+        return self.decode().copy()
+
+    def update(self, *args, **kwargs):
+        self.decode().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        return self.decode().setdefault(key, default)
+
+    def pop(self, key, *args):
+        return self.decode().pop(key, *args)
+
+    def clear(self):
+        self.decode().clear()
+
+def parse_gtf_line(str line, attr_defs=None, attrs=None):
+    '''
+    parse a GTF line into a GTFFeature. when 'attrs' is None all
+    attributes are decoded, otherwise only the attributes in 'attrs'
+    (which must be a frozenset) are decoded until others are accessed
+    '''
+    cdef list fields
+    cdef str strand
+    f = GTFFeature()
+    # read the GTF line
+    fields = line.strip().split('\t')
+    f.seqid = intern(fields[0])
+    f.source = intern(fields[1])
+    f.feature_type = intern(fields[2])
+    # convert from 1-based (inclusive) to 0-based (exclusive) intervals
+    f.start = int(fields[3])-1
+    f.end = int(fields[4])
+    f.score = 0 if (fields[5] == '.') else float(fields[5])
+    strand = fields[6]
+    if not (strand == '+' or strand == '-'):
+        strand = GTF_EMPTY_FIELD
+    f.strand = strand
+    f.phase = fields[7]
+    if fields[8] == GTF_EMPTY_FIELD:
+        f.attrs = {}
+    elif attrs is None:
+        f.attrs = decode_attrs(fields[8], attr_defs)
+    else:
+        f.attrs = GTFAttrs(fields[8], attrs, attr_defs)
+    return f
+
+def get_wanted_attrs(attrs):
+    '''
+    returns the set of attributes to decode given a sequence of 'attrs'
+    (or None to decode all attributes). the transcript id is always
+    decoded because it is needed to group features into transcripts
+    '''
+    if attrs is None:
+        return None
+    return frozenset(attrs) | frozenset([TRANSCRIPT_ID])
+
+def parse(line_iter, attr_defs=None, attrs=None):
+    '''
+    drop-in replacement for 'GTFFeature.parse'
+    '''
+    attrs = get_wanted_attrs(attrs)
+    for line in line_iter:
+        # read the GTF line
+        if not line:
+            continue
+        if not line.strip():
+            continue
+        if line.startswith("#"):
+            continue
+        yield parse_gtf_line(line, attr_defs, attrs)
+
+def transcripts_from_gtf_lines(lines, attr_defs=None, attrs=None):
+    '''
+    drop-in replacement for 'transcript.transcripts_from_gtf_lines'
+    '''
+    attrs = get_wanted_attrs(attrs)
+    return transcripts_from_gtf_features(parse_gtf_line(line, attr_defs, attrs)
+                                         for line in lines)
+
+def parse_gtf(fileh, attr_defs=None, attrs=None):
+    '''
+    drop-in replacement for 'transcript.parse_gtf'
+    '''
+    attrs = get_wanted_attrs(attrs)
+    for locus_features in parse_loci(fileh):
+        yield transcripts_from_gtf_features(parse_gtf_line(line, attr_defs, attrs)
+                                            for line in locus_features)
@@ -0,0 +1,329 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Compiled reference annotation. A reference GTF file is compiled once
+into a directory of the cache named by the sha1 checksum of the file:
+
+  format.txt         format, version and checksum of the source file
+  reference.gtf      'transcript' and 'exon' features in the order of
+                     'sort_gtf'
+  reference.tstore   transcript store of 'reference.gtf' (exon arrays
+                     and the extent of each locus)
+
+Exons are grouped into transcripts by (seqid, transcript_id) and each
+transcript gets a 'transcript' feature spanning its exons with the
+attributes of its first exon. Other features of the source file
+(including its 'transcript' features) are not kept. Lines are written in the format of 'GTFFeature'. Checksums of
+source files are remembered by path, size and modification time so that
+a reference is only read again when it changes.
+
+References are compiled into a temporary directory of the cache that is
+renamed when complete, so concurrent runs can share a cache directory.
+'''
+import os
+import re
+import shutil
+import hashlib
+import tempfile
+import collections
+
+from gtf import GTFError, GTFFeature, open_gtf, sort_gtf, \
+    sort_gtf_lines, parse_loci, format_gtf_attrs
+from tstore import TranscriptStore, write_transcript_store
+
+REF_CACHE_FORMAT = 'assemblyline_refcache'
+REF_CACHE_VERSION = 2
+REF_CACHE_FORMAT_FILE = 'format.txt'
+REF_CACHE_GTF_FILE = 'reference.gtf'
+REF_CACHE_STORE = 'reference.tstore'
+# file of known checksums in a cache directory
+REF_CACHE_CHECKSUMS_FILE = 'checksums.txt'
+# suffix of the cache directory created alongside a reference GTF file
+REF_CACHE_SUFFIX = '.refcache'
+# size of blocks read when computing checksums
+HASH_BLOCK_SIZE = (1 << 20)
+
+_GENE_ID_RE = re.compile(r'gene_id "([^"]*)"')
+
+def hash_file(filename, h):
+    fileh = open(filename, 'rb')
+    while True:
+        data = fileh.read(HASH_BLOCK_SIZE)
+        if not data:
+            break
+        h.update(data)
+    fileh.close()
+
+def _file_stamp(filename):
+    st = os.stat(filename)
+    return (os.path.abspath(filename), str(st.st_size), repr(st.st_mtime))
+
+def file_checksum(filename, checksum_dir):
+    '''
+    returns the sha1 checksum of 'filename'. checksums are kept in
+    'checksum_dir' and reused while the size and modification time of
+    the file are unchanged
+    '''
+    stamp = _file_stamp(filename)
+    checksums_file = os.path.join(checksum_dir, REF_CACHE_CHECKSUMS_FILE)
+    checksums = collections.OrderedDict()
+    if os.path.exists(checksums_file):
+        for line in open(checksums_file):
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) == 4:
+                checksums[tuple(fields[:3])] = fields[3]
+    checksum = checksums.get(stamp)
+    if checksum is not None:
+        return checksum
+    h = hashlib.sha1()
+    hash_file(filename, h)
+    checksum = h.hexdigest()
+    # forget earlier versions of the same file
+    for k in checksums.keys():
+        if k[0] == stamp[0]:
+            del checksums[k]
+    checksums[stamp] = checksum
+    if not os.path.exists(checksum_dir):
+        os.makedirs(checksum_dir)
+    fd, tmp_filename = tempfile.mkstemp(dir=checksum_dir, 
+                                        prefix=REF_CACHE_CHECKSUMS_FILE)
+    fileh = os.fdopen(fd, 'w')
+    for k, v in checksums.iteritems():
+        print >>fileh, '\t'.join(k + (v,))
+    fileh.close()
+    os.rename(tmp_filename, checksums_file)
+    return checksum
+
+def reference_checksum(ref_gtf_file, cache_dir):
+    '''
+    returns the sha1 checksum of 'ref_gtf_file' remembered in the 
+    reference cache 'cache_dir'
+    '''
+    return file_checksum(ref_gtf_file, cache_dir)
+
+def _is_writable_dir(path):
+    '''
+    returns True if files can be created in the directory 'path', 
+    creating it if necessary
+    '''
+    try:
+        if not os.path.exists(path):
+            os.makedirs(path)
+        fd, filename = tempfile.mkstemp(dir=path)
+    except (OSError, IOError):
+        return False
+    os.close(fd)
+    os.remove(filename)
+    return True
+
+def default_cache_dir(ref_gtf_file, fallback_dir):
+    '''
+    returns the cache directory alongside 'ref_gtf_file', or a cache 
+    directory in 'fallback_dir' when the directory of the reference 
+    cannot be written
+    '''
+    cache_dir = ref_gtf_file + REF_CACHE_SUFFIX
+    if _is_writable_dir(cache_dir):
+        return cache_dir
+    return os.path.join(fallback_dir, os.path.basename(cache_dir))
+
+def is_reference_cache(path):
+    '''
+    returns True if 'path' is a compiled reference with the current
+    format
+    '''
+    format_file = os.path.join(path, REF_CACHE_FORMAT_FILE)
+    if not os.path.isfile(format_file):
+        return False
+    fields = open(format_file).readline().strip().split('\t')
+    return fields[:2] == [REF_CACHE_FORMAT, str(REF_CACHE_VERSION)]
+
+def _make_transcript_feature(exons):
+    '''
+    returns a 'transcript' feature spanning the sorted exon features 
+    'exons' in the same format as the transcripts added by 
+    'aggregate_transcripts'
+    '''
+    f = GTFFeature()
+    f.seqid = exons[0].seqid
+    f.source = exons[0].source
+    f.feature_type = 'transcript'
+    f.start = exons[0].start
+    f.end = exons[-1].end
+    f.score = exons[0].score
+    f.strand = exons[0].strand
+    f.phase = '.'
+    f.attrs = exons[0].attrs.copy()
+    if "exon_number" in f.attrs:
+        del f.attrs["exon_number"]
+    return f
+
+def _write_normalized_gtf(ref_gtf_file, fileh):
+    '''
+    write the exons of 'ref_gtf_file' grouped by transcript with a
+    'transcript' feature for each transcript. returns the number of
+    transcripts
+    '''
+    # (seqid, transcript_id) -> list of exon features
+    exon_dict = collections.OrderedDict()
+    for f in GTFFeature.parse(open_gtf(ref_gtf_file)):
+        if f.feature_type != 'exon':
+            continue
+        t_id = f.attrs.get('transcript_id')
+        if t_id is None:
+            raise GTFError("Exon without 'transcript_id' attribute: %s" %
+                           (str(f)))
+        key = (f.seqid, t_id)
+        exons = exon_dict.get(key)
+        if exons is None:
+            exons = []
+            exon_dict[key] = exons
+        exons.append(f)
+    for exons in exon_dict.itervalues():
+        # sort exons by start position
+        exons.sort(key=lambda x: x.start)
+        print >>fileh, str(_make_transcript_feature(exons))
+        for x in exons:
+            print >>fileh, str(x)
+    return len(exon_dict)
+
+def compile_reference(ref_gtf_file, cache_dir, tmp_dir=None):
+    '''
+    compile 'ref_gtf_file' into 'cache_dir' unless it has already been
+    compiled and return the 'ReferenceCache'
+    '''
+    checksum = reference_checksum(ref_gtf_file, cache_dir)
+    path = os.path.join(cache_dir, checksum)
+    if is_reference_cache(path):
+        return ReferenceCache(path)
+    # compile into a temporary directory of this process and then 
+    # install it unless another process installed the reference first
+    tmp_path = tempfile.mkdtemp(dir=cache_dir, prefix=checksum + '.')
+    stale_path = tmp_path + '.stale'
+    try:
+        _compile_reference(ref_gtf_file, checksum, tmp_path, tmp_dir)
+        if not is_reference_cache(path):
+            # a cache compiled with an earlier format is renamed aside
+            # rather than deleted in place. a cache installed by another
+            # process since the check above is put back instead
+            try:
+                os.rename(path, stale_path)
+            except OSError:
+                pass
+            else:
+                if is_reference_cache(stale_path):
+                    shutil.rmtree(tmp_path)
+                    os.rename(stale_path, tmp_path)
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                if not is_reference_cache(path):
+                    raise
+    finally:
+        for p in (tmp_path, stale_path):
+            if os.path.exists(p):
+                shutil.rmtree(p)
+    return ReferenceCache(path)
+
+def _compile_reference(ref_gtf_file, checksum, tmp_path, tmp_dir):
+    '''
+    write the compiled reference of 'ref_gtf_file' to 'tmp_path'
+    '''
+    unsorted_gtf_file = os.path.join(tmp_path, 'reference.unsorted.gtf')
+    fileh = open(unsorted_gtf_file, 'w')
+    _write_normalized_gtf(ref_gtf_file, fileh)
+    fileh.close()
+    sort_gtf(unsorted_gtf_file, os.path.join(tmp_path, REF_CACHE_GTF_FILE),
+             tmp_dir=(tmp_path if tmp_dir is None else tmp_dir))
+    os.remove(unsorted_gtf_file)
+    write_transcript_store(os.path.join(tmp_path, REF_CACHE_GTF_FILE),
+                           os.path.join(tmp_path, REF_CACHE_STORE))
+    fileh = open(os.path.join(tmp_path, REF_CACHE_FORMAT_FILE), 'w')
+    print >>fileh, '\t'.join([REF_CACHE_FORMAT, str(REF_CACHE_VERSION),
+                              checksum])
+    fileh.close()
+
+def get_reference_cache(ref_gtf_file, cache_dir=None, tmp_dir=None):
+    '''
+    returns the 'ReferenceCache' of 'ref_gtf_file', compiling it first
+    if necessary. by default the cache directory is created alongside
+    the reference GTF file, or in 'tmp_dir' (the system temporary 
+    directory when None) when the directory of the reference cannot be
+    written
+    '''
+    if cache_dir is None:
+        cache_dir = default_cache_dir(ref_gtf_file, tempfile.gettempdir() 
+                                      if tmp_dir is None else tmp_dir)
+    return compile_reference(ref_gtf_file, cache_dir, tmp_dir)
+
+class ReferenceCache(object):
+    '''
+    reads a compiled reference
+    '''
+    def __init__(self, path):
+        if not is_reference_cache(path):
+            raise GTFError("'%s' is not a compiled reference (format %s "
+                           "version %d)" % (path, REF_CACHE_FORMAT,
+                                            REF_CACHE_VERSION))
+        self.path = path
+        format_file = os.path.join(path, REF_CACHE_FORMAT_FILE)
+        self.checksum = open(format_file).readline().strip().split('\t')[2]
+        self.gtf_file = os.path.join(path, REF_CACHE_GTF_FILE)
+        self.store_path = os.path.join(path, REF_CACHE_STORE)
+        self._store = None
+
+    def store(self):
+        '''
+        returns the 'TranscriptStore' of the reference transcripts
+        '''
+        if self._store is None:
+            self._store = TranscriptStore(self.store_path)
+        return self._store
+
+    def iterloci(self, attr_defs=None, compact=True):
+        '''
+        generator yielding the list of reference transcripts of each
+        locus in the same way as 'parse_gtf'
+        '''
+        return self.store().iterloci(attr_defs, compact)
+
+    def write_gtf(self, fileh, attr_func=None):
+        '''
+        write the reference as a sorted GTF file. 'attr_func' is called
+        with the gene id of each line (or None) and returns a sequence
+        of (tag, value) attributes appended to the line
+        '''
+        for lines in parse_loci(open(self.gtf_file)):
+            if attr_func is not None:
+                new_lines = []
+                for line in lines:
+                    m = _GENE_ID_RE.search(line)
+                    attrs = attr_func(None if m is None else m.group(1))
+                    if attrs:
+                        line = line + ' ' + format_gtf_attrs(attrs)
+                    new_lines.append(line)
+                # appended attributes can change the order of lines with
+                # the same position
+                lines = sorted(new_lines)
+                sort_gtf_lines(lines)
+            for line in lines:
+                print >>fileh, line
@@ -57,8 +57,16 @@ DAMAGE.
 #
 # Heavily adapted for use by SciPy 2002 by Travis Oliphant
 """
+import math
+import bisect
+import collections
+from array import array
+
 import numpy as np
 
+# relative accuracy of the scores returned by ScoreSketch
+SKETCH_ACCURACY = 0.01
+
 def _interpolate(a, b, fraction):
     """Returns the point at the given fraction between a and b, where
     'fraction' must be between 0 and 1.
@@ -123,15 +131,15 @@ def scoreatpercentile(a, per, limit=(), interpolation_method='fraction'):
         values = values[(limit[0] <= values) & (values <= limit[1])]
     idx = per /100. * (values.shape[0] - 1)
     if (idx % 1 == 0):
-        score = values[idx]
+        score = values[int(idx)]
     else:
         if interpolation_method == 'fraction':
             score = _interpolate(values[int(idx)], values[int(idx) + 1],
                                  idx % 1)
         elif interpolation_method == 'lower':
-            score = values[np.floor(idx)]
+            score = values[int(np.floor(idx))]
         elif interpolation_method == 'higher':
-            score = values[np.ceil(idx)]
+            score = values[int(np.ceil(idx))]
         else:
             raise ValueError("interpolation_method can only be 'fraction', " \
                              "'lower' or 'higher'")
@@ -269,3 +277,190 @@ class ECDF(StepFunction):
         nobs = len(x)
         y = np.linspace(1./nobs,1,nobs)
         super(ECDF, self).__init__(x, y, side=side, sorted=True)
+
+def scoresatpercentiles(values, pers):
+    """
+    Calculate the scores at each of the percentiles `pers` of the sorted
+    array `values` with the interpolation of `scoreatpercentile`. The 
+    array is sorted only once rather than once per percentile. Returns 
+    NaN for each percentile of an empty array.
+    """
+    scores = []
+    n = len(values)
+    for per in pers:
+        if n == 0:
+            scores.append(float('nan'))
+            continue
+        idx = per / 100. * (n - 1)
+        i = int(idx)
+        if (idx % 1 == 0):
+            scores.append(values[i])
+        else:
+            scores.append(_interpolate(values[i], values[i + 1], idx % 1))
+    return scores
+
+class ScoreSketch(object):
+    """
+    Approximate distribution of a stream of scores in bounded memory.
+
+    Scores are counted in logarithmically sized bins, such that the 
+    scores at percentiles are within a relative error `accuracy` of the
+    true (interpolated) scores when the scores on either side of the 
+    percentile have the same sign (the minimum and maximum are exact), 
+    and the number of bins grows only with the logarithm of the range of
+    the scores.
+    """
+    def __init__(self, accuracy=SKETCH_ACCURACY):
+        self.gamma = (1.0 + accuracy) / (1.0 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        # bins of positive scores are keyed by a positive integer and 
+        # bins of negative scores by a negative integer
+        self.bins = collections.defaultdict(int)
+        self.num_zero = 0
+        self.n = 0
+        self.min = None
+        self.max = None
+        self.uppers = None
+        self.counts = None
+
+    def _key(self, x):
+        return int(math.ceil(math.log(abs(x)) / self.log_gamma))
+
+    def add(self, x):
+        if x > 0:
+            self.bins[(self._key(x), 1)] += 1
+        elif x < 0:
+            self.bins[(self._key(x), -1)] += 1
+        else:
+            self.num_zero += 1
+        self.n += 1
+        if (self.min is None) or (x < self.min):
+            self.min = x
+        if (self.max is None) or (x > self.max):
+            self.max = x
+        self.uppers = None
+
+    def _build(self):
+        # the bins in order of score with their upper bounds
+        bins = []
+        for (k, sign), count in self.bins.iteritems():
+            if sign > 0:
+                bins.append((self.gamma ** k, 2 * self.gamma ** k / 
+                             (self.gamma + 1), count))
+            else:
+                bins.append((-(self.gamma ** (k - 1)), 
+                             -2 * self.gamma ** k / (self.gamma + 1), count))
+        if self.num_zero > 0:
+            bins.append((0.0, 0.0, self.num_zero))
+        bins.sort()
+        self.uppers = [upper for upper, value, count in bins]
+        self.values = [min(max(value, self.min), self.max) 
+                       for upper, value, count in bins]
+        self.counts = [0]
+        for upper, value, count in bins:
+            self.counts.append(self.counts[-1] + count)
+
+    def rank(self, x):
+        """
+        Returns the approximate fraction of scores less than `x`, 
+        counting the scores in the bins whose upper bound is less than 
+        `x`.
+        """
+        if self.uppers is None:
+            self._build()
+        i = bisect.bisect_left(self.uppers, x)
+        return self.counts[i] / float(self.n)
+
+    def _score_at_rank(self, i):
+        # the smallest and largest scores are exact, other scores are
+        # the value of the bin holding the i-th smallest score
+        if i <= 0:
+            return self.min
+        if i >= self.n - 1:
+            return self.max
+        j = bisect.bisect_right(self.counts, i) - 1
+        return self.values[min(j, len(self.values) - 1)]
+
+    def scoresatpercentiles(self, pers):
+        """
+        Returns the scores at each of the percentiles `pers` with the
+        interpolation of `scoresatpercentiles`. The scores on either side
+        of a percentile are each within `accuracy` of the true scores, 
+        so the interpolated score is as well when they have the same sign.
+        """
+        if self.uppers is None:
+            self._build()
+        scores = []
+        for per in pers:
+            if self.n == 0:
+                scores.append(float('nan'))
+                continue
+            idx = per / 100. * (self.n - 1)
+            i = int(idx)
+            if (idx % 1 == 0):
+                scores.append(self._score_at_rank(i))
+            else:
+                scores.append(_interpolate(self._score_at_rank(i),
+                                           self._score_at_rank(i + 1),
+                                           idx % 1))
+        return scores
+
+class ScoreDistribution(object):
+    """
+    Distribution of a stream of scores used to compute percentile ranks
+    and the scores at percentiles.
+
+    Scores are kept exactly until there are more than `max_exact` of
+    them (zero places no limit), after which they are counted in a 
+    ScoreSketch instead. Exact percentile ranks are the same as those of
+    `ECDF(scores, side='left')`.
+    """
+    def __init__(self, max_exact=0, accuracy=SKETCH_ACCURACY):
+        self.max_exact = max_exact
+        self.accuracy = accuracy
+        self.scores = array('d')
+        self.values = None
+        self.sketch = None
+
+    def __len__(self):
+        if self.sketch is not None:
+            return self.sketch.n
+        return len(self.scores)
+
+    def is_approximate(self):
+        return self.sketch is not None
+
+    def add(self, x):
+        if self.sketch is not None:
+            self.sketch.add(x)
+            return
+        self.scores.append(x)
+        self.values = None
+        if (self.max_exact > 0) and (len(self.scores) > self.max_exact):
+            self.sketch = ScoreSketch(self.accuracy)
+            for score in self.scores:
+                self.sketch.add(score)
+            self.scores = None
+
+    def _sorted(self):
+        if self.values is None:
+            if len(self.scores) == 0:
+                self.values = np.zeros(0, dtype=float)
+            else:
+                self.values = np.sort(np.frombuffer(self.scores, 
+                                                    dtype=float))
+        return self.values
+
+    def pctrank(self, x):
+        """
+        Returns the percentage of scores less than `x`.
+        """
+        if self.sketch is not None:
+            return 100.0 * self.sketch.rank(x)
+        values = self._sorted()
+        return 100.0 * np.searchsorted(values, x, 'left') / len(values)
+
+    def scoresatpercentiles(self, pers):
+        if self.sketch is not None:
+            return self.sketch.scoresatpercentiles(pers)
+        return scoresatpercentiles(self._sorted(), pers)
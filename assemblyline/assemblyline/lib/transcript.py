@@ -27,6 +27,18 @@ from gtf import parse_loci, GTFFeature, GTFError
 TRANSCRIPT_ID = "transcript_id"
 GENE_ID = "gene_id"
 
+def ordered_attr_items(attrs):
+    '''
+    returns the (tag, value) items of a dictionary of GTF attributes with
+    'gene_id' and 'transcript_id' first and the other tags in sorted
+    order, which does not depend on how the attributes were read
+    '''
+    items = sorted(attrs.iteritems())
+    first = [(tag, attrs[tag]) for tag in (GENE_ID, TRANSCRIPT_ID)
+             if tag in attrs]
+    return first + [x for x in items 
+                    if x[0] != GENE_ID and x[0] != TRANSCRIPT_ID]
+
 # strand constants
 POS_STRAND = 0
 NEG_STRAND = 1
@@ -178,11 +190,209 @@ class Transcript(object):
             f.attrs["exon_number"] = i
             features.append(f)
         return features
+
+    def write_gtf(self, writer, source=None, score=1000, ordered=False):
+        '''
+        write the transcript and its exons to a 'GTFWriter' in the same
+        format as 'to_gtf_features'. if 'ordered' is True the attributes
+        are written in the order of 'ordered_attr_items'
+        '''
+        if source is None:
+            source = 'assemblyline'
+        attrs = self.attrs
+        if ordered:
+            attrs = ordered_attr_items(attrs)
+        writer.write_transcript(self.chrom, strand_int_to_str(self.strand),
+                                self.exons, attrs, source=source,
+                                score=score, first_exon_number=0,
+                                start=self.start, end=self.end)
     
-def transcripts_from_gtf_lines(lines, attr_defs=None):
+class ExonArray(object):
+    '''
+    read-only sequence of the exons of a transcript stored as the rows
+    lo:hi of arrays of exon start and end positions. the arrays may be
+    shared by all of the transcripts of a locus (CSR form). exons are
+    returned as 'Exon' objects
+    '''
+    __slots__ = ('starts', 'ends', 'lo', 'hi')
+
+    def __init__(self, starts, ends, lo=0, hi=None):
+        self.starts = starts
+        self.ends = ends
+        self.lo = lo
+        self.hi = len(starts) if hi is None else hi
+
+    def __len__(self):
+        return self.hi - self.lo
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in xrange(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if (i < 0) or (i >= len(self)):
+            raise IndexError('exon index out of range')
+        i += self.lo
+        return Exon(self.starts[i], self.ends[i])
+
+    def __iter__(self):
+        starts = self.starts
+        ends = self.ends
+        for i in xrange(self.lo, self.hi):
+            yield Exon(starts[i], ends[i])
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # only the rows of this transcript are pickled
+        return (ExonArray, (self.starts[self.lo:self.hi], 
+                            self.ends[self.lo:self.hi]))
+
+class SharedAttrs(object):
+    '''
+    dictionary of GTF attributes stored as a tuple of keys that is shared
+    by every transcript with the same attribute layout and a tuple of 
+    values (that are themselves shared through a string table). the 
+    attributes are copied into a private dictionary the first time they
+    are modified, and otherwise behave like the dictionary created by
+    'GTFFeature.from_string'
+    '''
+    __slots__ = ('keys_', 'values_', 'data')
+
+    def __init__(self, keys, values):
+        self.keys_ = keys
+        self.values_ = values
+        self.data = None
+
+    def decode(self):
+        if self.data is None:
+            self.data = dict(zip(self.keys_, self.values_))
+            self.keys_ = None
+            self.values_ = None
+        return self.data
+
+    def __getitem__(self, key):
+        if self.data is not None:
+            return self.data[key]
+        try:
+            return self.values_[self.keys_.index(key)]
+        except ValueError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        if self.data is not None:
+            return self.data.get(key, default)
+        if key in self.keys_:
+            return self.values_[self.keys_.index(key)]
+        return default
+
+    def __contains__(self, key):
+        if self.data is not None:
+            return key in self.data
+        return key in self.keys_
+
+    def has_key(self, key):
+        return key in self
+
+    def __len__(self):
+        if self.data is not None:
+            return len(self.data)
+        return len(self.keys_)
+
+    def __iter__(self):
+        if self.data is not None:
+            return iter(self.data)
+        return iter(self.keys_)
+
+    def iterkeys(self):
+        return iter(self)
+
+    def itervalues(self):
+        if self.data is not None:
+            return self.data.itervalues()
+        return iter(self.values_)
+
+    def iteritems(self):
+        if self.data is not None:
+            return self.data.iteritems()
+        return iter(zip(self.keys_, self.values_))
+
+    def keys(self):
+        return list(self.iterkeys())
+
+    def values(self):
+        return list(self.itervalues())
+
+    def items(self):
+        return list(self.iteritems())
+
+    def copy(self):
+        return dict(self.iteritems())
+
+    def __eq__(self, other):
+        if isinstance(other, SharedAttrs):
+            other = other.copy()
+        return self.copy() == other
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def __setitem__(self, key, value):
+        self.decode()[key] = value
+
+    def __delitem__(self, key):
+        del self.decode()[key]
+
+    def update(self, *args, **kwargs):
+        self.decode().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        return self.decode().setdefault(key, default)
+
+    def pop(self, key, *args):
+        return self.decode().pop(key, *args)
+
+    def clear(self):
+        self.decode().clear()
+
+class CompactTranscript(Transcript):
+    '''
+    transcript with exons stored as an 'ExonArray' and attributes stored
+    as 'SharedAttrs'. behaves like a 'Transcript' but uses a fraction of 
+    the memory when many transcripts are held at once
+    '''
+    __slots__ = ()
+
+    @property
+    def length(self):
+        exons = self.exons
+        ends = exons.ends
+        starts = exons.starts
+        return sum(ends[i] - starts[i] for i in xrange(exons.lo, exons.hi))
+
+    def iterintrons(self):
+        exons = self.exons
+        ends = exons.ends
+        starts = exons.starts
+        for i in xrange(exons.lo + 1, exons.hi):
+            yield ends[i-1], starts[i]
+
+def transcripts_from_gtf_features(features):
     transcripts = collections.OrderedDict()
-    for line in lines:
-        feature = GTFFeature.from_string(line, attr_defs)
+    for feature in features:
         t_id = feature.attrs["transcript_id"]
         if t_id not in transcripts:            
             if feature.feature_type != "transcript":
@@ -207,6 +417,10 @@ def transcripts_from_gtf_lines(lines, attr_defs=None):
         t.exons.sort()
     return transcripts.values()
 
+def transcripts_from_gtf_lines(lines, attr_defs=None):
+    return transcripts_from_gtf_features(GTFFeature.from_string(line, attr_defs)
+                                         for line in lines)
+
 def parse_gtf(fileh, attr_defs=None):
     for locus_features in parse_loci(fileh):
         yield transcripts_from_gtf_lines(locus_features, attr_defs)
\ No newline at end of file
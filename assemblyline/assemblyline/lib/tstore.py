@@ -0,0 +1,859 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+
+AssemblyLine: transcriptome meta-assembly from RNA-Seq
+
+Copyright (C) 2012 Matthew Iyer
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Binary columnar store of the transcripts in a sorted GTF file. A store
+is a directory of numpy arrays:
+
+  chrom, start, end, strand        one row per 'transcript' feature
+  exon_ptr, exon_start, exon_end   exons of transcript i are the rows
+                                   exon_ptr[i]:exon_ptr[i+1]
+  locus_*                          loci as defined by 'parse_loci' where
+                                   locus_ptr delimits the transcripts
+
+The GTF source, score and phase fields and the attributes of the
+transcript and exon features are stored as columns of strings. Columns
+with few distinct values are dictionary-encoded (codes into a single
+string table) and columns with many distinct values, such as transcript
+ids and scores, are stored as raw strings ('name_data' and 'name_ptr').
+The order of the attributes on each line is stored as a 'layout' so that
+reading a store gives the same transcripts as parsing the GTF file, and
+the GTF file can be exported again in sorted order. Only 'transcript' and
+'exon' features are stored.
+
+Stores are written one locus at a time and the columns are appended to
+files in batches, so that the memory used by the writer does not depend
+on the size of the GTF file.
+'''
+import os
+import array
+import shutil
+import tempfile
+import collections
+import numpy as np
+
+from gtf import GTFError, GTF_EMPTY_FIELD, GTF_ATTR_SEP, \
+    GTF_ATTR_TAGVALUE_SEP, parse_loci, open_gtf
+from transcript import Transcript, Exon, CompactTranscript, ExonArray, \
+    SharedAttrs, TRANSCRIPT_ID, GENE_ID, strand_str_to_int, strand_int_to_str
+from base import GTFAttr
+
+# suffix of transcript store created alongside a GTF file
+TSTORE_SUFFIX = '.tstore'
+TSTORE_FORMAT = 'assemblyline_tstore'
+TSTORE_VERSION = 2
+TSTORE_FORMAT_FILE = 'format.txt'
+# code of attributes that are absent from a feature
+MISSING = -1
+# columns of the GTF fields of each feature
+FIELD_COLUMNS = ('source', 'score', 'phase')
+# attributes with a different value on nearly every line are stored as
+# raw strings from the start
+RAW_ATTRS = (TRANSCRIPT_ID, GENE_ID, GTFAttr.SCORE)
+# columns with more distinct values are stored as raw strings
+TSTORE_MAX_CODES = 4096
+# number of rows written by the writer before the columns are appended
+# to their files
+TSTORE_BATCH_ROWS = (1 << 16)
+# size of blocks copied when saving columns
+COPY_BLOCK_SIZE = (1 << 20)
+
+def parse_attr_items(attr_string):
+    '''
+    parse a GTF attribute string in the same way as 'GTFFeature.from_string'
+    but return a list of (tag, value) tuples in the order in which the
+    tags appear. repeated tags keep their first position and last value
+    '''
+    attrs = collections.OrderedDict()
+    if attr_string == GTF_EMPTY_FIELD:
+        return []
+    for a in attr_string.split(GTF_ATTR_SEP):
+        a = a.strip()
+        if len(a) == 0:
+            continue
+        tag, value = a.split(GTF_ATTR_TAGVALUE_SEP, 1)
+        # remove quotes
+        attrs[tag] = value.strip('"')
+    return attrs.items()
+
+def format_gtf_line(chrom, source, feature_type, start, end, score,
+                    strand, phase, attr_items):
+    '''
+    returns a GTF line in the same format as 'GTFFeature.__str__'
+    '''
+    attr_str = ' '.join('%s "%s";' % (k, v) for (k, v) in attr_items)
+    return '\t'.join([chrom, source, feature_type, str(start + 1), str(end),
+                      score, strand, phase, attr_str])
+
+def sort_locus_gtf_lines(lines):
+    '''
+    sort a list of (line, feature_type, start, ...) tuples from a single
+    locus in the same order as 'sort_gtf' (by start position, then with
+    'transcript' features before 'exon' features, then by the text of
+    the line)
+    '''
+    lines.sort(key=lambda x: x[0])
+    lines.sort(key=lambda x: x[1], reverse=True)
+    lines.sort(key=lambda x: x[2])
+
+def transcript_store_is_current(gtf_file, path):
+    '''
+    returns True if the transcript store exists, is newer than the GTF
+    file, and has the current format
+    '''
+    if not is_transcript_store(path):
+        return False
+    format_file = os.path.join(path, TSTORE_FORMAT_FILE)
+    if os.path.getmtime(format_file) < os.path.getmtime(gtf_file):
+        return False
+    return True
+
+def is_transcript_store(path):
+    '''
+    returns True if 'path' is a transcript store with the current format
+    '''
+    format_file = os.path.join(path, TSTORE_FORMAT_FILE)
+    if not os.path.isfile(format_file):
+        return False
+    fields = open(format_file).readline().strip().split('\t')
+    return fields == [TSTORE_FORMAT, str(TSTORE_VERSION)]
+
+def _to_array(values, dtype):
+    if len(values) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.frombuffer(values, dtype=values.typecode).astype(dtype)
+
+def _save_raw(raw_filename, filename, dtype, size):
+    '''
+    convert a file of 'size' raw values of type 'dtype' to a numpy array
+    file. the raw file is removed
+    '''
+    fileh = open(filename, 'wb')
+    np.lib.format.write_array_header_1_0(fileh, 
+        {'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+         'fortran_order': False,
+         'shape': (size,)})
+    raw_fileh = open(raw_filename, 'rb')
+    shutil.copyfileobj(raw_fileh, fileh, COPY_BLOCK_SIZE)
+    raw_fileh.close()
+    fileh.close()
+    os.remove(raw_filename)
+
+class Dictionary(object):
+    '''
+    assigns consecutive integer codes to distinct values
+    '''
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+class ColumnFile(object):
+    '''
+    column of numbers that are kept in memory until 'flush' appends them
+    to a raw file. the column is saved as the numpy array 'name.npy' by
+    'close'. a column created after 'num_rows' rows have been written
+    starts with 'num_rows' copies of 'fill'
+    '''
+    def __init__(self, path, name, typecode, dtype, num_rows=0, fill=0):
+        self.filename = os.path.join(path, name + '.npy')
+        self.raw_filename = self.filename + '.raw'
+        self.typecode = typecode
+        self.dtype = dtype
+        self.fileh = open(self.raw_filename, 'wb')
+        self.size = 0
+        self.values = array.array(typecode)
+        while self.size < num_rows:
+            n = min(num_rows - self.size, TSTORE_BATCH_ROWS)
+            self.values = array.array(typecode, [fill]) * n
+            self.flush()
+
+    def __len__(self):
+        return self.size + len(self.values)
+
+    def append(self, value):
+        self.values.append(value)
+
+    def flush(self):
+        if len(self.values) > 0:
+            _to_array(self.values, self.dtype).tofile(self.fileh)
+            self.size += len(self.values)
+            self.values = array.array(self.typecode)
+
+    def close(self):
+        self.flush()
+        self.fileh.close()
+        _save_raw(self.raw_filename, self.filename, self.dtype, self.size)
+
+class StringColumnFile(object):
+    '''
+    column of strings written in the same way as 'ColumnFile' and saved
+    as a byte array 'name_data' and offsets 'name_ptr' (the same form
+    as 'save_strings')
+    '''
+    def __init__(self, path, name, num_rows=0):
+        self.filename = os.path.join(path, name + '_data.npy')
+        self.raw_filename = self.filename + '.raw'
+        self.fileh = open(self.raw_filename, 'wb')
+        self.ptr = ColumnFile(path, name + '_ptr', 'l', np.int64, 
+                              num_rows + 1, 0)
+        self.offset = 0
+        self.values = []
+
+    def append(self, value):
+        self.values.append(value)
+        self.offset += len(value)
+        self.ptr.append(self.offset)
+
+    def flush(self):
+        if self.values:
+            self.fileh.write(''.join(self.values))
+            self.values = []
+        self.ptr.flush()
+
+    def close(self):
+        self.flush()
+        self.fileh.close()
+        _save_raw(self.raw_filename, self.filename, np.uint8, self.offset)
+        self.ptr.close()
+
+class FieldColumn(object):
+    '''
+    column of the values of a GTF field or attribute. values are stored
+    as codes into the string table of the store until the column has
+    more than 'max_codes' distinct values and as raw strings after that
+    '''
+    def __init__(self, path, name, strings, num_rows=0, raw=False, 
+                 max_codes=TSTORE_MAX_CODES):
+        self.path = path
+        self.name = name
+        self.strings = strings
+        self.max_codes = max_codes
+        if raw:
+            self.codes = None
+            self.column = StringColumnFile(path, name, num_rows)
+        else:
+            # string table codes of the values of this column
+            self.codes = {}
+            self.column = ColumnFile(path, name, 'i', np.int32, num_rows, 
+                                     MISSING)
+
+    def append(self, value):
+        if self.codes is None:
+            self.column.append(value)
+            return
+        code = self.codes.get(value)
+        if code is None:
+            if len(self.codes) == self.max_codes:
+                self.to_raw()
+                self.column.append(value)
+                return
+            code = self.strings.encode(value)
+            self.codes[value] = code
+        self.column.append(code)
+
+    def append_missing(self):
+        if self.codes is None:
+            self.column.append('')
+        else:
+            self.column.append(MISSING)
+
+    def to_raw(self):
+        '''
+        convert the codes written so far to raw strings
+        '''
+        codes = self.column
+        codes.flush()
+        codes.fileh.close()
+        values = dict((code, value) for value, code in self.codes.iteritems())
+        values[MISSING] = ''
+        self.codes = None
+        self.column = StringColumnFile(self.path, self.name)
+        fileh = open(codes.raw_filename, 'rb')
+        while True:
+            block = np.fromfile(fileh, dtype=np.int32, 
+                                count=TSTORE_BATCH_ROWS)
+            if len(block) == 0:
+                break
+            for code in block.tolist():
+                self.column.append(values[code])
+            self.column.flush()
+        fileh.close()
+        os.remove(codes.raw_filename)
+
+    def flush(self):
+        self.column.flush()
+
+    def close(self):
+        self.column.close()
+
+class FeatureColumns(object):
+    '''
+    writes the GTF fields and attributes of the transcript or exon 
+    features of a store (columns named with 'prefix')
+    '''
+    def __init__(self, path, prefix, strings, keys, layouts, 
+                 max_codes=TSTORE_MAX_CODES):
+        self.path = path
+        self.prefix = prefix
+        self.strings = strings
+        self.keys = keys
+        self.layouts = layouts
+        self.max_codes = max_codes
+        self.num_rows = 0
+        self.fields = [FieldColumn(path, prefix + name, strings, 
+                                   max_codes=max_codes)
+                       for name in FIELD_COLUMNS]
+        self.layout = ColumnFile(path, prefix + 'layout', 'i', np.int32)
+        # attribute columns by key code
+        self.attrs = {}
+
+    def append(self, source, score, phase, attr_items):
+        fields = self.fields
+        fields[0].append(source)
+        fields[1].append(score)
+        fields[2].append(phase)
+        values = {}
+        for tag, value in attr_items:
+            k = self.keys.encode(tag)
+            values[k] = value
+            if k not in self.attrs:
+                # rows written before the attribute occurred lack it
+                self.attrs[k] = FieldColumn(self.path, 
+                                            '%sattr%d' % (self.prefix, k),
+                                            self.strings, self.num_rows,
+                                            tag in RAW_ATTRS, self.max_codes)
+        key_ids = tuple(self.keys.encode(tag) for tag, value in attr_items)
+        self.layout.append(self.layouts.encode(key_ids))
+        for k, col in self.attrs.iteritems():
+            value = values.get(k)
+            if value is None:
+                col.append_missing()
+            else:
+                col.append(value)
+        self.num_rows += 1
+
+    def columns(self):
+        return self.fields + [self.layout] + self.attrs.values()
+
+def save_strings(strings, name, arrays):
+    '''
+    add a list of strings to 'arrays' as a byte array 'name_data' and
+    offsets 'name_ptr'
+    '''
+    ptr = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in strings], out=ptr[1:])
+    arrays[name + '_data'] = np.frombuffer(''.join(strings) or '\0',
+                                           dtype=np.uint8)[:ptr[-1]].copy()
+    arrays[name + '_ptr'] = ptr
+
+class TranscriptStoreWriter(object):
+    '''
+    writes the transcripts of a sorted GTF file to a transcript store one
+    locus at a time. the store is written to a temporary directory next
+    to 'path' that replaces 'path' when the writer is closed
+    '''
+    def __init__(self, path, max_codes=TSTORE_MAX_CODES):
+        self.path = path
+        parent_dir = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(parent_dir):
+            os.makedirs(parent_dir)
+        self.tmp_path = tempfile.mkdtemp(prefix=os.path.basename(path) + '.',
+                                         suffix='.tmp', dir=parent_dir)
+        self.strings = Dictionary()
+        self.chroms = Dictionary()
+        self.keys = Dictionary()
+        self.layouts = Dictionary()
+        self.num_buffered = 0
+        self.closed = False
+        self.columns = []
+        self.chrom = self._column('chrom', 'i', np.int32)
+        self.start = self._column('start', 'l', np.int64)
+        self.end = self._column('end', 'l', np.int64)
+        self.strand = self._column('strand', 'b', np.int8)
+        self.exon_ptr = self._column('exon_ptr', 'l', np.int64)
+        self.exon_ptr.append(0)
+        self.exon_start = self._column('exon_start', 'l', np.int64)
+        self.exon_end = self._column('exon_end', 'l', np.int64)
+        self.locus_chrom = self._column('locus_chrom', 'i', np.int32)
+        self.locus_start = self._column('locus_start', 'l', np.int64)
+        self.locus_end = self._column('locus_end', 'l', np.int64)
+        self.locus_ptr = self._column('locus_ptr', 'l', np.int64)
+        self.locus_ptr.append(0)
+        self.locus_boundaries = self._column('locus_boundaries', 'l', 
+                                             np.int64)
+        self.transcript_columns = FeatureColumns(self.tmp_path, '',
+                                                 self.strings, self.keys,
+                                                 self.layouts, max_codes)
+        self.exon_columns = FeatureColumns(self.tmp_path, 'exon_',
+                                           self.strings, self.keys,
+                                           self.layouts, max_codes)
+
+    def _column(self, name, typecode, dtype):
+        col = ColumnFile(self.tmp_path, name, typecode, dtype)
+        self.columns.append(col)
+        return col
+
+    def __len__(self):
+        return len(self.chrom)
+
+    def add_locus(self, lines):
+        '''
+        add the GTF lines of a single locus (as yielded by 'parse_loci').
+        as in 'transcripts_from_gtf_features' the 'transcript' feature of
+        each transcript must appear before its other features. features
+        other than 'transcript' and 'exon' are not stored
+        '''
+        transcripts = collections.OrderedDict()
+        locus_chrom = None
+        locus_start = None
+        locus_end = None
+        boundaries = set()
+        for line in lines:
+            fields = line.strip().split('\t')
+            start = int(fields[3]) - 1
+            end = int(fields[4])
+            if locus_chrom is None:
+                locus_chrom = fields[0]
+                locus_start = start
+                locus_end = end
+            else:
+                locus_start = min(locus_start, start)
+                locus_end = max(locus_end, end)
+            feature_type = fields[2]
+            attr_items = parse_attr_items(fields[8])
+            t_id = dict(attr_items)[TRANSCRIPT_ID]
+            if t_id not in transcripts:
+                if feature_type != 'transcript':
+                    raise GTFError("Feature type '%s' found before "
+                                   "'transcript' record: %s" %
+                                   (feature_type, line))
+                transcripts[t_id] = (fields, attr_items, [])
+            elif feature_type == 'exon':
+                transcripts[t_id][2].append((fields, attr_items))
+            if feature_type == 'exon':
+                boundaries.add(start)
+                boundaries.add(end)
+        if locus_chrom is None:
+            return
+        for fields, attr_items, exons in transcripts.itervalues():
+            self.chrom.append(self.chroms.encode(fields[0]))
+            self.start.append(int(fields[3]) - 1)
+            self.end.append(int(fields[4]))
+            strand = fields[6]
+            if not (strand == '+' or strand == '-'):
+                strand = GTF_EMPTY_FIELD
+            self.strand.append(strand_str_to_int(strand))
+            self.transcript_columns.append(fields[1], fields[5], fields[7],
+                                           attr_items)
+            for exon_fields, exon_attr_items in exons:
+                self.exon_start.append(int(exon_fields[3]) - 1)
+                self.exon_end.append(int(exon_fields[4]))
+                self.exon_columns.append(exon_fields[1], exon_fields[5],
+                                         exon_fields[7], exon_attr_items)
+            self.exon_ptr.append(len(self.exon_start))
+            self.num_buffered += 1 + len(exons)
+        self.locus_chrom.append(self.chroms.encode(locus_chrom))
+        self.locus_start.append(locus_start)
+        self.locus_end.append(locus_end)
+        self.locus_ptr.append(len(self.chrom))
+        self.locus_boundaries.append(len(boundaries))
+        if self.num_buffered >= TSTORE_BATCH_ROWS:
+            self.flush()
+
+    def _all_columns(self):
+        return (self.columns + self.transcript_columns.columns() + 
+                self.exon_columns.columns())
+
+    def flush(self):
+        '''
+        append the rows added since the last flush to the column files
+        '''
+        for col in self._all_columns():
+            col.flush()
+        self.num_buffered = 0
+
+    def close(self):
+        '''
+        write the store. an existing store at the same path is replaced
+        '''
+        for col in self._all_columns():
+            col.close()
+        arrays = {}
+        save_strings(self.strings.values, 'strings', arrays)
+        save_strings(self.chroms.values, 'chroms', arrays)
+        save_strings(self.keys.values, 'keys', arrays)
+        layout_ptr = np.zeros(len(self.layouts) + 1, dtype=np.int64)
+        np.cumsum([len(x) for x in self.layouts.values], out=layout_ptr[1:])
+        arrays['layout_ptr'] = layout_ptr
+        arrays['layout_keys'] = np.array([k for x in self.layouts.values
+                                          for k in x], dtype=np.int32)
+        for name, a in arrays.iteritems():
+            np.save(os.path.join(self.tmp_path, name + '.npy'), a)
+        fileh = open(os.path.join(self.tmp_path, TSTORE_FORMAT_FILE), 'w')
+        print >>fileh, '\t'.join([TSTORE_FORMAT, str(TSTORE_VERSION)])
+        fileh.close()
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+        os.rename(self.tmp_path, self.path)
+        self.closed = True
+
+    def abort(self):
+        '''
+        remove the partially written store
+        '''
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+        self.closed = True
+
+def write_transcript_store(gtf_file, path):
+    '''
+    convert a sorted GTF file to a transcript store and return the
+    number of loci
+    '''
+    writer = TranscriptStoreWriter(path)
+    num_loci = 0
+    try:
+        for lines in parse_loci(open_gtf(gtf_file)):
+            writer.add_locus(lines)
+            num_loci += 1
+        writer.close()
+    finally:
+        if not writer.closed:
+            writer.abort()
+    return num_loci
+
+class StringColumn(object):
+    '''
+    list of strings stored as a byte array and offsets. strings are
+    decoded when they are first accessed
+    '''
+    def __init__(self, data, ptr):
+        self.data = data
+        self.ptr = ptr
+        self.cache = {}
+
+    def __len__(self):
+        return len(self.ptr) - 1
+
+    def __getitem__(self, code):
+        s = self.cache.get(code)
+        if s is None:
+            s = self.data[self.ptr[code]:self.ptr[code+1]].tostring()
+            self.cache[code] = s
+        return s
+
+    def tolist(self):
+        return [self[i] for i in xrange(len(self))]
+
+class TranscriptStore(object):
+    '''
+    reads a transcript store. arrays are memory-mapped so that the
+    transcripts of individual loci can be read without loading the
+    whole store
+    '''
+    def __init__(self, path):
+        if not is_transcript_store(path):
+            raise GTFError("'%s' is not a transcript store (format %s "
+                           "version %d)" % (path, TSTORE_FORMAT,
+                                            TSTORE_VERSION))
+        self.path = path
+        self.arrays = {}
+        # names of the columns stored as raw strings
+        self.raw_columns = set(name[:-len('_data.npy')] 
+                               for name in os.listdir(path)
+                               if name.endswith('_data.npy'))
+        self.strings = StringColumn(self._load('strings_data'),
+                                    self._load('strings_ptr'))
+        self.chroms = StringColumn(self._load('chroms_data'),
+                                   self._load('chroms_ptr')).tolist()
+        self.keys = StringColumn(self._load('keys_data'),
+                                 self._load('keys_ptr')).tolist()
+        layout_ptr = self._load('layout_ptr').tolist()
+        layout_keys = self._load('layout_keys').tolist()
+        self.layouts = [tuple(layout_keys[layout_ptr[i]:layout_ptr[i+1]])
+                        for i in xrange(len(layout_ptr) - 1)]
+        # attribute names of each layout shared by compact transcripts
+        self.layout_names = [tuple(self.keys[k] for k in layout)
+                             for layout in self.layouts]
+        for name in ('chrom', 'start', 'end', 'strand', 'exon_ptr',
+                     'exon_start', 'exon_end', 'locus_chrom', 'locus_start',
+                     'locus_end', 'locus_ptr', 'locus_boundaries'):
+            setattr(self, name, self._load(name))
+
+    def _load(self, name):
+        a = self.arrays.get(name)
+        if a is None:
+            filename = os.path.join(self.path, name + '.npy')
+            a = np.load(filename, mmap_mode='r')
+            if a.size == 0:
+                # empty arrays cannot be memory-mapped
+                a = np.load(filename)
+            self.arrays[name] = a
+        return a
+
+    def __len__(self):
+        return len(self.chrom)
+
+    @property
+    def num_loci(self):
+        return len(self.locus_chrom)
+
+    def loci(self):
+        '''
+        generator yielding (seqid, start, end, first, count,
+        num_transcripts, num_boundaries) tuples for each locus in the
+        same format as 'read_locus_index', where 'first' and 'count'
+        are the range of transcripts of the locus
+        '''
+        chroms = self.locus_chrom.tolist()
+        starts = self.locus_start.tolist()
+        ends = self.locus_end.tolist()
+        ptr = self.locus_ptr.tolist()
+        boundaries = self.locus_boundaries.tolist()
+        for i in xrange(len(chroms)):
+            count = ptr[i+1] - ptr[i]
+            yield (self.chroms[chroms[i]], starts[i], ends[i], ptr[i],
+                   count, count, boundaries[i])
+
+    def _column_values(self, name, start, stop):
+        '''
+        returns a list of the string values of rows start:stop of a
+        field or attribute column. rows of dictionary-encoded columns
+        without the attribute are None
+        '''
+        if name in self.raw_columns:
+            ptr = self._load(name + '_ptr')[start:stop+1].tolist()
+            lo = ptr[0]
+            data = self._load(name + '_data')[lo:ptr[-1]].tostring()
+            return [data[ptr[i]-lo:ptr[i+1]-lo] for i in xrange(stop - start)]
+        strings = self.strings
+        return [None if code == MISSING else strings[code]
+                for code in self._load(name)[start:stop].tolist()]
+
+    def attr_column(self, name, prefix=''):
+        '''
+        returns a list of the values of attribute 'name' of the 
+        transcripts (or exons if prefix is 'exon_') with None for the
+        features without the attribute, or None if no feature has the 
+        attribute
+        '''
+        if name not in self.keys:
+            return None
+        k = self.keys.index(name)
+        column = '%sattr%d' % (prefix, k)
+        if not ((column in self.raw_columns) or 
+                os.path.exists(os.path.join(self.path, column + '.npy'))):
+            return None
+        layouts = self._load(prefix + 'layout')
+        values = self._column_values(column, 0, len(layouts))
+        return [(value if k in self.layouts[layout] else None)
+                for value, layout in zip(values, layouts.tolist())]
+
+    def _feature_fields(self, prefix, start, stop):
+        '''
+        returns a list of (source, score, phase, attr_items) tuples of
+        the transcript or exon features start:stop
+        '''
+        keys = self.keys
+        layouts = self.layouts
+        columns = [self._column_values(prefix + name, start, stop)
+                   for name in FIELD_COLUMNS]
+        columns.append(self._load(prefix + 'layout')[start:stop].tolist())
+        attr_columns = {}
+        results = []
+        for i, (source, score, phase, layout) in enumerate(zip(*columns)):
+            attr_items = []
+            for k in layouts[layout]:
+                values = attr_columns.get(k)
+                if values is None:
+                    values = self._column_values('%sattr%d' % (prefix, k),
+                                                 start, stop)
+                    attr_columns[k] = values
+                attr_items.append((keys[k], values[i]))
+            results.append((source, score, phase, attr_items))
+        return results
+
+    def transcripts(self, first, count, attr_defs=None, compact=False):
+        '''
+        returns a list of the transcripts first:first+count in the same
+        form as 'transcripts_from_gtf_lines'. if 'compact' is True the
+        transcripts are returned as 'CompactTranscript' objects
+        '''
+        if compact:
+            return self.compact_transcripts(first, count, attr_defs)
+        stop = first + count
+        chroms = self.chrom[first:stop].tolist()
+        starts = self.start[first:stop].tolist()
+        ends = self.end[first:stop].tolist()
+        strands = self.strand[first:stop].tolist()
+        exon_ptr = self.exon_ptr[first:stop+1].tolist()
+        exon_starts = self.exon_start[exon_ptr[0]:exon_ptr[-1]].tolist()
+        exon_ends = self.exon_end[exon_ptr[0]:exon_ptr[-1]].tolist()
+        fields = self._feature_fields('', first, stop)
+        transcripts = []
+        for i in xrange(count):
+            t = Transcript()
+            t.chrom = self.chroms[chroms[i]]
+            t.start = starts[i]
+            t.end = ends[i]
+            t.strand = strands[i]
+            t.exons = [Exon(exon_starts[j], exon_ends[j])
+                       for j in xrange(exon_ptr[i] - exon_ptr[0],
+                                       exon_ptr[i+1] - exon_ptr[0])]
+            # sort transcript exons by genomic position
+            t.exons.sort()
+            attrs = {}
+            for tag, value in fields[i][3]:
+                if (attr_defs is not None) and (attr_defs.get(tag) is not None):
+                    value = attr_defs[tag](value)
+                attrs[tag] = value
+            t.attrs = attrs
+            transcripts.append(t)
+        return transcripts
+
+    def compact_transcripts(self, first, count, attr_defs=None):
+        '''
+        returns a list of the transcripts first:first+count as 
+        'CompactTranscript' objects. the exons of all of the transcripts
+        are stored in a single pair of arrays (sorted by position within
+        each transcript) and the attributes share their names and string 
+        values through the tables of the store
+        '''
+        stop = first + count
+        chroms = self.chrom[first:stop].tolist()
+        starts = self.start[first:stop].tolist()
+        ends = self.end[first:stop].tolist()
+        strands = self.strand[first:stop].tolist()
+        exon_ptr = np.asarray(self.exon_ptr[first:stop+1])
+        exon_starts = np.asarray(self.exon_start[exon_ptr[0]:exon_ptr[-1]])
+        exon_ends = np.asarray(self.exon_end[exon_ptr[0]:exon_ptr[-1]])
+        # sort exons by genomic position within each transcript
+        owner = np.repeat(np.arange(count), np.diff(exon_ptr))
+        order = np.lexsort((exon_starts, owner))
+        exon_starts = array.array('l', exon_starts[order].tolist())
+        exon_ends = array.array('l', exon_ends[order].tolist())
+        exon_ptr = (exon_ptr - exon_ptr[0]).tolist()
+        # attributes
+        layouts = self._load('layout')[first:stop].tolist()
+        attr_columns = {}
+        transcripts = []
+        for i in xrange(count):
+            t = CompactTranscript()
+            t.chrom = self.chroms[chroms[i]]
+            t.start = starts[i]
+            t.end = ends[i]
+            t.strand = strands[i]
+            t.exons = ExonArray(exon_starts, exon_ends, exon_ptr[i], 
+                                exon_ptr[i+1])
+            names = self.layout_names[layouts[i]]
+            values = []
+            for k, tag in zip(self.layouts[layouts[i]], names):
+                column = attr_columns.get(k)
+                if column is None:
+                    column = self._column_values('attr%d' % k, first, stop)
+                    attr_columns[k] = column
+                value = column[i]
+                if (attr_defs is not None) and (attr_defs.get(tag) is not None):
+                    value = attr_defs[tag](value)
+                values.append(value)
+            t.attrs = SharedAttrs(names, tuple(values))
+            transcripts.append(t)
+        return transcripts
+
+    def iterloci(self, attr_defs=None, compact=False):
+        '''
+        generator yielding the list of transcripts of each locus in the
+        same way as 'parse_gtf'
+        '''
+        ptr = self.locus_ptr.tolist()
+        for i in xrange(len(ptr) - 1):
+            yield self.transcripts(ptr[i], ptr[i+1] - ptr[i], attr_defs,
+                                   compact)
+
+    def gtf_lines(self, first, count):
+        '''
+        returns a list of (line, feature_type, start, transcript_index)
+        tuples of the GTF lines of the transcripts first:first+count. when
+        the transcripts make up whole loci the lines are sorted in the same
+        order as 'sort_gtf'
+        '''
+        stop = first + count
+        chroms = self.chrom[first:stop].tolist()
+        starts = self.start[first:stop].tolist()
+        ends = self.end[first:stop].tolist()
+        strands = self.strand[first:stop].tolist()
+        exon_ptr = self.exon_ptr[first:stop+1].tolist()
+        exon_first = exon_ptr[0]
+        exon_starts = self.exon_start[exon_first:exon_ptr[-1]].tolist()
+        exon_ends = self.exon_end[exon_first:exon_ptr[-1]].tolist()
+        fields = self._feature_fields('', first, stop)
+        exon_fields = self._feature_fields('exon_', exon_first, exon_ptr[-1])
+        lines = []
+        for i in xrange(count):
+            chrom = self.chroms[chroms[i]]
+            strand = strand_int_to_str(strands[i])
+            source, score, phase, attr_items = fields[i]
+            line = format_gtf_line(chrom, source, 'transcript', starts[i],
+                                   ends[i], score, strand, phase, attr_items)
+            lines.append((line, 'transcript', starts[i], first + i))
+            for j in xrange(exon_ptr[i] - exon_first,
+                            exon_ptr[i+1] - exon_first):
+                source, score, phase, attr_items = exon_fields[j]
+                line = format_gtf_line(chrom, source, 'exon', exon_starts[j],
+                                       exon_ends[j], score, strand, phase,
+                                       attr_items)
+                lines.append((line, 'exon', exon_starts[j], first + i))
+        sort_locus_gtf_lines(lines)
+        return lines
+
+    def iter_gtf_lines(self):
+        '''
+        generator yielding (line, feature_type, start, transcript_index)
+        tuples of every GTF line in sorted order
+        '''
+        ptr = self.locus_ptr.tolist()
+        for i in xrange(len(ptr) - 1):
+            for x in self.gtf_lines(ptr[i], ptr[i+1] - ptr[i]):
+                yield x
+
+    def write_gtf(self, fileh):
+        '''
+        export the store as a sorted GTF file
+        '''
+        for x in self.iter_gtf_lines():
+            print >>fileh, x[0]
+
+def parse_transcript_store(path, attr_defs=None, compact=False):
+    '''
+    generator yielding the list of transcripts of each locus of a
+    transcript store. equivalent to 'parse_gtf'
+    '''
+    return TranscriptStore(path).iterloci(attr_defs, compact)
@@ -27,79 +27,69 @@ import os
 import collections
 import operator
 import random
+import shutil
+import hashlib
+import StringIO
+import multiprocessing
 
 # project imports
 import assemblyline
 import assemblyline.lib.config as config
 from assemblyline.lib.base import Library, GTFAttr
-from assemblyline.lib.gtf import GTFFeature, sort_gtf
-from assemblyline.lib.stats import ECDF, scoreatpercentile
+from assemblyline.lib.gtf import GTFFeature, GTFWriter, sort_gtf, \
+    merge_gtf, open_gtf
+from assemblyline.lib.tstore import write_transcript_store
+from assemblyline.lib.stats import ScoreDistribution
+from assemblyline.lib.refcache import file_checksum, reference_checksum, \
+    get_reference_cache, default_cache_dir, REF_CACHE_SUFFIX, \
+    REF_CACHE_CHECKSUMS_FILE
 
-def make_transcript_feature(exon_features):
-    f = GTFFeature()
-    f.seqid = exon_features[0].seqid
-    f.source = exon_features[0].source
-    f.feature_type = 'transcript'
-    f.start = exon_features[0].start
-    f.end = exon_features[-1].end
-    f.score = exon_features[0].score
-    f.strand = exon_features[0].strand
-    f.phase = '.'
-    f.attrs = exon_features[0].attrs.copy()
-    if "exon_number" in f.attrs:
-        del f.attrs["exon_number"]
-    return f
+# name of the list of cached shards in the library cache directory
+LIBRARY_CACHE_MANIFEST = "manifest.txt"
+# name of the reference annotation shard in the manifest
+REFERENCE_SHARD_NAME = "reference"
 
-def add_reference_gtf_file(ref_gtf_file, test_gene_ids, 
-                           random_test_frac, outfh):
-    gene_dict = collections.defaultdict(lambda: [])
+def add_reference_gtf_file(ref_cache, test_gene_ids, random_test_frac, 
+                           outfh):
+    '''
+    write the transcripts of a compiled reference in sorted order with 
+    'ref' and 'test' attributes. genes are labeled as tests when they are
+    in 'test_gene_ids' or, when no tests are given, at random
+    '''
     user_defined_tests = len(test_gene_ids) > 0
-    # group by gene id
-    for feature in GTFFeature.parse(open(ref_gtf_file)):
-        if feature.feature_type != "exon":
-            continue
-        # group by gene id        
-        g_id = feature.attrs[GTFAttr.GENE_ID]
-        gene_dict[g_id].append(feature)
-    # output reference transcripts
-    for g_id, g_features in gene_dict.iteritems():
+    test_genes = {}
+    def get_attrs(g_id):
         # label test transcripts
-        if user_defined_tests:
-            is_test = (g_id in test_gene_ids)
-        else:
-            is_test = (random.random() < random_test_frac)
-        # group by transcript id
-        transcript_dict = collections.defaultdict(lambda: [])
-        for feature in g_features:
-            t_id = feature.attrs[GTFAttr.TRANSCRIPT_ID]
-            transcript_dict[t_id].append(feature)
-        for t_id, t_features in transcript_dict.iteritems():
-            # sort features (exons) by start position
-            t_features.sort(key=operator.attrgetter('start'))
-            # annotate exons as reference features
-            for f in t_features:
-                f.attrs[GTFAttr.REF] = '1'
-                f.attrs[GTFAttr.TEST] = '1' if is_test else '0'
-                print >>outfh, str(f)
-            f = make_transcript_feature(t_features)
-            f.attrs[GTFAttr.REF] = '1'
-            f.attrs[GTFAttr.TEST] = '1' if is_test else '0'
-            print >>outfh, str(f)
-        del transcript_dict
-    del gene_dict
+        is_test = test_genes.get(g_id)
+        if is_test is None:
+            if user_defined_tests:
+                is_test = (g_id in test_gene_ids)
+            else:
+                is_test = (random.random() < random_test_frac)
+            test_genes[g_id] = is_test
+        return ((GTFAttr.REF, '1'), (GTFAttr.TEST, '1' if is_test else '0'))
+    ref_cache.write_gtf(outfh, get_attrs)
 
-def read_gtf_file(library, gtf_score_attr):
-    # read all transcripts
-    t_dict = collections.OrderedDict()
+class TranscriptsNotGroupedError(Exception):
+    pass
+
+def iter_library_exons(library, gtf_score_attr):
+    '''
+    generator yielding (transcript_id, is_new, feature) tuples for the
+    exon features of a library GTF file, where transcript and gene ids 
+    are renamed to be unique across libraries and 'is_new' is True for
+    the first exon of each transcript
+    '''
     cur_t_id = 1
     cur_g_id = 1
     t_id_map = {}
     g_id_map = {}
-    for feature in GTFFeature.parse(open(library.gtf_file)):
+    for feature in GTFFeature.parse(open_gtf(library.gtf_file)):
         if feature.feature_type == "exon":
             t_id = feature.attrs[GTFAttr.TRANSCRIPT_ID]
             # rename transcript id
-            if t_id not in t_id_map:
+            is_new = t_id not in t_id_map
+            if is_new:
                 new_t_id = "%s.T%d" % (library.library_id, cur_t_id)
                 t_id_map[t_id] = new_t_id
                 cur_t_id += 1
@@ -121,86 +111,229 @@ def read_gtf_file(library, gtf_score_attr):
                         GTFAttr.REF: '0',
                         GTFAttr.SCORE: feature.attrs.get(gtf_score_attr, '0.0')}
             feature.attrs = newattrs
-            # store feature
-            if new_t_id not in t_dict:
-                t_dict[new_t_id] = []
-            t_dict[new_t_id].append(feature)
+            yield new_t_id, is_new, feature
+
+def read_gtf_file(library, gtf_score_attr):
+    # read all transcripts
+    t_dict = collections.OrderedDict()
+    for t_id, is_new, feature in iter_library_exons(library, gtf_score_attr):
+        # store feature
+        if is_new:
+            t_dict[t_id] = []
+        t_dict[t_id].append(feature)
     return t_dict
 
-def filter_transcripts(library_id, t_dict, outfileh, dropfileh, statsfileh, 
-                       min_transcript_length):
+def iter_gtf_transcripts(library, gtf_score_attr):
+    '''
+    generator yielding the same (transcript_id, features) tuples as 
+    'read_gtf_file' without reading the whole file into memory. the 
+    exons of each transcript must be adjacent in the file, otherwise
+    TranscriptsNotGroupedError is raised
+    '''
+    cur_t_id = None
+    features = []
+    for t_id, is_new, feature in iter_library_exons(library, gtf_score_attr):
+        if t_id != cur_t_id:
+            if not is_new:
+                raise TranscriptsNotGroupedError("Exons of transcript %s "
+                                                 "are not adjacent in file "
+                                                 "%s" % (t_id, 
+                                                         library.gtf_file))
+            if len(features) > 0:
+                yield cur_t_id, features
+            cur_t_id = t_id
+            features = []
+        features.append(feature)
+    if len(features) > 0:
+        yield cur_t_id, features
+
+def filter_transcript(features, min_transcript_length):
+    '''
+    clip very short first and last exons and check the length of a 
+    transcript. returns a tuple (keep, features, num_clipped) where 
+    'features' are the remaining exons sorted by position if the 
+    transcript is kept, or all exons otherwise (in reverse order on 
+    the negative strand)
+    '''
+    strand = features[0].strand
+    reverse = True if strand == "-" else False
+    num_exons = len(features)        
+    # check first/last exon lengths and clip very short exons
+    features.sort(key=operator.attrgetter('start'), reverse=reverse)
+    new_features = collections.deque(features)
+    num_clipped = 0
+    if num_exons > 1:
+        f = new_features[0]
+        length = f.end - f.start
+        if length < config.MIN_EXON_LENGTH:
+            num_clipped += 1
+            new_features.popleft()
+        f = new_features[-1]
+        length = f.end - f.start
+        if length < config.MIN_EXON_LENGTH:
+            num_clipped += 1
+            new_features.pop()
+    transcript_length = sum((f.end - f.start) for f in new_features)
+    if transcript_length <= min_transcript_length:
+        return False, features, num_clipped
+    # reverse features if this is negative strand
+    new_features = list(new_features)
+    if reverse:
+        new_features.reverse()
+    return True, new_features, num_clipped
+
+def filter_transcripts(library_id, t_iter_func, gtf_writer, drop_writer, 
+                       statsfileh, min_transcript_length, max_exact_scores=0):
+    '''
+    filter the transcripts of a library and write them along with their
+    percentile rank among the transcripts that passed the filters. 
+
+    't_iter_func()' returns an iterator of (transcript_id, features) 
+    tuples. it is called twice so that the transcripts need not be held
+    in memory: the first pass collects the scores of the transcripts and
+    the second pass writes them. when more than 'max_exact_scores' (if
+    nonzero) transcripts pass or fail the filters their percentile 
+    ranks and score quantiles are approximated by a ScoreSketch
+
+    returns the number of transcripts
+    '''
     # filter transcripts
+    num_transcripts = 0
     passed = 0
     failed = 0
     too_short = 0
     too_short_exon = 0
-    passed_scores = []
-    failed_scores = []
-    filtered_t_dict = collections.OrderedDict()
-    for t_id, features in t_dict.iteritems():
-        strand = features[0].strand
+    passed_scores = ScoreDistribution(max_exact_scores)
+    failed_scores = ScoreDistribution(max_exact_scores)
+    for t_id, features in t_iter_func():
+        num_transcripts += 1
         score = float(features[0].attrs[GTFAttr.SCORE])            
-        reverse = True if strand == "-" else False
-        num_exons = len(features)        
-        # check first/last exon lengths and clip very short exons
-        features.sort(key=operator.attrgetter('start'), reverse=reverse)
-        new_features = collections.deque(features)
-        if num_exons > 1:
-            f = new_features[0]
-            length = f.end - f.start
-            if length < config.MIN_EXON_LENGTH:
-                too_short_exon += 1
-                new_features.popleft()
-            f = new_features[-1]
-            length = f.end - f.start
-            if length < config.MIN_EXON_LENGTH:
-                too_short_exon += 1
-                new_features.pop()
-        keep = True
-        transcript_length = sum((f.end - f.start) for f in new_features)
-        if transcript_length <= min_transcript_length:
-            too_short += 1
-            keep = False
+        keep, features, num_clipped = \
+            filter_transcript(features, min_transcript_length)
+        too_short_exon += num_clipped
         if not keep:
+            too_short += 1
             failed += 1
-            failed_scores.append(score)
-            feature = make_transcript_feature(features)
-            print >>dropfileh, str(feature)
-            for feature in features:
-                print >>dropfileh, str(feature)
+            failed_scores.add(score)
         else:
             passed += 1
-            passed_scores.append(score)
-            filtered_t_dict[t_id] = (score, list(new_features))
-    # make empirical cdf for scores
-    ecdf = ECDF(passed_scores, side="left")
-    for t_id, vtuple in filtered_t_dict.iteritems():
-        score, features = vtuple
-        pctrank = 100.0 * ecdf(score)
-        # reverse features if this is negative strand
-        if features[0].strand == "-":
-            features.reverse()
-        # write transcript
-        feature = make_transcript_feature(features)
-        feature.attrs[GTFAttr.SCORE] = score
-        feature.attrs[GTFAttr.PCTRANK] = pctrank
-        print >>outfileh, str(feature)
-        # write exons
-        for i,feature in enumerate(features):
-            feature.attrs[GTFAttr.SCORE] = score
-            feature.attrs[GTFAttr.PCTRANK] = pctrank
-            feature.attrs['exon_number'] = "%d" % (i + 1)
-            print >>outfileh, str(feature)
-
+            passed_scores.add(score)
+    if passed_scores.is_approximate():
+        logging.debug("Approximating percentile ranks of %d transcripts "
+                      "of library %s" % (passed, library_id))
+    # write transcripts with the percentile ranks of their scores
+    for t_id, features in t_iter_func():
+        score = float(features[0].attrs[GTFAttr.SCORE])            
+        keep, features, num_clipped = \
+            filter_transcript(features, min_transcript_length)
+        f = features[0]
+        exon_scores = [x.score for x in features]
+        if not keep:
+            drop_writer.write_transcript(f.seqid, f.strand, features, 
+                                         f.attrs, source=f.source, 
+                                         score=f.score, 
+                                         exon_scores=exon_scores,
+                                         first_exon_number=None)
+            continue
+        pctrank = passed_scores.pctrank(score)
+        # write transcript and exons
+        attrs = f.attrs.copy()
+        attrs[GTFAttr.SCORE] = score
+        attrs[GTFAttr.PCTRANK] = pctrank
+        gtf_writer.write_transcript(f.seqid, f.strand, features, attrs,
+                                    source=f.source, score=f.score,
+                                    exon_scores=exon_scores)
     # compute and write stats
-    failed_quantiles = [scoreatpercentile(failed_scores, q) 
-                        for q in config.TRANSCRIPT_SCORE_QUANTILES]
-    passed_quantiles = [scoreatpercentile(passed_scores, q) 
-                        for q in config.TRANSCRIPT_SCORE_QUANTILES]
+    failed_quantiles = failed_scores.scoresatpercentiles(
+        config.TRANSCRIPT_SCORE_QUANTILES)
+    passed_quantiles = passed_scores.scoresatpercentiles(
+        config.TRANSCRIPT_SCORE_QUANTILES)
     fields = [library_id, passed, failed, too_short, too_short_exon]
     fields.extend(failed_quantiles)
     fields.extend(passed_quantiles)
     print >>statsfileh, '\t'.join(map(str, fields))
+    return num_transcripts
+
+def aggregate_library(args):
+    '''
+    read and filter the transcripts of a single library and write them
+    to a GTF shard sorted by 'sort_gtf', the dropped transcripts to an
+    unsorted shard, and the library statistics. the statistics file is
+    written last and marks the shard as complete. returns a tuple 
+    (library_id, number of transcripts)
+    '''
+    (library, gtf_score_attr, min_transcript_length, streaming,
+     max_exact_scores, shard_prefix, tmp_dir) = args
+    unsorted_gtf_file = shard_prefix + ".unsorted.gtf"
+    drop_file = shard_prefix + ".dropped.gtf"
+    gtf_writer = GTFWriter(open(unsorted_gtf_file, 'w'))
+    drop_writer = GTFWriter(open(drop_file, 'w'))
+    statsfileh = StringIO.StringIO()
+    def filter_library(t_iter_func):
+        return filter_transcripts(library.library_id, t_iter_func, 
+                                  gtf_writer, drop_writer, statsfileh, 
+                                  min_transcript_length, max_exact_scores)
+    num_transcripts = None
+    if streaming:
+        # read the file twice rather than holding it in memory. nothing
+        # is written before the first pass has read the whole file
+        try:
+            t_iter_func = lambda: iter_gtf_transcripts(library, 
+                                                       gtf_score_attr)
+            num_transcripts = filter_library(t_iter_func)
+        except TranscriptsNotGroupedError, e:
+            logging.debug("%s, reading library %s into memory" % 
+                          (str(e), library.library_id))
+    if num_transcripts is None:
+        t_dict = read_gtf_file(library, gtf_score_attr)
+        num_transcripts = filter_library(t_dict.iteritems)
+        del t_dict
+    gtf_writer.close()
+    drop_writer.close()
+    if num_transcripts == 0:
+        # libraries without transcripts are cached without statistics
+        os.remove(unsorted_gtf_file)
+        os.remove(drop_file)
+        statsfileh = StringIO.StringIO()
+    else:
+        sort_gtf(unsorted_gtf_file, shard_prefix + ".gtf", tmp_dir=tmp_dir)
+        os.remove(unsorted_gtf_file)
+    open(shard_prefix + ".stats", 'w').write(statsfileh.getvalue())
+    return library.library_id, num_transcripts
+
+def get_cache_key(params):
+    '''
+    returns a key identifying the output produced given the list of 
+    parameters 'params', which include the checksums of the input files
+    '''
+    h = hashlib.sha1()
+    h.update('\t'.join(map(str, params)))
+    return h.hexdigest()
+
+def read_cache_manifest(cache_dir):
+    '''
+    returns a list of (name, key) tuples of the shards of the run in 
+    the order they were aggregated
+    '''
+    filename = os.path.join(cache_dir, LIBRARY_CACHE_MANIFEST)
+    if not os.path.exists(filename):
+        return []
+    return [tuple(line.rstrip('\n').split('\t')) for line in open(filename)]
+
+def write_cache_manifest(cache_dir, entries):
+    fileh = open(os.path.join(cache_dir, LIBRARY_CACHE_MANIFEST), 'w')
+    for name, key in entries:
+        print >>fileh, '\t'.join([name, key])
+    fileh.close()
+
+def read_id_map(filename):
+    '''
+    read a library or sample id map and return a list of (new id, 
+    original id) tuples
+    '''
+    if not os.path.exists(filename):
+        return []
+    return [tuple(line.rstrip('\n').split('\t')) for line in open(filename)]
 
 def main():
     # setup logging
@@ -210,12 +343,29 @@ def main():
     logging.info("----------------------------------")
     # parse command line
     parser = argparse.ArgumentParser()
+    parser.add_argument("-p", type=int, dest="num_processors", default=1,
+                        help="Number of libraries to process in parallel "
+                        "[default=%(default)s]")
     parser.add_argument('--min-transcript-length', type=int, 
                         dest="min_transcript_length",
                         metavar="N",
                         default=config.MIN_TRANSCRIPT_LENGTH,
                         help="Skip ab initio transcripts equal to or below "
                         "this length [default=%(default)s]")
+    parser.add_argument("--streaming", dest="streaming", action="store_true",
+                        default=False,
+                        help="Read each library GTF file twice instead of "
+                        "holding its transcripts in memory. Requires the "
+                        "exons of each transcript to be adjacent in the "
+                        "file (libraries where they are not are read into "
+                        "memory) [default=%(default)s]")
+    parser.add_argument("--max-exact-scores", type=int, 
+                        dest="max_exact_scores", metavar="N", default=0,
+                        help="Approximate the percentile ranks and score "
+                        "quantiles of libraries with more than N passing "
+                        "(or failing) transcripts with a quantile sketch "
+                        "of bounded memory. Setting to zero always "
+                        "computes exact ranks [default=%(default)s]")
     parser.add_argument("--gtf-score-attr", dest="gtf_score_attr", 
                         default="FPKM", metavar="ATTR",
                         help="GTF attribute field containing transcript "
@@ -235,6 +385,27 @@ def main():
                         "reference 'gene_id' attributes "
                         "(one per line) that define test cases "
                         "to use for validation purposes")
+    parser.add_argument("--append", dest="append", action="store_true",
+                        default=False,
+                        help="Add the libraries in the library table to "
+                        "the existing results in the output directory of a "
+                        "run with '--keep-cache' or '--append'. Libraries "
+                        "(and the reference) whose GTF file and filter "
+                        "parameters are unchanged are not read again "
+                        "[default=%(default)s]")
+    parser.add_argument("--keep-cache", dest="keep_cache", 
+                        action="store_true", default=False,
+                        help="Keep the filtered libraries in the output "
+                        "directory so that libraries can be added later "
+                        "with '--append' (always kept with '--append') "
+                        "[default=%(default)s]")
+    parser.add_argument("--ref-cache-dir", dest="ref_cache_dir", 
+                        default=None, metavar="DIR",
+                        help="Directory of compiled reference annotations "
+                        "that are reused across runs [default=reference "
+                        "GTF file + '%s', or the output directory when the "
+                        "directory of the reference is not writable]" % 
+                        (REF_CACHE_SUFFIX))
     parser.add_argument('ref_gtf_file')
     parser.add_argument('library_table_file')
     args = parser.parse_args()
@@ -243,6 +414,8 @@ def main():
         parser.error("library table file %s not found" % (args.library_table_file))
     if args.min_transcript_length < 0:
         parser.error("min_transcript_length < 0")
+    if args.max_exact_scores < 0:
+        parser.error("max_exact_scores < 0")
     if not os.path.exists(args.ref_gtf_file):
         parser.error("reference GTF file %s not found" % (args.ref_gtf_file))
     if (args.test_file is not None) and (not os.path.exists(args.test_file)):
@@ -251,12 +424,18 @@ def main():
         parser.error("cannot set --random-test-frac < 0")
     # show parameters
     logging.info("Parameters:")
+    logging.info("num processors:        %d" % (args.num_processors))
     logging.info("min transcript length: %d" % (args.min_transcript_length))
     logging.info("gtf score attr:        %s" % (args.gtf_score_attr))
+    logging.info("streaming:             %s" % (args.streaming))
+    logging.info("max exact scores:      %d" % (args.max_exact_scores))
     logging.info("output directory:      %s" % (args.output_dir))
     logging.info("reference GTF file:    %s" % (args.ref_gtf_file))
+    logging.info("reference cache dir:   %s" % (args.ref_cache_dir))
     logging.info("test file:             %s" % (args.test_file))
     logging.info("library table file:    %s" % (args.library_table_file))
+    logging.info("append:                %s" % (args.append))
+    logging.info("keep cache:            %s" % (args.keep_cache))
     logging.info("----------------------------------")
     # setup results
     results = config.AssemblylineResults(args.output_dir)
@@ -267,82 +446,223 @@ def main():
     if not os.path.exists(results.tmp_dir):
         logging.info("Creating tmp directory '%s'" % (results.tmp_dir))
         os.makedirs(results.tmp_dir)
+    # the filtered and sorted shards of the reference and libraries are
+    # written to the cache directory, which is kept after the run when
+    # libraries may be appended later
+    cache_dir = results.library_cache_dir
+    keep_cache = args.append or args.keep_cache
+    if args.append:
+        prev_entries = read_cache_manifest(cache_dir)
+        library_id_pairs = read_id_map(results.library_id_map)
+        sample_id_pairs = read_id_map(results.sample_id_map)
+        logging.info("Appending to %d libraries" % (len(library_id_pairs)))
+        if len(prev_entries) == 0:
+            logging.warning("No cached libraries in '%s', only the "
+                            "libraries in the library table will be "
+                            "aggregated" % (cache_dir))
+    else:
+        prev_entries = []
+        library_id_pairs = []
+        sample_id_pairs = []
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
     # parse sample table
     logging.info("Parsing library table")
     libraries = []
     valid = True
-    library_num = 1
-    sample_num = 1
-    sample_id_map = {}
-    library_map_fileh = open(results.library_id_map, 'w')
-    sample_map_fileh = open(results.sample_id_map, 'w')
+    library_id_map = dict((x[1], x[0]) for x in library_id_pairs)
+    sample_id_map = dict((x[1], x[0]) for x in sample_id_pairs)
     for library in Library.from_file(args.library_table_file):
         # exclude samples
         if not os.path.exists(library.gtf_file):
             logging.warning("Library '%s' GTF file not found" % (library.library_id)) 
             continue
-        # rename library id
-        new_library_id = "L%d" % (library_num)
-        print >>library_map_fileh, '\t'.join([new_library_id, library.library_id]) 
-        library_num += 1
+        # rename library id. appended libraries keep their ids
+        if library.library_id in library_id_map:
+            new_library_id = library_id_map.pop(library.library_id)
+        else:
+            new_library_id = "L%d" % (len(library_id_pairs) + 1)
+            library_id_pairs.append((new_library_id, library.library_id))
         library.library_id = new_library_id
         # rename sample id
         if library.sample_id not in sample_id_map:
-            new_sample_id = "S%d" % (sample_num)
-            print >>sample_map_fileh, '\t'.join([new_sample_id, library.sample_id]) 
+            new_sample_id = "S%d" % (len(sample_id_pairs) + 1)
+            sample_id_pairs.append((new_sample_id, library.sample_id))
             sample_id_map[library.sample_id] = new_sample_id
-            sample_num += 1
         else:
             new_sample_id = sample_id_map[library.sample_id]
         library.sample_id = new_sample_id
         libraries.append(library)
     if not valid:
         logging.warning("Invalid libraries in table file")
+    library_map_fileh = open(results.library_id_map, 'w')
+    for fields in library_id_pairs:
+        print >>library_map_fileh, '\t'.join(fields)
     library_map_fileh.close()
+    sample_map_fileh = open(results.sample_id_map, 'w')
+    for fields in sample_id_pairs:
+        print >>sample_map_fileh, '\t'.join(fields)
     sample_map_fileh.close()
-    # setup output files
-    tmp_file = os.path.join(results.tmp_dir, "transcripts.unsorted.gtf")
-    tmpfileh = open(tmp_file, "w")
-    dropfileh = open(results.transcripts_dropped_gtf_file, "w")
-    statsfileh = open(results.transcript_stats_file, 'w')
-    header_fields = ['#library_id']
-    header_fields.extend(config.TRANSCRIPT_STATS_FIELDS)
-    header_fields.extend([("failed_q%d" % x) for x in config.TRANSCRIPT_SCORE_QUANTILES])
-    header_fields.extend([("passed_q%d" % x) for x in config.TRANSCRIPT_SCORE_QUANTILES])
-    print >>statsfileh, '\t'.join(header_fields)
-    # read test transcripts
-    test_gene_ids = set()
-    if args.test_file is not None:
-        fileh = open(args.test_file)
-        test_gene_ids.update(line.strip() for line in fileh)
-        fileh.close()
-        logging.info("Read %d test genes" % len(test_gene_ids))
+    # shards are keyed by the contents of their input files and the 
+    # parameters that affect them. libraries of earlier runs that are 
+    # not in the library table keep their shards
+    def get_checksum(filename):
+        # checksums are remembered by path, size and modification time.
+        # shards are only reused when the cache is kept
+        if (filename is None) or (not keep_cache):
+            return None
+        return file_checksum(filename, cache_dir)
+    if args.ref_cache_dir is None:
+        args.ref_cache_dir = default_cache_dir(args.ref_gtf_file, 
+                                               results.run_dir)
+        logging.info("Reference cache dir '%s'" % (args.ref_cache_dir))
+    ref_key = get_cache_key([reference_checksum(args.ref_gtf_file, 
+                                                args.ref_cache_dir),
+                             get_checksum(args.test_file),
+                             args.random_test_frac])
+    keys = {REFERENCE_SHARD_NAME: ref_key}
+    for library in libraries:
+        keys[library.library_id] = \
+            get_cache_key([get_checksum(library.gtf_file),
+                           library.library_id, library.sample_id,
+                           args.gtf_score_attr, args.min_transcript_length,
+                           args.max_exact_scores])
+    for name, key in prev_entries:
+        if name not in keys:
+            keys[name] = key
+    library_ids = [x[0] for x in library_id_pairs if x[0] in keys]
+    entries = [(REFERENCE_SHARD_NAME, ref_key)]
+    entries.extend((library_id, keys[library_id]) 
+                   for library_id in library_ids)
+    def get_shard_prefix(key):
+        return os.path.join(cache_dir, key)
+    def is_cached(key):
+        return os.path.exists(get_shard_prefix(key) + ".stats")
     # read reference GTF file and aggregate
-    logging.info("Adding reference GTF file")
-    add_reference_gtf_file(args.ref_gtf_file, test_gene_ids, 
-                           args.random_test_frac, tmpfileh)
-    # parse sample table
-    logging.info("Adding libraries")
+    if is_cached(ref_key):
+        logging.info("Using cached reference GTF file")
+    else:
+        # read test transcripts
+        test_gene_ids = set()
+        if args.test_file is not None:
+            fileh = open(args.test_file)
+            test_gene_ids.update(line.strip() for line in fileh)
+            fileh.close()
+            logging.info("Read %d test genes" % len(test_gene_ids))
+        logging.info("Adding reference GTF file")
+        ref_cache = get_reference_cache(args.ref_gtf_file, 
+                                        args.ref_cache_dir,
+                                        tmp_dir=results.tmp_dir)
+        shard_prefix = get_shard_prefix(ref_key)
+        fileh = open(shard_prefix + ".gtf", "w")
+        add_reference_gtf_file(ref_cache, test_gene_ids, 
+                               args.random_test_frac, fileh)
+        fileh.close()
+        open(shard_prefix + ".stats", 'w').close()
+    # process libraries in parallel
+    tasks = []
     for library in libraries:
-        t_dict = read_gtf_file(library, args.gtf_score_attr)
-        logging.debug("Read %s transcripts from file %s" % (len(t_dict), 
-                                                            library.gtf_file))
-        if len(t_dict) == 0:
-            logging.warning("Library %s has no transcripts" % 
-                            (library.library_id))
-        else:
-            filter_transcripts(library.library_id, t_dict, 
-                               tmpfileh, dropfileh, statsfileh, 
-                               args.min_transcript_length)
+        key = keys[library.library_id]
+        if is_cached(key):
+            continue
+        tasks.append((library, args.gtf_score_attr, 
+                      args.min_transcript_length, args.streaming,
+                      args.max_exact_scores, get_shard_prefix(key), 
+                      results.tmp_dir))
+    logging.info("Adding %d libraries (%d cached)" % 
+                 (len(tasks), len(entries) - 1 - len(tasks)))
+    pool = multiprocessing.Pool(processes=max(1, args.num_processors))
+    for library_id, num_transcripts in pool.imap(aggregate_library, tasks):
+        logging.debug("Read %s transcripts from library %s" % 
+                      (num_transcripts, library_id))
+    pool.close()
+    pool.join()
+    # when the shards of the earlier run are unchanged the new shards
+    # are merged into the existing output. otherwise the output is 
+    # rebuilt from all of the shards. the statistics and dropped 
+    # transcripts are written to temporary files that replace the 
+    # output files only after the merge succeeds, so that a failed run
+    # leaves the output (and the manifest) of the earlier run intact
+    output_files = [results.transcripts_gtf_file, 
+                    results.transcripts_dropped_gtf_file,
+                    results.transcript_stats_file]
+    tmp_dropped_file = os.path.join(results.tmp_dir, 
+                                    "transcripts.dropped.tmp.gtf")
+    tmp_stats_file = os.path.join(results.tmp_dir, "library_stats.tmp.txt")
+    dropfileh = open(tmp_dropped_file, "w")
+    statsfileh = open(tmp_stats_file, 'w')
+    if (len(prev_entries) > 0 and 
+        entries[:len(prev_entries)] == prev_entries and
+        all(os.path.exists(f) for f in output_files)):
+        new_entries = entries[len(prev_entries):]
+        merge_files = [results.transcripts_gtf_file]
+        shutil.copyfileobj(open(results.transcripts_dropped_gtf_file), 
+                           dropfileh)
+        shutil.copyfileobj(open(results.transcript_stats_file), statsfileh)
+    else:
+        new_entries = entries
+        merge_files = []
+        header_fields = ['#library_id']
+        header_fields.extend(config.TRANSCRIPT_STATS_FIELDS)
+        header_fields.extend([("failed_q%d" % x) for x in config.TRANSCRIPT_SCORE_QUANTILES])
+        header_fields.extend([("passed_q%d" % x) for x in config.TRANSCRIPT_SCORE_QUANTILES])
+        print >>statsfileh, '\t'.join(header_fields)
+    # statistics and dropped transcripts are written in library order
+    for name, key in new_entries:
+        shard_prefix = get_shard_prefix(key)
+        if name != REFERENCE_SHARD_NAME:
+            stats = open(shard_prefix + ".stats").read()
+            if len(stats) == 0:
+                logging.warning("Library %s has no transcripts" % (name))
+                continue
+            statsfileh.write(stats)
+            shutil.copyfileobj(open(shard_prefix + ".dropped.gtf"), 
+                               dropfileh)
+        merge_files.append(shard_prefix + ".gtf")
     statsfileh.close()
-    tmpfileh.close()
-    logging.info("Sorting GTF")
-    retcode = sort_gtf(tmp_file, results.transcripts_gtf_file, tmp_dir=results.tmp_dir)
-    if retcode != 0:
-        logging.error("sort GTF failed")
-        if os.path.exists(results.transcripts_gtf_file):
-            os.remove(results.transcripts_gtf_file)
-    os.remove(tmp_file)
+    dropfileh.close()
+    retcode = 0
+    if len(new_entries) == 0:
+        logging.info("No libraries to add")
+    else:
+        logging.info("Merging %d sorted GTF shards" % (len(merge_files)))
+        tmp_file = os.path.join(results.tmp_dir, "transcripts.merged.gtf")
+        def remove_tmp_files():
+            for filename in (tmp_file, tmp_dropped_file, tmp_stats_file):
+                if os.path.exists(filename):
+                    os.remove(filename)
+        try:
+            retcode = merge_gtf(merge_files, tmp_file, 
+                                tmp_dir=results.tmp_dir)
+        except:
+            remove_tmp_files()
+            raise
+        if retcode != 0:
+            logging.error("merge GTF failed")
+            remove_tmp_files()
+            return retcode
+        os.rename(tmp_file, results.transcripts_gtf_file)
+    os.rename(tmp_dropped_file, results.transcripts_dropped_gtf_file)
+    os.rename(tmp_stats_file, results.transcript_stats_file)
+    if keep_cache:
+        # remove shards that are no longer part of the run
+        cached = set(key for name, key in entries)
+        for filename in os.listdir(cache_dir):
+            if filename in (LIBRARY_CACHE_MANIFEST, REF_CACHE_CHECKSUMS_FILE):
+                continue
+            if filename.split('.', 1)[0] not in cached:
+                os.remove(os.path.join(cache_dir, filename))
+        write_cache_manifest(cache_dir, entries)
+    else:
+        shutil.rmtree(cache_dir)
+    if (retcode == 0) and (len(new_entries) > 0):
+        # later stages read the transcripts from the store rather than
+        # parsing the GTF file again
+        logging.info("Writing transcript store")
+        write_transcript_store(results.transcripts_gtf_file, 
+                               results.transcripts_store)
     logging.info("Done")
     return retcode
 
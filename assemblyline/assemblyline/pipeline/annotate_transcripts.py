@@ -25,16 +25,25 @@ import argparse
 import os
 import collections
 import sys
+import shutil
 from multiprocessing import Process, JoinableQueue
 
 # project imports
 import assemblyline
 import assemblyline.lib.config as config
 from assemblyline.lib.bx.intersection import Interval, IntervalTree
-from assemblyline.lib.gtf import parse_loci, merge_sort_gtf_files
+from assemblyline.lib.gtf import parse_loci, sort_gtf_lines, open_gtf, \
+    GTFWriter, index_loci_parallel, read_locus_index, read_locus_lines, \
+    locus_index_is_current, LOCUS_INDEX_SUFFIX
+from assemblyline.lib.bgzf import is_gzip_file, is_bgzf_file
+from assemblyline.lib.chunks import ChunkWriter, read_chunk_index, \
+    merge_chunks, prepare_chunk_dir
 from assemblyline.lib.transcript import transcripts_from_gtf_lines, \
     POS_STRAND, NEG_STRAND, NO_STRAND
-from assemblyline.lib.base import Category, GTFAttr, FLOAT_PRECISION
+from assemblyline.lib.tstore import TranscriptStore, is_transcript_store, \
+    transcript_store_is_current, write_transcript_store
+from assemblyline.lib.base import Category, GTFAttr, GTF_ATTR_DEFS, \
+    FLOAT_PRECISION
 from assemblyline.lib.assemble.transcript_graph import \
     find_exon_boundaries, split_exons
 
@@ -45,54 +54,68 @@ CInfo = collections.namedtuple('CategoryInfo',
                                 'ann_cov_ratio',
                                 'is_test'])
 
-def compute_coverage_overlap(nodes1, nodes2):
-    a = set(nodes1)
-    b = set(nodes2)
-    shared_nodes = a.intersection(b)
-    union_nodes = a.union(b)
-    shared_length = sum((n[1] - n[0]) for n in shared_nodes)    
-    total_length = sum((n[1] - n[0]) for n in union_nodes)
-    return shared_length, total_length
+class RefInfo(object):
+    '''
+    reference transcript of a locus with the nodes, introns and test
+    flag that are compared against the other transcripts of the locus.
+    computed once per locus rather than once per comparison
+    '''
+    __slots__ = ('t', 't_id', 'nodes', 'length', 'introns', 'is_test')
 
-def find_best_coverage_overlap(nodes, reftuples, ignore_test=False):
+    def __init__(self, t, nodes):
+        self.t = t
+        self.t_id = t.attrs[GTFAttr.TRANSCRIPT_ID]
+        self.nodes = frozenset(nodes)
+        self.length = sum((n[1] - n[0]) for n in self.nodes)
+        self.introns = frozenset(t.iterintrons())
+        self.is_test = bool(int(t.attrs[GTFAttr.TEST]))
+
+def compute_coverage_overlap(nodes, length, ref):
+    '''
+    returns the length of the nodes shared by a set of nodes with total
+    length 'length' and a reference, and the length of their union
+    '''
+    shared_length = sum((n[1] - n[0]) for n in nodes.intersection(ref.nodes))
+    return shared_length, length + ref.length - shared_length
+
+def find_best_coverage_overlap(nodes, length, refs, ignore_test=False):
     # find the reference transcript with the best overlap
-    best_ref_t = None
+    best_ref = None
     best_shared_cov_ratio = 0.0
-    for ref_t, ref_nodes in reftuples:
-        is_test = bool(int(ref_t.attrs[GTFAttr.TEST]))
-        if is_test and ignore_test:
+    for ref in refs:
+        if ref.is_test and ignore_test:
             continue
-        shared_cov, union_cov = compute_coverage_overlap(nodes, ref_nodes)
+        shared_cov, union_cov = compute_coverage_overlap(nodes, length, ref)
         shared_ratio = float(shared_cov) / union_cov
         if shared_ratio > best_shared_cov_ratio:
-            best_ref_t = ref_t
+            best_ref = ref
             best_shared_cov_ratio = shared_ratio
-    return best_ref_t, best_shared_cov_ratio
+    return best_ref, best_shared_cov_ratio
 
-def find_best_intron_overlap(test_nodes, test_introns, reftuples, 
+def find_best_intron_overlap(test_nodes, test_length, test_introns, refs, 
                              ignore_test=False):
-    best_ref_t = None
+    best_ref = None
     best_shared_intron_ratio = 0.0
     best_shared_cov_ratio = 0.0    
-    for ref_t, ref_nodes in reftuples:
-        is_test = bool(int(ref_t.attrs[GTFAttr.TEST]))
-        if is_test and ignore_test:
+    for ref in refs:
+        if ref.is_test and ignore_test:
             continue
-        ref_introns = set(ref_t.iterintrons())
-        shared_introns = test_introns.intersection(ref_introns)
-        union_introns = test_introns.union(ref_introns)
-        shared_intron_ratio = float(len(shared_introns)) / len(union_introns)
-        shared_cov, total_cov = compute_coverage_overlap(test_nodes, ref_nodes)
+        num_shared_introns = len(test_introns.intersection(ref.introns))
+        num_union_introns = (len(test_introns) + len(ref.introns) - 
+                             num_shared_introns)
+        shared_intron_ratio = float(num_shared_introns) / num_union_introns
+        shared_cov, total_cov = compute_coverage_overlap(test_nodes, 
+                                                         test_length, ref)
         shared_cov_ratio = float(shared_cov) / total_cov
         if ((shared_intron_ratio > best_shared_intron_ratio) or
             ((shared_intron_ratio == best_shared_intron_ratio) and
              (shared_cov_ratio > best_shared_cov_ratio))):
-            best_ref_t = ref_t
+            best_ref = ref
             best_shared_intron_ratio = shared_intron_ratio
             best_shared_cov_ratio = shared_cov_ratio
-    return best_ref_t, best_shared_intron_ratio, best_shared_cov_ratio
+    return best_ref, best_shared_intron_ratio, best_shared_cov_ratio
 
-def categorize_transcript(t, nodes, introns, 
+def categorize_transcript(t, nodes, length, introns, 
                           shared_intron_refs,
                           same_strand_refs,
                           opp_strand_refs,
@@ -101,33 +124,31 @@ def categorize_transcript(t, nodes, introns,
     if len(shared_intron_refs) > 0:
         # find reference transcript with best intron overlap
         # and break ties using total coverage overlap
-        best_ref_t, ann_intron_ratio, ann_cov_ratio = \
-            find_best_intron_overlap(nodes, introns, 
+        best_ref, ann_intron_ratio, ann_cov_ratio = \
+            find_best_intron_overlap(nodes, length, introns, 
                                      shared_intron_refs,                                         
                                      ignore_test)
-        if best_ref_t is not None:    
+        if best_ref is not None:    
             # determine whether this is a 'test' transcript
-            is_test = bool(int(best_ref_t.attrs[GTFAttr.TEST]))
             return CInfo(category=Category.SAME_STRAND ,
-                         ref=best_ref_t,
+                         ref=best_ref.t,
                          ann_cov_ratio=ann_cov_ratio,
                          ann_intron_ratio=ann_intron_ratio,
-                         is_test=is_test)                
+                         is_test=best_ref.is_test)                
             
     if len(same_strand_refs) > 0:
         # find the reference transcript with the best overlap
-        best_ref_t, ann_cov_ratio = \
-            find_best_coverage_overlap(nodes, 
+        best_ref, ann_cov_ratio = \
+            find_best_coverage_overlap(nodes, length,
                                        same_strand_refs, 
                                        ignore_test)
-        if best_ref_t is not None:
+        if best_ref is not None:
             # determine whether this is a 'test' transcript
-            is_test = bool(int(best_ref_t.attrs[GTFAttr.TEST]))
             return CInfo(category=Category.SAME_STRAND,
-                         ref=best_ref_t,
+                         ref=best_ref.t,
                          ann_cov_ratio=ann_cov_ratio,
                          ann_intron_ratio=0.0,
-                         is_test=is_test)                
+                         is_test=best_ref.is_test)                
 
     # not a reference transcript
     best_ref_t = None
@@ -138,10 +159,11 @@ def categorize_transcript(t, nodes, introns,
         # compared to reference transcripts
         category = Category.OPP_STRAND
         # find the reference transcript with the best overlap
-        best_ref_t, ann_cov_ratio = \
-            find_best_coverage_overlap(nodes, 
+        best_ref, ann_cov_ratio = \
+            find_best_coverage_overlap(nodes, length,
                                        opp_strand_refs, 
                                        ignore_test=False)
+        best_ref_t = best_ref.t if best_ref is not None else None
     else:
         # transcript has no coverage overlapping a reference transcript
         # so it must be either intronic, interleaving, or intergenic
@@ -246,11 +268,13 @@ def annotate_locus(transcripts,
         if is_ref:
             # split exons that cross boundaries and get the
             # nodes in the transcript path
-            for n in split_exons(t, boundaries):
-                ref_node_dict[n][t.strand].append(t)
+            nodes = list(split_exons(t, boundaries))
+            ref = RefInfo(t, nodes)
+            for n in nodes:
+                ref_node_dict[n][t.strand].append(ref)
             # add to introns
             for start,end in t.iterintrons():
-                ref_intron_dict[(t.strand, start, end)].append(t)
+                ref_intron_dict[(t.strand, start, end)].append(ref)
                 all_introns.add((t.strand,start,end))
         else:
             if t.strand != NO_STRAND:
@@ -271,6 +295,8 @@ def annotate_locus(transcripts,
     for t in inp_transcripts:
         # get transcript nodes and introns
         nodes = list(split_exons(t, boundaries))
+        node_set = frozenset(nodes)
+        length = sum((n[1] - n[0]) for n in node_set)
         introns = set(t.iterintrons())
         # try to resolve strand
         strand = t.strand
@@ -286,29 +312,22 @@ def annotate_locus(transcripts,
         for start,end in introns:
             if (strand, start, end) in ref_intron_dict:
                 refs = ref_intron_dict[(strand, start, end)]
-                intron_ref_dict.update((ref.attrs[GTFAttr.TRANSCRIPT_ID],ref) 
-                                       for ref in refs)
-        intron_refs = []
-        for ref in intron_ref_dict.itervalues():
-            intron_refs.append((ref,list(split_exons(ref, boundaries))))
+                intron_ref_dict.update((ref.t_id, ref) for ref in refs)
+        intron_refs = intron_ref_dict.values()
         # get all reference transcripts that share coverage
         same_strand_ref_dict = {}
         opp_strand_ref_dict = {}
         for n in nodes:
             if n in ref_node_dict:
                 strand_refs = ref_node_dict[n]
-                same_strand_ref_dict.update((ref.attrs[GTFAttr.TRANSCRIPT_ID],ref) 
+                same_strand_ref_dict.update((ref.t_id, ref) 
                                             for ref in strand_refs[strand])
-                opp_strand_ref_dict.update((ref.attrs[GTFAttr.TRANSCRIPT_ID],ref) 
+                opp_strand_ref_dict.update((ref.t_id, ref) 
                                            for ref in strand_refs[opp_strand])
-        same_strand_refs = []
-        for ref in same_strand_ref_dict.itervalues():
-            same_strand_refs.append((ref,list(split_exons(ref, boundaries))))
-        opp_strand_refs = []
-        for ref in opp_strand_ref_dict.itervalues():            
-            opp_strand_refs.append((ref,list(split_exons(ref, boundaries))))
+        same_strand_refs = same_strand_ref_dict.values()
+        opp_strand_refs = opp_strand_ref_dict.values()
         # categorize
-        cinf = categorize_transcript(t, nodes, introns, 
+        cinf = categorize_transcript(t, node_set, length, introns, 
                                      intron_refs,
                                      same_strand_refs,
                                      opp_strand_refs,
@@ -316,7 +335,7 @@ def annotate_locus(transcripts,
                                      ignore_test=False)
         if cinf.is_test:
             # recategorize test transcripts
-            cinf2 = categorize_transcript(t, nodes, introns, 
+            cinf2 = categorize_transcript(t, node_set, length, introns, 
                                           intron_refs,
                                           same_strand_refs,
                                           opp_strand_refs,
@@ -368,60 +387,132 @@ def annotate_locus(transcripts,
             t.attrs[GTFAttr.MEAN_PCTRANK] = mean_pctrank
             t.attrs[GTFAttr.MEAN_RECURRENCE] = mean_recur
 
-def annotate_gtf_worker(input_queue, gtf_file, gtf_sample_attr): 
-    fileh = open(gtf_file, 'w')
+def annotate_gtf_worker(input_queue, input_file, worker_prefix, 
+                        gtf_sample_attr): 
+    # loci are read from the transcript store by range, read from the 
+    # GTF file by byte range, or are passed as lists of GTF lines
+    store = None
+    input_fileh = None
+    if is_transcript_store(input_file):
+        store = TranscriptStore(input_file)
+    else:
+        input_fileh = open_gtf(input_file, 'rb')
+    # the output of each locus is written as a sorted chunk
+    writer = ChunkWriter(worker_prefix, ['.gtf'], [sort_gtf_lines])
+    gtf_writer = GTFWriter(writer.buffers[0])
     while True:
-        lines = input_queue.get()
-        if len(lines) == 0:
-            break             
-        transcripts = transcripts_from_gtf_lines(lines)
+        task = input_queue.get()
+        if len(task) == 0:
+            break
+        locus_num, task = task[0], task[1:]
+        if store is not None:
+            first, count = task
+            transcripts = store.transcripts(first, count, GTF_ATTR_DEFS,
+                                            compact=True)
+        elif len(task) == 2:
+            offset, length = task
+            lines = read_locus_lines(input_fileh, offset, length)
+            transcripts = transcripts_from_gtf_lines(lines, GTF_ATTR_DEFS)
+        else:
+            transcripts = transcripts_from_gtf_lines(task[0], GTF_ATTR_DEFS)
         annotate_locus(transcripts, gtf_sample_attr) 
+        # transcripts read from a store and from a GTF file are written
+        # with the same attribute order
         for t in transcripts:
-            for f in t.to_gtf_features():
-                print >>fileh, str(f)
+            t.write_gtf(gtf_writer, ordered=True)
+        gtf_writer.flush()
+        writer.write_chunk((locus_num,))
         input_queue.task_done()
         # explicitly delete large objects
-        del lines
+        del task
         del transcripts
-    fileh.close()
+    writer.close()
+    if input_fileh is not None:
+        input_fileh.close()
     input_queue.task_done()
 
-def annotate_gtf_parallel(input_gtf_file,
+def get_resume_params(input_file, gtf_sample_attr):
+    '''
+    returns a dictionary describing the input file and the options that
+    affect the output, which must be the same to resume a run
+    '''
+    return {'input_file': os.path.abspath(input_file),
+            'input_size': str(os.path.getsize(input_file)),
+            'input_mtime': str(os.path.getmtime(input_file)),
+            'gtf_sample_attr': gtf_sample_attr}
+
+def annotate_gtf_parallel(input_file,
                           output_gtf_file, 
                           gtf_sample_attr, 
                           num_processors, 
-                          tmp_dir):
+                          tmp_dir,
+                          resume=False):
+    '''
+    annotate the transcripts in 'input_file', which can be a sorted GTF 
+    file or a transcript store, and write a sorted GTF file. if 'resume'
+    is True the loci annotated by an interrupted run are not annotated 
+    again
+    '''
+    # worker output is kept until the run completes so that an 
+    # interrupted run can be resumed
+    chunk_dir = os.path.join(tmp_dir, "annotate")
+    params = get_resume_params(input_file, gtf_sample_attr)
+    run_dir, resumed_prefixes, resumed_chunk_indexes = \
+        prepare_chunk_dir(chunk_dir, params, resume=resume)
+    completed_loci = set(key[0] for chunks in resumed_chunk_indexes
+                         for key, fields, extents in chunks)
+    if resume:
+        logging.info("Resuming run with %d completed loci" % 
+                     (len(completed_loci)))
     # create queue
     input_queue = JoinableQueue(maxsize=num_processors*3)
     # start worker processes
     procs = []
-    worker_gtf_files = []
+    worker_prefixes = []
     for i in xrange(num_processors):
-        worker_gtf_file = os.path.join(tmp_dir, "annotate_worker%03d.gtf" % (i))
-        worker_gtf_files.append(worker_gtf_file)
-        args = (input_queue, worker_gtf_file, gtf_sample_attr)
+        worker_prefix = os.path.join(run_dir, "worker%03d" % (i))
+        worker_prefixes.append(worker_prefix)
+        args = (input_queue, input_file, worker_prefix, gtf_sample_attr)
         p = Process(target=annotate_gtf_worker, args=args)
         p.daemon = True
         p.start()
         procs.append(p)
-    for lines in parse_loci(open(input_gtf_file)):
-        input_queue.put(lines)
+    # loci are numbered in the order of the input file
+    if is_transcript_store(input_file):
+        locus_iter = (tuple(locus[3:5]) 
+                      for locus in TranscriptStore(input_file).loci())
+    elif is_bgzf_file(input_file) or not is_gzip_file(input_file):
+        # workers read loci from the GTF file by byte range so that the
+        # input is only parsed once by the workers themselves
+        index_file = input_file + LOCUS_INDEX_SUFFIX
+        if locus_index_is_current(input_file, index_file):
+            loci = read_locus_index(index_file)
+        else:
+            loci = index_loci_parallel(input_file, num_processors)
+        locus_iter = (tuple(locus[3:5]) for locus in loci)
+    else:
+        locus_iter = ((lines,) for lines in parse_loci(open_gtf(input_file)))
+    for locus_num, task in enumerate(locus_iter, start=1):
+        if locus_num not in completed_loci:
+            input_queue.put((locus_num,) + task)
     # stop workers
     for p in procs:
-        input_queue.put([])
+        input_queue.put(())
     # close queue
     input_queue.join()
     input_queue.close()
     # join worker processes
     for p in procs:
         p.join()
-    # merge/sort worker gtf files
-    logging.debug("Merging %d worker GTF file(s)" % (num_processors))
-    merge_sort_gtf_files(worker_gtf_files, output_gtf_file, tmp_dir=tmp_dir)
+    # merge worker gtf files in locus order
+    chunk_indexes = [read_chunk_index(prefix) for prefix in worker_prefixes]
+    worker_prefixes = resumed_prefixes + worker_prefixes
+    chunk_indexes = resumed_chunk_indexes + chunk_indexes
+    logging.debug("Merging %d worker GTF file(s)" % (len(worker_prefixes)))
+    worker_gtf_files = [prefix + '.gtf' for prefix in worker_prefixes]
+    merge_chunks(chunk_indexes, worker_gtf_files, 0, output_gtf_file)
     # remove worker gtf files
-    for filename in worker_gtf_files:
-        if os.path.exists(filename):
-            os.remove(filename)
+    shutil.rmtree(chunk_dir)
 
 def main():
     # parse command line
@@ -436,6 +527,17 @@ def main():
                         help="GTF attribute field used to distinguish "
                         "independent samples in order to compute "
                         "recurrence [default=%(default)s]")
+    parser.add_argument("--input", dest="input_file", default=None,
+                        metavar="FILE",
+                        help="Sorted GTF file or transcript store to "
+                        "annotate [default=transcript store or GTF "
+                        "file in run directory]")
+    parser.add_argument("--resume", dest="resume", action="store_true",
+                        default=False,
+                        help="Resume an interrupted run, keeping the "
+                        "loci that were annotated. The run is started "
+                        "again if the input file or options have changed "
+                        "[default=%(default)s]")
     parser.add_argument("run_dir")
     args = parser.parse_args()
     # set logging level
@@ -456,16 +558,29 @@ def main():
     logging.info("num processors:       %d" % (args.num_processors))
     logging.info("gtf sample attribute: %s" % (args.gtf_sample_attr))
     logging.info("run directory:        %s" % (args.run_dir))
+    logging.info("resume:               %s" % (args.resume))
     logging.info("----------------------------------")   
     # setup results
     results = config.AssemblylineResults(args.run_dir)
+    # read transcripts from the store when it is up to date
+    input_file = args.input_file
+    if input_file is None:
+        input_file = results.transcripts_gtf_file
+        if transcript_store_is_current(results.transcripts_gtf_file,
+                                       results.transcripts_store):
+            input_file = results.transcripts_store
+    logging.info("Input file:           %s" % (input_file))
     # function to gather transcript attributes
     logging.info("Annotating GTF file")
-    annotate_gtf_parallel(results.transcripts_gtf_file,
+    annotate_gtf_parallel(input_file,
                           results.annotated_transcripts_gtf_file,
                           args.gtf_sample_attr,
                           num_processors,
-                          results.tmp_dir)
+                          results.tmp_dir,
+                          resume=args.resume)
+    logging.info("Writing transcript store")
+    write_transcript_store(results.annotated_transcripts_gtf_file,
+                           results.annotated_transcripts_store)
     logging.info("Done")
     return 0
 
@@ -25,40 +25,65 @@ import sys
 import logging
 import argparse
 import collections
-import subprocess
 import shutil
-from multiprocessing import Process, JoinableQueue, Value, Lock
+import re
+import time
+import Queue
+from multiprocessing import Process, JoinableQueue, Queue as ProcessQueue, \
+    Value
 
 import assemblyline
 from assemblyline.lib.bx.cluster import ClusterTree
 from assemblyline.lib.base import float_check_nan, GTFAttr
-from assemblyline.lib.gtf import GTFFeature
-from assemblyline.lib.gtf import parse_loci, merge_sort_gtf_files
-from assemblyline.lib.transcript import transcripts_from_gtf_lines, \
-    strand_int_to_str, NEG_STRAND
+from assemblyline.lib.gtf import GTFWriter
+from assemblyline.lib.bed import BEDWriter
+from assemblyline.lib.gtf import sort_gtf_lines, write_locus_index, \
+    read_locus_index, read_locus_lines, locus_index_is_current, \
+    LOCUS_INDEX_SUFFIX, BGZF_SUFFIX, open_gtf, LocusGuard, GUARD_MODES, \
+    GUARD_SPLIT, write_locus_guard_stats, write_locus_guard_records, \
+    read_locus_guard_stats
+from assemblyline.lib.chunks import ChunkWriter, read_chunk_index, \
+    merge_chunks, prepare_chunk_dir
+from assemblyline.lib.transcript import strand_int_to_str, NEG_STRAND
+from assemblyline.lib.gtfparse import transcripts_from_gtf_lines
+from assemblyline.lib.tstore import TranscriptStore, is_transcript_store
 
 from assemblyline.lib.assemble.base import NODE_SCORE
 from assemblyline.lib.assemble.filter import filter_transcripts
 from assemblyline.lib.assemble.transcript_graph import create_transcript_graphs
 from assemblyline.lib.assemble.assembler import assemble_transcript_graph
 
-class LockValue(object):
-    def __init__(self, initval=0):
-        self.val = Value('L', initval)
-        self.lock = Lock()
+class IdCounter(object):
+    '''
+    assigns consecutive integer ids (starting from 1) within a locus. the
+    ids are renumbered into a single global sequence when worker output 
+    is merged (see 'get_locus_id_offsets')
+    '''
+    def __init__(self):
+        self.val = 0
     def next(self):
-        with self.lock:
-            cur_val = self.val.value
-            self.val.value += 1
-            return cur_val
+        self.val += 1
+        return self.val
 
 SCORING_MODES = ("unweighted", "gtf_attr")
 STRAND_NAMES = ('pos', 'neg', 'none')
 STRAND_COLORS = ('255,0,0', '0,0,255', '0,0,0')
+# seconds between checks for subtasks once the input has been exhausted
+SUBTASK_POLL_INTERVAL = 0.1
+# weight of locus span relative to the (transcripts x exon boundaries) 
+# term when estimating the cost of assembling a locus
+LOCUS_COST_PER_BP = 1.0e-3
+# suffix of the files where workers record the super-loci they divided
+LOCUS_GUARD_SUFFIX = '.guard'
+# options that may change when an interrupted run is resumed
+RESUME_IGNORED_OPTIONS = ('verbose', 'num_processors', 'locus_index_file',
+                          'cost_log_file', 'output_dir', 'resume')
 
 class RunConfig(object):
     def __init__(self):
         self.gtf_input_file = None
+        self.locus_index_file = None
+        self.cost_log_file = None
         self.verbose = False
         self.num_processors = 1
         self.scoring_mode = "gtf_attr"
@@ -72,10 +97,17 @@ class RunConfig(object):
         self.ksensitivity = 0.90
         self.fraction_major_isoform = 0.01
         self.max_paths = 1000
+        self.fanout_transcripts = 0
+        self.max_locus_span = 0
+        self.max_locus_transcripts = 0
+        self.super_locus_mode = GUARD_SPLIT
+        self.ksearch_timing = False
         self.output_dir = "assembly"
         self.create_gtf = True
         self.create_bed = False
         self.create_bedgraph = False
+        self.bgzip = False
+        self.resume = False
     
     def parse_args(self):
         parser = argparse.ArgumentParser()
@@ -153,6 +185,54 @@ class RunConfig(object):
                          default=self.max_paths, metavar="N",
                          help="Maximum path finding iterations to perform "
                          "for each gene [default=%(default)s]")
+        grp.add_argument("--fanout-transcripts", dest="fanout_transcripts",
+                         type=int, default=self.fanout_transcripts, 
+                         metavar="N",
+                         help="Assemble the independent subgraphs of loci "
+                         "with at least N transcripts as separate tasks "
+                         "across all processes. Setting to zero assembles "
+                         "each locus in a single process "
+                         "[default=%(default)s]")
+        grp.add_argument("--max-locus-span", dest="max_locus_span",
+                         type=int, default=self.max_locus_span, 
+                         metavar="N",
+                         help="Divide loci that span more than N bp "
+                         "(see --super-locus-mode). Setting to zero "
+                         "places no limit on locus span [default=%(default)s]")
+        grp.add_argument("--max-locus-transcripts", 
+                         dest="max_locus_transcripts", type=int, 
+                         default=self.max_locus_transcripts, metavar="N",
+                         help="Divide loci with more than N transcripts "
+                         "(see --super-locus-mode). Setting to zero "
+                         "places no limit on the number of transcripts "
+                         "[default=%(default)s]")
+        grp.add_argument("--super-locus-mode", dest="super_locus_mode",
+                         choices=GUARD_MODES, default=self.super_locus_mode,
+                         metavar="MODE",
+                         help="How to divide loci that exceed the limits "
+                         "set by --max-locus-span or --max-locus-transcripts. "
+                         "'split' cuts loci where they are crossed by the "
+                         "fewest transcripts, 'quarantine' removes the "
+                         "crossing transcripts (and transcripts longer "
+                         "than the maximum span) and assembles them "
+                         "separately. Divided loci are reported in the "
+                         "file 'locus_guard.txt' of the output directory "
+                         "[default=%(default)s]")
+        grp.add_argument("--ksearch-timing", dest="ksearch_timing",
+                         action="store_true", default=self.ksearch_timing,
+                         help="Report the time taken to optimize 'k' for "
+                         "each gene (default: not set)")
+        grp.add_argument("--locus-index", dest="locus_index_file",
+                         default=self.locus_index_file, metavar="FILE",
+                         help="Byte offset index of loci in the input GTF "
+                         "file, created if it does not exist or is older "
+                         "than the GTF file [default=<gtf_input_file>%s]" %
+                         (LOCUS_INDEX_SUFFIX))
+        grp.add_argument("--cost-log", dest="cost_log_file", 
+                         default=self.cost_log_file, metavar="FILE",
+                         help="Write the predicted and actual cost of "
+                         "assembling each locus to a tab-delimited FILE "
+                         "(default: not set)")
         grp = parser.add_argument_group("Output options")
         grp.add_argument("-o", "--output-dir", dest="output_dir", 
                          default=self.output_dir,
@@ -172,7 +252,20 @@ class RunConfig(object):
                          default=self.create_bedgraph,
                          help="Produce bedgraph output files "
                          "[default=%(default)s]")
-        parser.add_argument("gtf_input_file")
+        grp.add_argument("--bgzip", action="store_true", dest="bgzip",
+                         default=self.bgzip,
+                         help="Compress the GTF output file with BGZF "
+                         "and index its loci for region queries "
+                         "[default=%(default)s]")
+        grp.add_argument("--resume", action="store_true", dest="resume",
+                         default=self.resume,
+                         help="Resume an interrupted run in the output "
+                         "directory, keeping the output of the loci that "
+                         "were completed. The run is started again if the "
+                         "input file or options that affect the output "
+                         "have changed [default=%(default)s]")
+        parser.add_argument("gtf_input_file", 
+                            help="Sorted GTF file or transcript store")
         # parse command line
         args = parser.parse_args()
         # constrain parameters
@@ -194,6 +287,12 @@ class RunConfig(object):
             parser.error("fraction_major_isoform out of range (0.0-1.0)")
         if (args.max_paths < 1):
             parser.error("max_paths <= 0")
+        if (args.fanout_transcripts < 0):
+            parser.error("fanout_transcripts < 0")
+        if (args.max_locus_span < 0):
+            parser.error("max_locus_span < 0")
+        if (args.max_locus_transcripts < 0):
+            parser.error("max_locus_transcripts < 0")
         # update config attributes
         self.verbose = args.verbose
         self.num_processors = args.num_processors
@@ -202,6 +301,11 @@ class RunConfig(object):
         self.min_transcript_length = args.min_transcript_length
         self.min_trim_length = args.min_trim_length
         self.gtf_input_file = args.gtf_input_file
+        if args.locus_index_file is None:
+            self.locus_index_file = self.gtf_input_file + LOCUS_INDEX_SUFFIX
+        else:
+            self.locus_index_file = args.locus_index_file
+        self.cost_log_file = args.cost_log_file
         self.trim_utr_fraction = args.trim_utr_fraction
         self.trim_intron_fraction = args.trim_intron_fraction
         self.guided = args.guided
@@ -209,15 +313,38 @@ class RunConfig(object):
         self.ksensitivity = args.ksensitivity
         self.fraction_major_isoform = args.fraction_major_isoform
         self.max_paths = args.max_paths
+        self.fanout_transcripts = args.fanout_transcripts
+        self.max_locus_span = args.max_locus_span
+        self.max_locus_transcripts = args.max_locus_transcripts
+        self.super_locus_mode = args.super_locus_mode
+        self.ksearch_timing = args.ksearch_timing
         self.output_dir = args.output_dir
         self.create_gtf = args.create_gtf
         self.create_bed = args.create_bed
         self.create_bedgraph = args.create_bedgraph
+        self.bgzip = args.bgzip
+        self.resume = args.resume
     
+    def resume_params(self):
+        '''
+        returns a dictionary describing the input file and the options 
+        that affect the output, which must be the same to resume a run
+        '''
+        params = {}
+        for name, value in vars(self).iteritems():
+            if name not in RESUME_IGNORED_OPTIONS:
+                params[name] = str(value)
+        params['gtf_input_file'] = os.path.abspath(self.gtf_input_file)
+        params['gtf_input_size'] = str(os.path.getsize(self.gtf_input_file))
+        params['gtf_input_mtime'] = str(os.path.getmtime(self.gtf_input_file))
+        return params
+
     def log(self, logging_func=logging.info):
         logging.info("AssemblyLine version %s" % (assemblyline.__version__))
         logging.info("----------------------------------")
         logging.info("input file:              %s" % (self.gtf_input_file))
+        logging.info("locus index file:        %s" % (self.locus_index_file))
+        logging.info("cost log file:           %s" % (self.cost_log_file))
         logging.info("scoring mode:            %s" % (self.scoring_mode))
         logging.info("gtf score attribute:     %s" % (self.gtf_score_attr))
         logging.info("min transcript length:   %d" % (self.min_transcript_length))
@@ -229,97 +356,104 @@ class RunConfig(object):
         logging.info("ksensitivity:            %f" % (self.ksensitivity))
         logging.info("fraction major isoform:  %f" % (self.fraction_major_isoform))
         logging.info("max paths:               %d" % (self.max_paths))
+        logging.info("fanout transcripts:      %d" % (self.fanout_transcripts))
+        logging.info("max locus span:          %d" % (self.max_locus_span))
+        logging.info("max locus transcripts:   %d" % (self.max_locus_transcripts))
+        logging.info("super locus mode:        %s" % (self.super_locus_mode))
+        logging.info("ksearch timing:          %s" % (self.ksearch_timing))
         logging.info("output directory:        %s" % (self.output_dir))
         logging.info("bed:                     %s" % str(self.create_bed))
         logging.info("bedgraph                 %s" % str(self.create_bedgraph))
         logging.info("gtf:                     %s" % str(self.create_gtf))
+        logging.info("bgzip:                   %s" % str(self.bgzip))
+        logging.info("resume:                  %s" % str(self.resume))
         logging.info("verbose:                 %s" % str(self.verbose))
         logging.info("num_processors:          %d" % (self.num_processors))        
         logging.info("----------------------------------")
 
-def get_gtf_features(chrom, strand, exons, locus_id, gene_id, tss_id, 
-                     transcript_id, score, frac):
-    tx_start = exons[0].start
-    tx_end = exons[-1].end
+def write_transcript(gtf_writer, bed_writer, chrom, strand, exons, 
+                     locus_id, gene_id, tss_id, transcript_id, score, frac):
+    '''
+    write an assembled transcript to the GTF and/or BED writers (either
+    may be None)
+    '''
     strand_str = strand_int_to_str(strand)
-    attr_dict = {'locus_id': locus_id,
-                 'gene_id': gene_id,
-                 'tss_id': tss_id,
-                 'transcript_id': transcript_id}
-    f = GTFFeature()
-    f.seqid = chrom
-    f.source = 'assemblyline'
-    f.feature_type = 'transcript'
-    f.start = tx_start
-    f.end = tx_end
-    f.score = 1000.0 * int(round(frac))
-    f.strand = strand_str
-    f.phase = '.'
-    f.attrs = {'score': '%.3f' % score,
-               'frac': '%.3f' % frac}
-    f.attrs.update(attr_dict)
-    yield f
-    for i,e in enumerate(exons):
-        f = GTFFeature()
-        f.seqid = chrom
-        f.source = 'assemblyline'
-        f.feature_type = 'exon'
-        f.start = e.start
-        f.end = e.end
-        f.score = int(round(frac))
-        f.strand = strand_str
-        f.phase = '.'
-        f.attrs = {'exon_number': i+1}
-        f.attrs.update(attr_dict)
-        yield f
-        
-def write_bed(chrom, name, strand, score, exons):
-    assert all(exons[0].start < x.start for x in exons[1:])
-    assert all(exons[-1].end > x.end for x in exons[:-1])
-    tx_start = exons[0].start
-    tx_end = exons[-1].end    
-    block_sizes = []
-    block_starts = []
-    for e in exons:
-        block_starts.append(e.start - tx_start)
-        block_sizes.append(e.end - e.start)        
-    # make bed fields
-    fields = [chrom, 
-              str(tx_start), 
-              str(tx_end),
-              str(name),
-              str(score),
-              strand_int_to_str(strand),
-              str(tx_start),
-              str(tx_start),
-              '0',
-              str(len(exons)),
-              ','.join(map(str,block_sizes)) + ',',
-              ','.join(map(str,block_starts)) + ',']
-    return fields
-
-def sort_bed(filename, output_file, tmp_dir=None):
-    args = ["sort"]
-    if tmp_dir is not None:
-        args.extend(["-T", tmp_dir])
-    args.extend(["-k1,1", "-k2,2n", filename])
-    myenv = os.environ.copy()
-    myenv["LC_ALL"] = "C"
-    return subprocess.call(args, stdout=open(output_file, "w"), env=myenv)
-
-def merge_sort_files(filenames, output_file, sort_func=sort_bed, 
-                     tmp_dir=None):
-    tmp_file = os.path.splitext(output_file)[0] + ".unsorted.gtf"
-    outfh = open(tmp_file, "w")
-    for filename in filenames:
-        shutil.copyfileobj(open(filename), outfh)
-    outfh.close()
-    sort_bed(tmp_file, output_file, tmp_dir)
-    os.remove(tmp_file)
+    if gtf_writer is not None:
+        attrs = (('locus_id', locus_id),
+                 ('gene_id', gene_id),
+                 ('tss_id', tss_id),
+                 ('transcript_id', transcript_id))
+        transcript_attrs = (('score', '%.3f' % score),
+                            ('frac', '%.3f' % frac))
+        gtf_writer.write_transcript(chrom, strand_str, exons, attrs,
+                                    score=1000.0 * int(round(frac)),
+                                    exon_score=int(round(frac)),
+                                    transcript_attrs=transcript_attrs)
+    if bed_writer is not None:
+        name = "%s|%s(%.1f)" % (gene_id, transcript_id, score)
+        bed_writer.write_transcript(chrom, strand_str, exons, name, 
+                                    int(round(1000.0*frac)))
+
+def sort_bed_lines(lines):
+    '''
+    sort a list of BED or bedGraph lines from a single chromosome in place
+    by start position and then by the text of the line, which is the 
+    order of 'LC_ALL=C sort -k1,1 -k2,2n'
+    '''
+    lines.sort(key=lambda line: line.rstrip('\n'))
+    lines.sort(key=lambda line: int(line.split('\t', 2)[1]))
+
+def get_locus_id_offsets(chunk_indexes):
+    '''
+    reads the number of gene, tss, and transcript ids used within each 
+    chunk from the worker chunk indexes and returns a dictionary mapping 
+    each chunk key to the (gene, tss, transcript) id offsets that 
+    number the ids consecutively in locus order. ids are therefore 
+    independent of the number of processes, the order in which loci 
+    complete, and whether loci were split into subtasks
+    '''
+    chunk_id_counts = {}
+    for chunks in chunk_indexes:
+        for key, fields, extents in chunks:
+            chunk_id_counts[key] = fields[:3]
+    offsets = {}
+    gene_offset, tss_offset, t_offset = 0, 0, 0
+    for key in sorted(chunk_id_counts):
+        offsets[key] = (gene_offset, tss_offset, t_offset)
+        num_genes, num_tss, num_transcripts = chunk_id_counts[key]
+        gene_offset += num_genes
+        tss_offset += num_tss
+        t_offset += num_transcripts
+    return offsets
+
+_GTF_LOCAL_ID_RE = re.compile(r'(gene_id|tss_id|transcript_id) "(G|TSS|TU)(\d+)"')
+_BED_LOCAL_ID_RE = re.compile(r'G(\d+)\|TU(\d+)')
+_ID_PREFIX_INDEX = {'G': 0, 'TSS': 1, 'TU': 2}
+
+def renumber_gtf_line(line, offsets):
+    '''
+    convert a GTF line written with ids local to its locus to a line 
+    with global ids given the (gene, tss, transcript) id 'offsets' of
+    the locus
+    '''
+    def repl(m):
+        prefix = m.group(2)
+        new_id = offsets[_ID_PREFIX_INDEX[prefix]] + int(m.group(3))
+        return '%s "%s%d"' % (m.group(1), prefix, new_id)
+    return _GTF_LOCAL_ID_RE.sub(repl, line)
+
+def renumber_bed_line(line, offsets):
+    '''
+    same as 'renumber_gtf_line' for BED lines
+    '''
+    def repl(m):
+        return 'G%d|TU%d' % (offsets[0] + int(m.group(1)),
+                             offsets[2] + int(m.group(2)))
+    return _BED_LOCAL_ID_RE.sub(repl, line, count=1)
 
 def annotate_gene_and_tss_ids(path_info_list, strand,
-                              gene_id_value_obj,
-                              tss_id_value_obj):
+                              gene_id_counter,
+                              tss_id_counter):
     # cluster paths to determine gene ids
     cluster_tree = ClusterTree(0,1)
     # map tss positions to unique ids
@@ -332,32 +466,33 @@ def annotate_gene_and_tss_ids(path_info_list, strand,
         # map TSS positions to IDs
         tss_pos = end if strand == NEG_STRAND else start
         if tss_pos not in tss_pos_id_map:
-            tss_id = tss_id_value_obj.next()
+            tss_id = tss_id_counter.next()
             tss_pos_id_map[tss_pos] = tss_id
         else:
             tss_id = tss_pos_id_map[tss_pos]
         path_info.tss_id = tss_id
     # retrieve transcript clusters and assign gene ids
     for start, end, indexes in cluster_tree.getregions():
-        gene_id = gene_id_value_obj.next()
+        gene_id = gene_id_counter.next()
         for i in indexes:
             path_info_list[i].gene_id = gene_id
 
-def assemble_gene(locus_chrom, locus_id_str, 
-                  gene_id_value_obj, tss_id_value_obj, t_id_value_obj,
+def assemble_gene(locus_chrom, locus_num, 
+                  gene_id_counter, tss_id_counter, t_id_counter,
                   G, strand, partial_paths, 
-                  config, gtf_fileh, bed_fileh):
+                  config, gtf_writer, bed_writer):
     # run assembly algorithm
     path_info_list = assemble_transcript_graph(G, strand, partial_paths,
                                                config.kmax,
                                                config.ksensitivity,
                                                config.fraction_major_isoform,
-                                               config.max_paths)
+                                               config.max_paths,
+                                               config.ksearch_timing)
     logging.debug("\tAssembled %d transcript(s)" % (len(path_info_list)))
     # determine gene ids and tss ids
     annotate_gene_and_tss_ids(path_info_list, strand,
-                              gene_id_value_obj,
-                              tss_id_value_obj)
+                              gene_id_counter,
+                              tss_id_counter)
     # bin transcripts by gene id
     gene_path_info_dict = collections.defaultdict(lambda: [])
     for p in path_info_list:
@@ -368,39 +503,41 @@ def assemble_gene(locus_chrom, locus_id_str,
         # create GTF features for each transcript path
         for p in gene_path_info_list:
             # assign transcript id
-            t_id = t_id_value_obj.next()
+            t_id = t_id_counter.next()
             # get strings for each id
             t_id_str = "TU%d" % t_id
             tss_id_str = "TSS%d" % (p.tss_id)
             gene_id_str = "G%d" % (p.gene_id)
             # compute isoform fractions
             frac = p.score / highest_score
-            # write to GTF
-            if config.create_gtf:
-                for f in get_gtf_features(locus_chrom, strand, p.path,
-                                          locus_id=locus_id_str, 
-                                          gene_id=gene_id_str, 
-                                          tss_id=tss_id_str, 
-                                          transcript_id=t_id_str,
-                                          score=p.score, 
-                                          frac=frac):
-                    print >>gtf_fileh, str(f)
-            # write to BED
-            if config.create_bed:
-                name = "%s|%s(%.1f)" % (gene_id_str, t_id_str, p.score)
-                fields = write_bed(locus_chrom, name, strand, 
-                                   int(round(1000.0*frac)), p.path)
-                print >>bed_fileh, '\t'.join(fields)    
-
-def assemble_locus(transcripts,
-                   locus_id_value_obj,
-                   gene_id_value_obj,
-                   tss_id_value_obj,
-                   t_id_value_obj,
+            # write to GTF and BED
+            write_transcript(gtf_writer, bed_writer, locus_chrom, strand, 
+                             p.path,
+                             locus_id="L%d" % (locus_num), 
+                             gene_id=gene_id_str, 
+                             tss_id=tss_id_str, 
+                             transcript_id=t_id_str,
+                             score=p.score, 
+                             frac=frac)
+
+def assemble_locus(locus_num,
+                   transcripts,
                    config,
-                   gtf_fileh,
-                   bed_fileh,
-                   bedgraph_filehs):
+                   gtf_writer,
+                   bed_writer,
+                   bedgraph_filehs,
+                   fanout_func=None):
+    """
+    assemble a single locus and write the results to the output files.
+    gene, tss, and transcript ids are numbered locally within the locus
+
+    if 'fanout_func' is specified and the locus has at least 
+    'config.fanout_transcripts' transcripts, the independent transcript
+    graphs of the locus are passed to 'fanout_func(locus_num, graphs)'
+    to be assembled as separate tasks instead
+
+    returns a tuple with the number of (gene, tss, transcript) ids used
+    """
     # gather properties of locus
     locus_chrom = transcripts[0].chrom
     locus_start = transcripts[0].start
@@ -408,7 +545,9 @@ def assemble_locus(transcripts,
     logging.debug("[LOCUS] %s:%d-%d %d transcripts" % 
                   (locus_chrom, locus_start, locus_end, 
                    len(transcripts)))
-    locus_id_str = "L%d" % (locus_id_value_obj.next())
+    gene_id_counter = IdCounter()
+    tss_id_counter = IdCounter()
+    t_id_counter = IdCounter()
     # filter transcripts
     logging.debug("\tFiltering transcripts")
     transcripts = filter_transcripts(transcripts, 
@@ -422,50 +561,230 @@ def assemble_locus(transcripts,
                                  trim_intron_fraction=config.trim_intron_fraction,
                                  create_bedgraph=config.create_bedgraph,
                                  bedgraph_filehs=bedgraph_filehs)    
+    if ((fanout_func is not None) and (config.fanout_transcripts > 0) and
+        (len(transcripts) >= config.fanout_transcripts) and
+        (len(transcript_graphs) > 1)):
+        logging.debug("\tAssembling %d subgraphs as separate tasks" %
+                      (len(transcript_graphs)))
+        fanout_func(locus_num, transcript_graphs)
+        return (0, 0, 0)
     for tg in transcript_graphs:
         logging.debug("Subgraph %s:%d-%d(%s) %d nodes %d paths" %
                        (locus_chrom, locus_start, locus_end,
                         strand_int_to_str(tg.strand), len(tg.Gsub),
                         len(tg.partial_paths)))
         # assemble subgraph
-        assemble_gene(locus_chrom, locus_id_str, 
-                      gene_id_value_obj,
-                      tss_id_value_obj,
-                      t_id_value_obj,
+        assemble_gene(locus_chrom, locus_num, 
+                      gene_id_counter,
+                      tss_id_counter,
+                      t_id_counter,
                       tg.Gsub, tg.strand, tg.partial_paths, 
                       config,
-                      gtf_fileh,
-                      bed_fileh)
+                      gtf_writer,
+                      bed_writer)
+    return (gene_id_counter.val, tss_id_counter.val, 
+            t_id_counter.val)
 
-def assembly_worker(input_queue, 
-                    locus_id_value_obj,
-                    gene_id_value_obj,
-                    tss_id_value_obj,
-                    t_id_value_obj,
-                    worker_prefix,
-                    config):
-    # setup output files
-    gtf_fileh = None
-    bed_fileh = None
-    bedgraph_filehs = [None, None, None]
+def assemble_subgraph(locus_num, tg, config, gtf_writer, bed_writer):
+    """
+    assemble a single transcript graph of a locus that was split into 
+    separate tasks. ids are numbered locally within the subgraph
+
+    returns a tuple with the number of (gene, tss, transcript) ids used
+    """
+    logging.debug("[SUBGRAPH] locus %d %s(%s) %d nodes %d paths" %
+                  (locus_num, tg.chrom, strand_int_to_str(tg.strand), 
+                   len(tg.Gsub), len(tg.partial_paths)))
+    gene_id_counter = IdCounter()
+    tss_id_counter = IdCounter()
+    t_id_counter = IdCounter()
+    assemble_gene(tg.chrom, locus_num, 
+                  gene_id_counter,
+                  tss_id_counter,
+                  t_id_counter,
+                  tg.Gsub, tg.strand, tg.partial_paths, 
+                  config,
+                  gtf_writer,
+                  bed_writer)
+    return (gene_id_counter.val, tss_id_counter.val, 
+            t_id_counter.val)
+
+def estimate_locus_cost(num_transcripts, num_boundaries, span):
+    '''
+    predicted (relative) cost of assembling a locus. graph construction
+    and path finding scale with the number of transcripts (paths) times
+    the number of exon boundaries (nodes), while coverage and trimming 
+    scale with the genomic span of the locus
+    '''
+    return (num_transcripts * num_boundaries) + (span * LOCUS_COST_PER_BP)
+
+def schedule_loci(costs):
+    '''
+    returns the order in which to dispatch loci given a list of their
+    predicted costs. the most expensive loci are dispatched first so that
+    they do not delay the end of the run, and cheap loci are interleaved 
+    between them to keep the remaining workers busy
+    '''
+    order = sorted(xrange(len(costs)), key=lambda i: costs[i], reverse=True)
+    schedule = []
+    i, j = 0, len(order) - 1
+    while i <= j:
+        schedule.append(order[i])
+        if i != j:
+            schedule.append(order[j])
+        i += 1
+        j -= 1
+    return schedule
+
+def write_cost_log(filename, loci, chunk_indexes):
+    '''
+    write the predicted and actual (seconds) cost of each locus so that 
+    the cost estimator can be tuned
+    '''
+    elapsed = collections.defaultdict(lambda: 0.0)
+    for chunks in chunk_indexes:
+        for key, fields, extents in chunks:
+            elapsed[key[0]] += fields[3] / 1.0e6
+    fileh = open(filename, 'w')
+    print >>fileh, '\t'.join(['locus_num', 'chrom', 'start', 'end', 
+                              'transcripts', 'boundaries', 'predicted', 
+                              'actual'])
+    for locus_num, locus in enumerate(loci, start=1):
+        chrom, start, end, offset, length, num_transcripts, num_boundaries, \
+            cost = locus
+        print >>fileh, '\t'.join(map(str, [locus_num, chrom, start, end, 
+                                           num_transcripts, num_boundaries,
+                                           '%.1f' % cost,
+                                           '%.6f' % elapsed[locus_num]]))
+    fileh.close()
+
+def locus_is_complete(chunks):
+    '''
+    returns True if a list of the (key, fields) tuples of the chunks of a
+    locus contains the chunks of all of its parts and subgraphs
+    '''
+    keys = set(key for key, fields in chunks)
+    for key, fields in chunks:
+        if len(key) == 2 and key[1] == 0:
+            locus_num = key[0]
+            num_parts, num_subgraphs = fields[4:6]
+            expected = set([key])
+            expected.update((locus_num, 0, i) for i in xrange(1, num_parts))
+            expected.update((locus_num, i) 
+                            for i in xrange(1, num_subgraphs + 1))
+            return keys == expected
+    return False
+
+def get_worker_output_files(config):
+    '''
+    returns a list of (suffix, sort function) tuples describing the 
+    output files written by each worker
+    '''
+    output_files = []
     if config.create_gtf:
-        gtf_fileh = open(worker_prefix + ".gtf", "w")
+        output_files.append(('.gtf', sort_gtf_lines))
     if config.create_bed:
-        bed_fileh = open(worker_prefix + ".bed", "w")
+        output_files.append(('.bed', sort_bed_lines))
     if config.create_bedgraph:
         for strand in xrange(0,3):
-            filename = '%s_%s.bedgraph' % (worker_prefix, 
-                                           STRAND_NAMES[strand])
-            fileh = open(filename, 'w')
-            bedgraph_filehs[strand] = fileh
+            suffix = '_%s.bedgraph' % (STRAND_NAMES[strand])
+            output_files.append((suffix, sort_bed_lines))
+    return output_files
+
+def assembly_worker(input_queue, 
+                    subtask_queue,
+                    num_pending,
+                    worker_prefix,
+                    config):
+    # setup output files. the output of each locus is written as a 
+    # sorted chunk so that worker files can be merged without sorting
+    output_files = get_worker_output_files(config)
+    writer = ChunkWriter(worker_prefix, 
+                         [suffix for suffix,sort_func in output_files],
+                         [sort_func for suffix,sort_func in output_files])
+    buffers = list(writer.buffers)
+    gtf_writer = GTFWriter(buffers.pop(0)) if config.create_gtf else None
+    bed_writer = BEDWriter(buffers.pop(0)) if config.create_bed else None
+    bedgraph_filehs = buffers if config.create_bedgraph else [None, None, None]
+    # workers read their own loci from the input file or store
+    if is_transcript_store(config.gtf_input_file):
+        store = TranscriptStore(config.gtf_input_file)
+        input_fileh = None
+    else:
+        store = None
+        input_fileh = open_gtf(config.gtf_input_file, 'rb')
+    # only the attributes used by the assembler are decoded
+    wanted_attrs = [GTFAttr.REF, config.gtf_score_attr]
+    guard = None
+    if (config.max_locus_span > 0) or (config.max_locus_transcripts > 0):
+        guard = LocusGuard(config.max_locus_span, 
+                           config.max_locus_transcripts,
+                           config.super_locus_mode)
+        # records are written as loci are divided so that they are kept
+        # with the chunks of the locus when a run is resumed
+        guard_file = worker_prefix + LOCUS_GUARD_SUFFIX
+        write_locus_guard_stats(guard_file, [])
+        guard_fileh = open(guard_file, 'a')
+    # number of subgraphs assembled as separate tasks by locus
+    num_subgraphs = {}
+    def flush_writers():
+        # move buffered transcripts into the current chunk
+        for w in (gtf_writer, bed_writer):
+            if w is not None:
+                w.flush()
+    def add_pending(n):
+        with num_pending.get_lock():
+            num_pending.value += n
+    def fanout(locus_num, transcript_graphs):
+        # subgraphs are numbered from 1 so that their chunks follow 
+        # the chunk of the locus itself
+        add_pending(len(transcript_graphs))
+        num_subgraphs[locus_num] = len(transcript_graphs)
+        for sub_index, tg in enumerate(transcript_graphs, start=1):
+            subtask_queue.put((locus_num, sub_index, tg))
+    def process_subtask(subtask):
+        locus_num, sub_index, tg = subtask
+        t0 = time.time()
+        id_counts = assemble_subgraph(locus_num, tg, config, 
+                                      gtf_writer, bed_writer)
+        elapsed_usec = int(round(1.0e6 * (time.time() - t0)))
+        flush_writers()
+        writer.write_chunk((locus_num, sub_index), 
+                           id_counts + (elapsed_usec,))
+        add_pending(-1)
     # process input
+    input_done = False
     while True:
-        lines = input_queue.get()
-        if len(lines) == 0:
-            break
-        transcripts = transcripts_from_gtf_lines(lines)
-        # conserve memory
-        del lines
+        # subgraphs of loci that were split into separate tasks take
+        # priority over new loci
+        try:
+            process_subtask(subtask_queue.get_nowait())
+            continue
+        except Queue.Empty:
+            pass
+        if input_done:
+            # help with remaining subtasks until all work is finished
+            if num_pending.value == 0:
+                break
+            try:
+                subtask = subtask_queue.get(timeout=SUBTASK_POLL_INTERVAL)
+            except Queue.Empty:
+                continue
+            process_subtask(subtask)
+            continue
+        task = input_queue.get()
+        if task is None:
+            input_done = True
+            continue
+        locus_num, offset, length = task
+        if store is not None:
+            # 'offset' and 'length' are the range of transcripts
+            transcripts = store.transcripts(offset, length, compact=True)
+        else:
+            lines = read_locus_lines(input_fileh, offset, length)
+            transcripts = transcripts_from_gtf_lines(lines, attrs=wanted_attrs)
+            # conserve memory
+            del lines
         # assign scores to each transcript
         for t in transcripts:
             if config.scoring_mode == "unweighted":
@@ -473,98 +792,182 @@ def assembly_worker(input_queue,
             elif config.scoring_mode == "gtf_attr":
                 score = t.attrs.get(config.gtf_score_attr, '0')
                 t.score = float_check_nan(score)
-        # assemble
-        assemble_locus(transcripts,
-                       locus_id_value_obj,
-                       gene_id_value_obj,
-                       tss_id_value_obj,
-                       t_id_value_obj,                       
-                       config,
-                       gtf_fileh,
-                       bed_fileh,
-                       bedgraph_filehs)
+        # divide super-loci. each part is assembled separately and 
+        # written as its own chunk following the chunk of the locus
+        if guard is not None:
+            parts = guard.split_transcripts(transcripts, key=locus_num)
+            write_locus_guard_records(guard_fileh, guard.records)
+            guard_fileh.flush()
+            del guard.records[:]
+        else:
+            parts = [transcripts]
+        del transcripts
+        # subgraphs of divided loci are not assembled as separate tasks
+        part_fanout = fanout if len(parts) == 1 else None
+        for part_index, part in enumerate(parts):
+            # assemble
+            t0 = time.time()
+            id_counts = assemble_locus(locus_num,
+                                       part,
+                                       config,
+                                       gtf_writer,
+                                       bed_writer,
+                                       bedgraph_filehs,
+                                       fanout_func=part_fanout)
+            elapsed_usec = int(round(1.0e6 * (time.time() - t0)))
+            # write output chunk along with number of ids used by locus.
+            # the chunk of the locus records the number of parts and 
+            # subgraphs so that resumed runs can tell it was completed
+            flush_writers()
+            fields = id_counts + (elapsed_usec,)
+            if part_index == 0:
+                key = (locus_num, 0)
+                fields += (len(parts), num_subgraphs.pop(locus_num, 0))
+            else:
+                key = (locus_num, 0, part_index)
+            writer.write_chunk(key, fields)
+        add_pending(-1)
         input_queue.task_done()
+    if input_fileh is not None:
+        input_fileh.close()
+    if guard is not None:
+        guard_fileh.close()
     # cleanup output files
-    if config.create_bed:
-        bed_fileh.close()
-    if config.create_gtf:
-        gtf_fileh.close()
-    if config.create_bedgraph:
-        for fileh in bedgraph_filehs:
-            fileh.close()
+    writer.close()
     input_queue.task_done()
 
+def write_track_file(track_file, track_line):
+    fileh = open(track_file, "w")
+    print >>fileh, track_line
+    fileh.close()
+
 def run_parallel(config):
     """
     runs assembly in parallel and merges output from child processes 
 
     config: RunConfig object
     """
-    # create temp directory
+    # create temp directory. worker output is kept there until the run
+    # completes so that an interrupted run can be resumed
     tmp_dir = os.path.join(config.output_dir, "tmp")
-    if not os.path.exists(tmp_dir):
-        logging.debug("Creating tmp directory '%s'" % (tmp_dir))
-        os.makedirs(tmp_dir)
-    # create queue
+    logging.debug("Preparing tmp directory '%s'" % (tmp_dir))
+    run_dir, resumed_prefixes, resumed_chunk_indexes = \
+        prepare_chunk_dir(tmp_dir, config.resume_params(), 
+                          resume=config.resume, 
+                          group_func=locus_is_complete)
+    completed_loci = set(key[0] for chunks in resumed_chunk_indexes
+                         for key, fields, extents in chunks)
+    if config.resume:
+        logging.info("Resuming run with %d completed loci" % 
+                     (len(completed_loci)))
+    # index loci in the input file. transcript stores contain their 
+    # own locus index
+    if is_transcript_store(config.gtf_input_file):
+        locus_iter = TranscriptStore(config.gtf_input_file).loci()
+    else:
+        if not locus_index_is_current(config.gtf_input_file, 
+                                      config.locus_index_file):
+            logging.info("Indexing loci in GTF file")
+            num_loci = write_locus_index(config.gtf_input_file, 
+                                         config.locus_index_file,
+                                         config.num_processors)
+            logging.debug("Indexed %d loci" % (num_loci))
+        locus_iter = read_locus_index(config.locus_index_file)
+    # create queues. subgraphs of large loci are placed on a separate
+    # unbounded queue so that workers never block when adding them
     input_queue = JoinableQueue(maxsize=config.num_processors*3)
-    # shared memory values
-    locus_id_value_obj = LockValue(1)
-    gene_id_value_obj = LockValue(1)
-    tss_id_value_obj = LockValue(1)
-    t_id_value_obj = LockValue(1)
+    subtask_queue = ProcessQueue()
+    # number of loci and subgraphs that have not been assembled
+    num_pending = Value('i', 0)
     # start worker processes
     procs = []
     worker_prefixes = []
     for i in xrange(config.num_processors):
-        worker_prefix = os.path.join(tmp_dir, "worker%03d" % (i))
+        worker_prefix = os.path.join(run_dir, "worker%03d" % (i))
         worker_prefixes.append(worker_prefix)
         args = (input_queue, 
-                locus_id_value_obj,
-                gene_id_value_obj,
-                tss_id_value_obj,
-                t_id_value_obj,
+                subtask_queue,
+                num_pending,
                 worker_prefix,
                 config)
         p = Process(target=assembly_worker, args=args)
         p.daemon = True
         p.start()
         procs.append(p)
-    # parse gtf file                
-    for lines in parse_loci(open(config.gtf_input_file)):
-        input_queue.put(lines)
-        # conserve memory
-        del lines
+    # estimate the cost of each locus. loci are numbered in genome order
+    # regardless of the order in which they are dispatched
+    loci = []
+    for chrom, start, end, offset, length, num_transcripts, num_boundaries \
+        in locus_iter:
+        cost = estimate_locus_cost(num_transcripts, num_boundaries, 
+                                   end - start)
+        loci.append((chrom, start, end, offset, length, num_transcripts, 
+                     num_boundaries, cost))
+    # dispatch loci to workers as byte offsets into the gtf file (or 
+    # transcript ranges of the store)
+    for i in schedule_loci([locus[-1] for locus in loci]):
+        if (i + 1) in completed_loci:
+            continue
+        offset, length = loci[i][3:5]
+        with num_pending.get_lock():
+            num_pending.value += 1
+        input_queue.put((i + 1, offset, length))
     # stop workers
     for p in procs:
-        input_queue.put([])
-    # close queue
+        input_queue.put(None)
+    # close queues
     input_queue.join()
     input_queue.close()
+    subtask_queue.close()
     # join worker processes
     for p in procs:
         p.join()
-    # merge gtf files
-    if config.create_gtf:
-        logging.info("Merging %d worker GTF files" % 
-                     (config.num_processors))
-        worker_gtf_files = [prefix + ".gtf" for prefix in worker_prefixes]
-        output_gtf_file = os.path.join(config.output_dir, "assembly.gtf")
-        merge_sort_gtf_files(worker_gtf_files, output_gtf_file, 
-                             tmp_dir=tmp_dir)
-        # remove worker gtf files
-        for filename in worker_gtf_files:
-            if os.path.exists(filename):
-                os.remove(filename)
-    # merge bed files
+    # the output of loci completed by earlier attempts at the run is 
+    # merged together with the output of the workers
+    chunk_indexes = [read_chunk_index(prefix) for prefix in worker_prefixes]
+    worker_prefixes = resumed_prefixes + worker_prefixes
+    chunk_indexes = resumed_chunk_indexes + chunk_indexes
+    # number ids consecutively in locus order
+    id_offsets = get_locus_id_offsets(chunk_indexes)
+    if config.cost_log_file is not None:
+        logging.info("Writing locus costs to '%s'" % (config.cost_log_file))
+        write_cost_log(config.cost_log_file, loci, chunk_indexes)
+    if (config.max_locus_span > 0) or (config.max_locus_transcripts > 0):
+        records = []
+        for prefix, chunks in zip(worker_prefixes, chunk_indexes):
+            # records of loci that a worker did not complete are skipped
+            loci_nums = set(key[0] for key, fields, extents in chunks)
+            guard_file = prefix + LOCUS_GUARD_SUFFIX
+            if os.path.exists(guard_file):
+                records.extend(r for r in read_locus_guard_stats(guard_file)
+                               if r[0] in loci_nums)
+        logging.info("Divided %d super-loci" % (len(records)))
+        write_locus_guard_stats(os.path.join(config.output_dir, 
+                                             "locus_guard.txt"), records)
+    # merge worker output files in locus order
+    output_files = get_worker_output_files(config)
+    for file_index, (suffix, sort_func) in enumerate(output_files):
+        logging.info("Merging %d worker '%s' files" % 
+                     (len(worker_prefixes), suffix))
+        worker_files = [prefix + suffix for prefix in worker_prefixes]
+        output_file = os.path.join(config.output_dir, "assembly" + suffix)
+        if suffix == '.gtf':
+            line_func = lambda line, key, fields: \
+                renumber_gtf_line(line, id_offsets[key])
+        elif suffix == '.bed':
+            line_func = lambda line, key, fields: \
+                renumber_bed_line(line, id_offsets[key])
+        else:
+            line_func = None
+        if (suffix == '.gtf') and config.bgzip:
+            output_file += BGZF_SUFFIX
+        merge_chunks(chunk_indexes, worker_files, file_index, output_file,
+                     line_func=line_func, sort_func=sort_func)
+        if (suffix == '.gtf') and config.bgzip:
+            logging.info("Indexing loci in compressed GTF file")
+            write_locus_index(output_file, output_file + LOCUS_INDEX_SUFFIX)
+    # write bed file track description line
     if config.create_bed:
-        logging.info("Merging %d worker BED files" % 
-                     (config.num_processors))
-        worker_bed_files = [p + ".bed" for p in worker_prefixes]
-        output_bed_file = os.path.join(config.output_dir, "assembly.bed")
-        merge_sort_files(worker_bed_files, output_bed_file, 
-                         sort_func=sort_bed, 
-                         tmp_dir=tmp_dir)
-        # write bed file track description line
         track_name = os.path.basename(config.output_dir)
         track_line = ' '.join(['track name="%s"' % (track_name),
                                'description="%s"' % (track_name),
@@ -572,22 +975,11 @@ def run_parallel(config):
                                'useScore=1'])
         track_file = os.path.join(config.output_dir, 
                                   "assembly.bed.ucsc_track")
-        fileh = open(track_file, "w")
-        print >>fileh, track_line
-        fileh.close()
-    # merge bedgraph files
+        write_track_file(track_file, track_line)
+    # write bedgraph track description lines
     if config.create_bedgraph:
-        logging.info("Merging %d worker bedGraph files" % 
-                     (config.num_processors))
         for strand in xrange(0,3):
             strand_name = STRAND_NAMES[strand]
-            bgfiles = ['%s_%s.bedgraph' % (p, strand_name)
-                       for p in worker_prefixes]
-            output_file = os.path.join(config.output_dir, 
-                                       "assembly_%s.bedgraph" % strand_name)
-            merge_sort_files(bgfiles, output_file, 
-                             sort_func=sort_bed, 
-                             tmp_dir=tmp_dir)
             track_name = '%s_%s' % (os.path.basename(config.output_dir), 
                                     strand_name)
             track_line = ' '.join(['track type=bedGraph',
@@ -600,9 +992,7 @@ def run_parallel(config):
                                    'maxHeightPixels=64:64:11'])
             track_file = os.path.join(config.output_dir, 
                                       "assembly_%s.bedgraph.ucsc_track" % strand_name)
-            fileh = open(track_file, "w")
-            print >>fileh, track_line
-            fileh.close()
+            write_track_file(track_file, track_line)
     # cleanup
     if os.path.exists(tmp_dir):
         shutil.rmtree(tmp_dir)
@@ -32,8 +32,10 @@ import assemblyline
 import assemblyline.lib.config as config
 from assemblyline.lib.transcript import parse_gtf
 from assemblyline.lib.base import CategoryStats, Category, \
-    GTFAttr, check_executable, BufferedFileSplitter
-from assemblyline.lib.gtf import GTFFeature, merge_sort_gtf_files
+    GTFAttr, GTF_ATTR_DEFS, check_executable, BufferedFileSplitter
+from assemblyline.lib.gtf import GTFFeature, merge_sort_gtf_files, open_gtf
+from assemblyline.lib.tstore import TranscriptStore, \
+    transcript_store_is_current
 
 # R script to call for classifying transcripts
 _module_dir = assemblyline.__path__[0]
@@ -68,7 +70,7 @@ def get_classify_fields(t):
 def write_transcript_table(gtf_file, table_file):
     fileh = open(table_file, 'w')
     print >>fileh, '\t'.join(get_classify_header_fields())
-    for transcripts in parse_gtf(open(gtf_file)):
+    for transcripts in parse_gtf(open(gtf_file), GTF_ATTR_DEFS):
         for t in transcripts:
             fields = get_classify_fields(t)
             print >>fileh, '\t'.join(map(str, fields))
@@ -261,6 +263,26 @@ def merge_transcripts(results):
                          tmp_dir=results.tmp_dir)
     return 0
 
+def update_category_stats(stats_dict, library_id, attrs):
+    is_test = bool(int(attrs[GTFAttr.TEST]))
+    if is_test:
+        category = Category.SAME_STRAND
+    else:
+        category = int(attrs[GTFAttr.CATEGORY])
+    score = float(attrs[GTFAttr.SCORE])         
+    statsobj = stats_dict[library_id]
+    statsobj.library_id = library_id
+    statsobj.counts[category] += 1
+    statsobj.signal[category] += score
+
+def write_category_stats(stats_dict, category_stats_file):
+    fh = open(category_stats_file, "w")
+    print >>fh, '\t'.join(CategoryStats.header_fields())
+    for statsobj in stats_dict.itervalues():
+        fields = statsobj.to_fields()
+        print >>fh, '\t'.join(map(str, fields))
+    fh.close()
+
 def split_gtf_file(gtf_file, split_dir, ref_gtf_file, category_stats_file,
                    bufsize=(1 << 30)):
     # split input gtf by library and mark test ids
@@ -269,8 +291,8 @@ def split_gtf_file(gtf_file, split_dir, ref_gtf_file, category_stats_file,
     ref_fileh = open(ref_gtf_file, 'w')
     stats_dict = collections.defaultdict(lambda: CategoryStats())
     logging.info("Splitting transcripts by library")
-    for line in open(gtf_file):
-        f = GTFFeature.from_string(line)
+    for line in open_gtf(gtf_file):
+        f = GTFFeature.from_string(line, GTF_ATTR_DEFS)
         is_ref = bool(int(f.attrs[GTFAttr.REF]))
         if is_ref:
             print >>ref_fileh, str(f)
@@ -278,16 +300,7 @@ def split_gtf_file(gtf_file, split_dir, ref_gtf_file, category_stats_file,
         library_id = f.attrs[GTFAttr.LIBRARY_ID]
         # keep statistics
         if f.feature_type == 'transcript':
-            is_test = bool(int(f.attrs[GTFAttr.TEST]))
-            if is_test:
-                category = Category.SAME_STRAND
-            else:
-                category = int(f.attrs[GTFAttr.CATEGORY])
-            score = float(f.attrs[GTFAttr.SCORE])         
-            statsobj = stats_dict[library_id]
-            statsobj.library_id = library_id
-            statsobj.counts[category] += 1
-            statsobj.signal[category] += score
+            update_category_stats(stats_dict, library_id, f.attrs)
         # write features from each library to separate files
         bufobj.write(library_id, line)
     # close open file handles
@@ -296,12 +309,45 @@ def split_gtf_file(gtf_file, split_dir, ref_gtf_file, category_stats_file,
     logging.debug("Buffer flushes: %d" % (bufobj.flushes))
     # write library category statistics
     logging.info("Writing category statistics")
-    fh = open(category_stats_file, "w")
-    print >>fh, '\t'.join(CategoryStats.header_fields())
-    for statsobj in stats_dict.itervalues():
-        fields = statsobj.to_fields()
-        print >>fh, '\t'.join(map(str, fields))
-    fh.close()
+    write_category_stats(stats_dict, category_stats_file)
+
+def split_transcript_store(store_path, split_dir, ref_gtf_file, 
+                           category_stats_file, bufsize=(1 << 30)):
+    '''
+    same as 'split_gtf_file' but reads the transcripts from a transcript 
+    store. the attributes of the transcript are used for all of its 
+    features, and the GTF lines of each library are exported from the 
+    store in sorted order
+    '''
+    keyfunc = lambda myid: os.path.join(split_dir, "%s.gtf" % (myid))
+    bufobj = BufferedFileSplitter(keyfunc, bufsize)
+    ref_fileh = open(ref_gtf_file, 'w')
+    stats_dict = collections.defaultdict(lambda: CategoryStats())
+    logging.info("Splitting transcripts by library")
+    store = TranscriptStore(store_path)
+    for locus in store.loci():
+        first, count = locus[3:5]
+        transcripts = store.transcripts(first, count, GTF_ATTR_DEFS,
+                                        compact=True)
+        for line, feature_type, start, i in store.gtf_lines(first, count):
+            attrs = transcripts[i - first].attrs
+            is_ref = bool(int(attrs[GTFAttr.REF]))
+            if is_ref:
+                print >>ref_fileh, str(GTFFeature.from_string(line))
+                continue
+            library_id = attrs[GTFAttr.LIBRARY_ID]
+            # keep statistics
+            if feature_type == 'transcript':
+                update_category_stats(stats_dict, library_id, attrs)
+            # write features from each library to separate files
+            bufobj.write(library_id, line + '\n')
+    # close open file handles
+    ref_fileh.close()
+    bufobj.close()
+    logging.debug("Buffer flushes: %d" % (bufobj.flushes))
+    # write library category statistics
+    logging.info("Writing category statistics")
+    write_category_stats(stats_dict, category_stats_file)
 
 def main():
     multiprocessing.freeze_support()
@@ -345,12 +391,21 @@ def main():
     results = config.AssemblylineResults(args.run_dir)
     if not os.path.exists(results.classify_dir):
         os.makedirs(results.classify_dir)
-    # split gtf file
-    split_gtf_file(results.annotated_transcripts_gtf_file, 
-                   results.classify_dir,
-                   results.ref_gtf_file,
-                   results.category_stats_file,
-                   args.bufsize)
+    # split the transcript store (or gtf file if the store is not
+    # up to date)
+    if transcript_store_is_current(results.annotated_transcripts_gtf_file,
+                                   results.annotated_transcripts_store):
+        split_transcript_store(results.annotated_transcripts_store,
+                               results.classify_dir,
+                               results.ref_gtf_file,
+                               results.category_stats_file,
+                               args.bufsize)
+    else:
+        split_gtf_file(results.annotated_transcripts_gtf_file, 
+                       results.classify_dir,
+                       results.ref_gtf_file,
+                       results.category_stats_file,
+                       args.bufsize)
     # run classification
     retcode = classify_transcripts(results, num_processors)
     if retcode != 0:
@@ -0,0 +1,194 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import random
+import shutil
+import logging
+import tempfile
+import unittest
+
+from assemblyline.lib import config
+from assemblyline.lib.refcache import REF_CACHE_CHECKSUMS_FILE
+import assemblyline.pipeline.aggregate_transcripts as aggregate_transcripts
+from assemblyline.pipeline.aggregate_transcripts import main, \
+    read_cache_manifest, LIBRARY_CACHE_MANIFEST
+
+merge_gtf_func = aggregate_transcripts.merge_gtf
+
+def write_gtf(filename, num_transcripts, seed):
+    '''
+    write a random GTF file of transcripts with two exons
+    '''
+    rng = random.Random(seed)
+    fileh = open(filename, 'w')
+    for i in xrange(num_transcripts):
+        chrom = rng.choice(('chr1', 'chr2'))
+        strand = rng.choice('+-')
+        start = rng.randint(1, 10000)
+        intron = rng.randint(100, 1000)
+        fpkm = 'FPKM "%f";' % (rng.uniform(0.1, 100.0))
+        attrs = 'gene_id "G%d"; transcript_id "T%d"; %s' % (i, i, fpkm)
+        for exon_start in (start, start + 300 + intron):
+            print >>fileh, '\t'.join([chrom, 'Cufflinks', 'exon',
+                                      str(exon_start), str(exon_start + 299),
+                                      str(rng.randint(1, 1000)), strand, '.',
+                                      attrs])
+    fileh.close()
+
+class TestAggregateAppend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ref_gtf_file = os.path.join(self.tmp_dir, 'ref.gtf')
+        write_gtf(self.ref_gtf_file, 20, 0)
+        self.gtf_files = {}
+        for i in xrange(1, 4):
+            library_id = 'lib%d' % (i)
+            filename = os.path.join(self.tmp_dir, library_id + '.gtf')
+            write_gtf(filename, 50, i)
+            self.gtf_files[library_id] = filename
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.tmp_dir)
+
+    def run_main(self, output_dir, library_ids, *options):
+        table_file = os.path.join(self.tmp_dir, 'libraries.txt')
+        fileh = open(table_file, 'w')
+        print >>fileh, '\t'.join(['sample_id', 'library_id', 'gtf_file',
+                                  'bam_file'])
+        for library_id in library_ids:
+            print >>fileh, '\t'.join(['s_' + library_id, library_id,
+                                      self.gtf_files[library_id], 'None'])
+        fileh.close()
+        output_dir = os.path.join(self.tmp_dir, output_dir)
+        argv = sys.argv
+        sys.argv = (['aggregate_transcripts.py', '--random-test-frac', '0',
+                     '-o', output_dir] + list(options) +
+                    [self.ref_gtf_file, table_file])
+        try:
+            self.assertEqual(main(), 0)
+        finally:
+            sys.argv = argv
+        return config.AssemblylineResults(output_dir)
+
+    def assertSameOutput(self, results, expected):
+        for attr in ('transcripts_gtf_file', 'transcript_stats_file',
+                     'library_id_map', 'sample_id_map'):
+            self.assertEqual(open(getattr(results, attr)).read(),
+                             open(getattr(expected, attr)).read())
+
+    def assertNoStaleShards(self, results):
+        cache_dir = results.library_cache_dir
+        keys = set(key for name, key in read_cache_manifest(cache_dir))
+        shard_keys = set(filename.split('.', 1)[0] for filename in
+                         os.listdir(cache_dir) if filename.endswith('.stats'))
+        self.assertEqual(shard_keys, keys)
+
+    def test_cache_removed(self):
+        results = self.run_main('out', ['lib1', 'lib2'])
+        self.assertTrue(os.path.exists(results.transcripts_gtf_file))
+        self.assertFalse(os.path.exists(results.library_cache_dir))
+        results = self.run_main('out', ['lib1', 'lib2'], '--keep-cache')
+        self.assertEqual(len(read_cache_manifest(results.library_cache_dir)),
+                         3)
+        # a run without the flags removes the cache of an earlier run
+        results = self.run_main('out', ['lib1', 'lib2'])
+        self.assertFalse(os.path.exists(results.library_cache_dir))
+
+    def test_merge(self):
+        expected = self.run_main('full', ['lib1', 'lib2', 'lib3'])
+        results = self.run_main('out', ['lib1', 'lib2'], '--keep-cache')
+        cache_dir = results.library_cache_dir
+        entries = read_cache_manifest(cache_dir)
+        mtimes = dict((filename, os.path.getmtime(os.path.join(cache_dir,
+                                                               filename)))
+                      for filename in os.listdir(cache_dir))
+        # the output of the earlier libraries is extended when only new
+        # libraries are added. a comment marks the end of the earlier
+        # dropped transcripts, which are not written again
+        dropped = open(results.transcripts_dropped_gtf_file).read()
+        dropped += '# appended\n'
+        open(results.transcripts_dropped_gtf_file, 'w').write(dropped)
+        results = self.run_main('out', ['lib3'], '--append')
+        self.assertSameOutput(results, expected)
+        self.assertEqual(read_cache_manifest(cache_dir)[:3], entries)
+        lines = open(results.transcripts_dropped_gtf_file).read()
+        self.assertTrue(lines.startswith(dropped))
+        self.assertEqual(lines.replace('# appended\n', ''),
+                         open(expected.transcripts_dropped_gtf_file).read())
+        # shards of the earlier libraries are not written again
+        for filename, mtime in mtimes.iteritems():
+            if filename in (LIBRARY_CACHE_MANIFEST, REF_CACHE_CHECKSUMS_FILE):
+                continue
+            path = os.path.join(cache_dir, filename)
+            self.assertEqual(os.path.getmtime(path), mtime)
+        self.assertNoStaleShards(results)
+
+    def test_failed_append(self):
+        expected = self.run_main('full', ['lib1', 'lib2', 'lib3'])
+        results = self.run_main('out', ['lib1', 'lib2'], '--keep-cache')
+        output_files = [results.transcripts_gtf_file, 
+                        results.transcripts_dropped_gtf_file,
+                        results.transcript_stats_file,
+                        os.path.join(results.library_cache_dir, 
+                                     LIBRARY_CACHE_MANIFEST)]
+        outputs = [open(f).read() for f in output_files]
+        def merge_gtf(*args, **kwargs):
+            raise IOError('merge failed')
+        aggregate_transcripts.merge_gtf = merge_gtf
+        try:
+            self.assertRaises(IOError, self.run_main, 'out', ['lib3'], 
+                              '--append')
+        finally:
+            aggregate_transcripts.merge_gtf = merge_gtf_func
+        # the output of the earlier run is unchanged
+        self.assertEqual([open(f).read() for f in output_files], outputs)
+        # and the libraries are added when the run is repeated
+        results = self.run_main('out', ['lib3'], '--append')
+        self.assertSameOutput(results, expected)
+        self.assertEqual(open(results.transcripts_dropped_gtf_file).read(),
+                         open(expected.transcripts_dropped_gtf_file).read())
+        self.assertNoStaleShards(results)
+
+    def test_id_stability(self):
+        self.run_main('out', ['lib1', 'lib2'], '--keep-cache')
+        # libraries of the earlier run keep their ids in any order
+        results = self.run_main('out', ['lib3', 'lib2'], '--append')
+        lines = [line.rstrip('\n').split('\t') for line in
+                 open(results.library_id_map)]
+        self.assertEqual(lines, [['L1', 'lib1'], ['L2', 'lib2'],
+                                 ['L3', 'lib3']])
+        lines = [line.rstrip('\n').split('\t') for line in
+                 open(results.sample_id_map)]
+        self.assertEqual(lines, [['S1', 's_lib1'], ['S2', 's_lib2'],
+                                 ['S3', 's_lib3']])
+        self.assertNoStaleShards(results)
+
+    def test_rebuild(self):
+        results = self.run_main('out', ['lib1', 'lib2'], '--keep-cache')
+        cache_dir = results.library_cache_dir
+        entries = read_cache_manifest(cache_dir)
+        # changing the GTF file of a library rebuilds the output
+        write_gtf(self.gtf_files['lib1'], 60, 10)
+        expected = self.run_main('full', ['lib1', 'lib2'])
+        results = self.run_main('out', ['lib1'], '--append')
+        self.assertSameOutput(results, expected)
+        self.assertEqual(open(results.transcripts_dropped_gtf_file).read(),
+                         open(expected.transcripts_dropped_gtf_file).read())
+        new_entries = read_cache_manifest(cache_dir)
+        self.assertEqual(new_entries[0], entries[0])
+        self.assertEqual(new_entries[2], entries[2])
+        self.assertNotEqual(new_entries[1], entries[1])
+        # the shard of the earlier library file is removed
+        self.assertFalse(any(filename.startswith(entries[1][1])
+                             for filename in os.listdir(cache_dir)))
+        self.assertNoStaleShards(results)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,14 +3,20 @@ Created on Feb 12, 2013
 
 @author: mkiyer
 '''
+import os
+import shutil
+import tempfile
 import unittest
 
 # project imports
-from assemblyline.pipeline.annotate_transcripts import annotate_locus
+from assemblyline.pipeline.annotate_transcripts import annotate_locus, \
+    annotate_gtf_parallel
 from assemblyline.lib.base import GTFAttr
+from assemblyline.lib.gtf import sort_gtf
+from assemblyline.lib.tstore import write_transcript_store
 
 # local imports
-from test_base import read_first_locus
+from test_base import read_first_locus, get_gtf_path
 
 class TestAnnotate(unittest.TestCase):
 
@@ -119,6 +125,22 @@ class TestAnnotate(unittest.TestCase):
         self.assertTrue(t.attrs[GTFAttr.ANN_REF_ID] == "C")
         self.assertTrue(t.attrs[GTFAttr.TEST] == "1")
 
+    def test_store_output(self):
+        # the output is the same when reading a GTF file or its store
+        tmp_dir = tempfile.mkdtemp()
+        gtf_file = os.path.join(tmp_dir, 'input.gtf')
+        sort_gtf(get_gtf_path("annotate_category1.gtf"), gtf_file)
+        store_path = os.path.join(tmp_dir, 'input.tstore')
+        write_transcript_store(gtf_file, store_path)
+        outputs = []
+        for input_file in (gtf_file, store_path):
+            output_file = os.path.join(tmp_dir, 'output.gtf')
+            annotate_gtf_parallel(input_file, output_file, 'sample_id', 1,
+                                  tmp_dir)
+            outputs.append(open(output_file).read())
+        shutil.rmtree(tmp_dir)
+        self.assertTrue(len(outputs[0]) > 0)
+        self.assertEqual(outputs[0], outputs[1])
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
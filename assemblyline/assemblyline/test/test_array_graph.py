@@ -0,0 +1,42 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import unittest
+import numpy as np
+
+from assemblyline.lib.assemble.array_graph import ArrayGraph
+
+class TestArrayGraph(unittest.TestCase):
+
+    def test_adjacency(self):
+        # duplicate edges are removed
+        G = ArrayGraph(5, [(0,2), (0,1), (1,3), (2,3), (0,1), (4,4)])
+        self.assertEqual(G.number_of_edges(), 5)
+        self.assertEqual(G.successors(0).tolist(), [1,2])
+        self.assertEqual(G.predecessors(3).tolist(), [1,2])
+        self.assertEqual(G.out_degree().tolist(), [2,1,1,0,1])
+        self.assertEqual(G.in_degree().tolist(), [0,1,1,2,1])
+        self.assertRaises(ValueError, G.topological_sort)
+
+    def test_topological_levels(self):
+        G = ArrayGraph(6, [(0,1), (1,2), (0,2), (2,3), (4,3)])
+        levels, reverse_levels = G.topological_levels()
+        self.assertEqual(levels.tolist(), [0,1,2,3,0,0])
+        self.assertEqual(reverse_levels.tolist(), [3,2,1,0,1,0])
+
+    def test_subgraph(self):
+        G = ArrayGraph(5, [(0,1), (1,2), (3,4)])
+        G.add_node_attr('score', np.arange(5, dtype=float))
+        G.add_node_attr('name', list('abcde'))
+        components = G.weakly_connected_components()
+        self.assertEqual([c.tolist() for c in components], [[0,1,2], [3,4]])
+        H = G.subgraph([1,2,4])
+        self.assertEqual(len(H), 3)
+        self.assertEqual(H.successor_lists(), [[1], [], []])
+        self.assertEqual(H.score.tolist(), [1.0, 2.0, 4.0])
+        self.assertEqual(H.name, ['b', 'c', 'e'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,8 @@ Created on Nov 8, 2012
 import os
 
 from assemblyline.lib.transcript import parse_gtf
-from assemblyline.lib.assemble.transcript_graph import create_transcript_graphs
+from assemblyline.lib.assemble.transcript_graph import \
+    partition_transcripts_by_strand, create_directed_graph
 from assemblyline.lib.base import GTFAttr
 
 GTF_DIR = "gtf_files"
@@ -25,7 +26,9 @@ def read_first_locus(filename, score_attr=GTFAttr.SCORE):
 
 def get_transcript_graphs(transcripts):
     GG = {}
-    for G, strand, strand_transcript_map in \
-        create_transcript_graphs(transcripts):
-        GG[strand] = (G, strand_transcript_map)
+    strand_transcript_lists, strand_ref_transcripts = \
+        partition_transcripts_by_strand(transcripts)
+    for strand, transcript_list in enumerate(strand_transcript_lists):
+        G = create_directed_graph(strand, transcript_list)
+        GG[strand] = (G, transcript_list)
     return GG
\ No newline at end of file
@@ -0,0 +1,130 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import assemblyline.lib.batch_sort as batch_sort_module
+from assemblyline.lib.batch_sort import batch_sort
+from assemblyline.lib.gtf import sort_gtf, merge_sort_gtf_files, \
+    merge_gtf, gtf_sort_key, open_gtf
+
+def int_key(line):
+    return int(line.split('\t', 1)[0])
+
+class TestBatchSort(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_lines(self, filename, lines):
+        filename = os.path.join(self.tmp_dir, filename)
+        open(filename, 'w').write(''.join(line + '\n' for line in lines))
+        return filename
+
+    def test_batch_sort(self):
+        random.seed(0)
+        lines = ['%d\t%s' % (random.randint(0, 100), 'x' * random.randint(0, 20))
+                 for i in xrange(5000)]
+        input_file = self.write_lines('input.txt', lines)
+        output_file = os.path.join(self.tmp_dir, 'output.txt')
+        # lines with equal keys are ordered by the line
+        expected = sorted(lines, key=lambda line: (int_key(line), line))
+        spill_dir = os.path.join(self.tmp_dir, 'spill')
+        os.makedirs(spill_dir)
+        for num_processors, memory in ((1, None), (1, 10000), (3, 10000)):
+            batch_sort(input_file, output_file, key=int_key, buffer_size=700,
+                       tempdirs=[spill_dir], memory=memory,
+                       num_processors=num_processors)
+            self.assertEqual(open(output_file).read().splitlines(), expected)
+            self.assertEqual(os.listdir(spill_dir), [])
+        # without a key lines are sorted by byte value
+        batch_sort(input_file, output_file, buffer_size=700)
+        self.assertEqual(open(output_file).read().splitlines(), sorted(lines))
+
+    def test_multipass_merge(self):
+        lines = ['%05d' % i for i in xrange(1000)]
+        random.seed(1)
+        random.shuffle(lines)
+        input_file = self.write_lines('input.txt', lines)
+        output_file = os.path.join(self.tmp_dir, 'output.txt')
+        max_merge_files = batch_sort_module.MAX_MERGE_FILES
+        batch_sort_module.MAX_MERGE_FILES = 3
+        try:
+            batch_sort(input_file, output_file, buffer_size=50)
+        finally:
+            batch_sort_module.MAX_MERGE_FILES = max_merge_files
+        self.assertEqual(open(output_file).read().splitlines(), sorted(lines))
+
+    def test_gtf_sort_key(self):
+        lines = ['chr2\ts\texon\t5\t10\t.\t+\t.\ta "1";',
+                 'chr10\ts\texon\t5\t10\t.\t+\t.\ta "1";',
+                 'chr1\ts\texon\t10\t20\t.\t+\t.\ta "1";',
+                 'chr1\ts\texon\t9\t20\t.\t+\t.\ta "1";',
+                 'chr1\ts\ttranscript\t10\t20\t.\t+\t.\ta "1";',
+                 'chr1\ts\texons\t10\t20\t.\t+\t.\ta "1";',
+                 'chr1\ts\texon\t10\t20\t.\t+\t.\ta "0";']
+        lines.sort(key=lambda line: (gtf_sort_key(line), line))
+        self.assertEqual([line.split('\t')[0] for line in lines],
+                         ['chr1'] * 5 + ['chr10', 'chr2'])
+        self.assertEqual([line.split('\t')[2] for line in lines[:5]],
+                         ['exon', 'transcript', 'exons', 'exon', 'exon'])
+        self.assertEqual(lines[3], 'chr1\ts\texon\t10\t20\t.\t+\t.\ta "0";')
+
+    def test_merge_sort_gtf_files(self):
+        random.seed(2)
+        lines = []
+        for i in xrange(2000):
+            feature_type = random.choice(['transcript', 'exon'])
+            start = random.randint(1, 1000)
+            lines.append('\t'.join([random.choice(['chr1', 'chr2', 'chr10']),
+                                    'src', feature_type, str(start),
+                                    str(start + 100), '.', '+', '.',
+                                    'transcript_id "%d";' % i]))
+        gtf_files = [self.write_lines('a.gtf', lines[:1000]),
+                     self.write_lines('b.gtf', lines[1000:])]
+        expected = sorted(lines, key=lambda line: (gtf_sort_key(line), line))
+        output_file = os.path.join(self.tmp_dir, 'merged.gtf.gz')
+        merge_sort_gtf_files(gtf_files, output_file, tmp_dir=self.tmp_dir,
+                             num_processors=2, memory=50000)
+        self.assertEqual(open_gtf(output_file).read().splitlines(), expected)
+        sorted_file = os.path.join(self.tmp_dir, 'sorted.gtf')
+        sort_gtf(output_file, sorted_file)
+        self.assertEqual(open(sorted_file).read().splitlines(), expected)
+
+    def test_merge_gtf(self):
+        random.seed(3)
+        lines = []
+        for i in xrange(1000):
+            start = random.randint(1, 1000)
+            lines.append('\t'.join([random.choice(['chr1', 'chr2', 'chr10']),
+                                    'src', 'exon', str(start),
+                                    str(start + 100), '.', '+', '.',
+                                    'transcript_id "%d";' % i]))
+        # shards are sorted separately and merged in several passes
+        gtf_files = []
+        for i in xrange(7):
+            shard = sorted(lines[i::7], 
+                           key=lambda line: (gtf_sort_key(line), line))
+            gtf_files.append(self.write_lines('%d.gtf' % i, shard))
+        expected = sorted(lines, key=lambda line: (gtf_sort_key(line), line))
+        output_file = os.path.join(self.tmp_dir, 'merged.gtf')
+        max_merge_files = batch_sort_module.MAX_MERGE_FILES
+        batch_sort_module.MAX_MERGE_FILES = 3
+        try:
+            merge_gtf(gtf_files, output_file, tmp_dir=self.tmp_dir)
+        finally:
+            batch_sort_module.MAX_MERGE_FILES = max_merge_files
+        self.assertEqual(open(output_file).read().splitlines(), expected)
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 8)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import gzip
+import random
+import shutil
+import tempfile
+import unittest
+
+from assemblyline.lib.bgzf import BgzfWriter, BgzfReader, is_bgzf_file, \
+    BGZF_BLOCK_SIZE
+from assemblyline.lib.gtf import open_gtf, index_loci, read_locus_lines, \
+    parse_loci, write_locus_index, query_locus_index, sort_gtf
+
+from test_base import get_gtf_path
+
+class TestBGZF(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_read_write(self):
+        random.seed(0)
+        lines = ['%d\t%s\n' % (i, 'x' * random.randint(0, 500)) 
+                 for i in xrange(2000)]
+        filename = os.path.join(self.tmp_dir, 'test.gz')
+        writer = BgzfWriter(filename)
+        offsets = []
+        for line in lines:
+            offsets.append(writer.tell())
+            writer.write(line)
+        writer.close()
+        data = ''.join(lines)
+        self.assertTrue(len(data) > 2 * BGZF_BLOCK_SIZE)
+        self.assertTrue(is_bgzf_file(filename))
+        # readable as a regular gzip file
+        self.assertEqual(gzip.open(filename).read(), data)
+        reader = BgzfReader(filename)
+        self.assertEqual(list(reader.iter_line_offsets()), 
+                         zip(offsets, lines))
+        reader.seek(0)
+        self.assertEqual(reader.read(), data)
+        # seek to random lines
+        for i in random.sample(xrange(len(lines)), 50):
+            reader.seek(offsets[i])
+            self.assertEqual(reader.readline(), lines[i])
+            reader.seek(offsets[i])
+            self.assertEqual(reader.read(1000), data[sum(len(x) for x in lines[:i]):][:1000])
+        reader.close()
+
+    def test_locus_index(self):
+        for name in ("loci1.gtf", "assemble1.gtf", "annotate_category1.gtf"):
+            gtf_file = get_gtf_path(name)
+            gz_file = os.path.join(self.tmp_dir, name + '.gz')
+            outfh = open_gtf(gz_file, 'w')
+            shutil.copyfileobj(open(gtf_file), outfh)
+            outfh.close()
+            index = list(index_loci(open(gtf_file, 'rb')))
+            gz_index = list(index_loci(open_gtf(gz_file)))
+            self.assertEqual([x[:3] + x[4:] for x in index],
+                             [x[:3] + x[4:] for x in gz_index])
+            fileh = open_gtf(gz_file)
+            for lines, fields in zip(parse_loci(open(gtf_file)), gz_index):
+                self.assertEqual(lines, read_locus_lines(fileh, *fields[3:5]))
+        # query regions
+        index_file = os.path.join(self.tmp_dir, 'loci1.gtf.gz.loci')
+        write_locus_index(os.path.join(self.tmp_dir, 'loci1.gtf.gz'),
+                          index_file)
+        self.assertEqual([x[:3] for x in query_locus_index(index_file, 'chr1', 1100, 5001)],
+                         [('chr1', 0, 1200), ('chr1', 5000, 5500)])
+        self.assertEqual([x[:3] for x in query_locus_index(index_file, 'chr1', 1200, 5000)], [])
+        self.assertEqual([x[:3] for x in query_locus_index(index_file, 'chr2', 0, 10000)],
+                         [('chr2', 0, 300), ('chr2', 1000, 2000)])
+        # the index is not read past the region
+        fileh = open(index_file, 'a')
+        print >>fileh, 'invalid'
+        fileh.close()
+        self.assertEqual([x[:3] for x in query_locus_index(index_file, 'chr1', 1100, 5001)],
+                         [('chr1', 0, 1200), ('chr1', 5000, 5500)])
+        self.assertEqual([x[:3] for x in query_locus_index(index_file, 'chr2', 0, 500)],
+                         [('chr2', 0, 300)])
+
+    def test_sort_gtf(self):
+        gtf_file = get_gtf_path("loci1.gtf")
+        sorted_file = os.path.join(self.tmp_dir, 'sorted.gtf')
+        sort_gtf(gtf_file, sorted_file)
+        gz_file = os.path.join(self.tmp_dir, 'sorted.gtf.gz')
+        sort_gtf(gtf_file, gz_file)
+        self.assertTrue(is_bgzf_file(gz_file))
+        self.assertEqual(open_gtf(gz_file).read(), open(sorted_file).read())
+        sort_gtf(gz_file, sorted_file)
+        self.assertEqual(open_gtf(gz_file).read(), open(sorted_file).read())
+
+if __name__ == "__main__":
+    unittest.main()
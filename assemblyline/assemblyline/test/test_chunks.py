@@ -0,0 +1,156 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import shutil
+import tempfile
+import unittest
+
+from assemblyline.lib.gtf import sort_gtf_lines, gtf_sort_key
+from assemblyline.pipeline.assemble_transcripts import sort_bed_lines
+from assemblyline.lib.chunks import ChunkWriter, read_chunk_index, \
+    merge_chunks, prepare_chunk_dir, CHUNK_INDEX_SUFFIX
+
+class TestChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_merge_chunks(self):
+        # chunks are written out of order by two workers
+        worker_chunks = [[((3,), ['c1\n', 'c0\n']), ((1,), ['a0\n'])],
+                         [((2,), []), ((4,), ['d0\n', 'd1\n'])]]
+        prefixes = []
+        for i,chunks in enumerate(worker_chunks):
+            prefix = os.path.join(self.tmp_dir, "worker%d" % (i))
+            prefixes.append(prefix)
+            writer = ChunkWriter(prefix, ['.txt'], [list.sort])
+            for key, lines in chunks:
+                for line in lines:
+                    writer.buffers[0].write(line)
+                writer.write_chunk(key, (len(lines),))
+            writer.close()
+        chunk_indexes = [read_chunk_index(p) for p in prefixes]
+        self.assertEqual([x[0] for x in chunk_indexes[0]], [(1,), (3,)])
+        self.assertEqual(chunk_indexes[1][0][1], (0,))
+        output_file = os.path.join(self.tmp_dir, "merged.txt")
+        merge_chunks(chunk_indexes, [p + '.txt' for p in prefixes], 0,
+                     output_file,
+                     line_func=lambda line, key, fields:
+                     '%d:%d:%s' % (key[0], fields[0], line))
+        self.assertEqual(open(output_file).read().splitlines(),
+                         ['1:1:a0', '3:2:c0', '3:2:c1', '4:2:d0', '4:2:d1'])
+
+    def test_merge_chunk_groups(self):
+        # chunks of the same group written by different workers are
+        # combined and sorted
+        worker_chunks = [[((1, 0), ['5\n']), ((2, 2), ['4\n', '1\n'])],
+                         [((2, 0), []), ((2, 1), ['3\n']), ((3, 0), ['0\n', '2\n'])]]
+        prefixes = []
+        for i,chunks in enumerate(worker_chunks):
+            prefix = os.path.join(self.tmp_dir, "worker%d" % (i))
+            prefixes.append(prefix)
+            writer = ChunkWriter(prefix, ['.txt'])
+            for key, lines in chunks:
+                for line in lines:
+                    writer.buffers[0].write(line)
+                writer.write_chunk(key)
+            writer.close()
+        chunk_indexes = [read_chunk_index(p) for p in prefixes]
+        output_file = os.path.join(self.tmp_dir, "merged.txt")
+        merge_chunks(chunk_indexes, [p + '.txt' for p in prefixes], 0,
+                     output_file, sort_func=list.sort)
+        self.assertEqual(open(output_file).read().splitlines(),
+                         ['5', '1', '3', '4', '0', '2'])
+        # lines transformed by 'line_func' are sorted again, also in 
+        # groups of a single chunk
+        merge_chunks(chunk_indexes, [p + '.txt' for p in prefixes], 0,
+                     output_file, sort_func=list.sort,
+                     line_func=lambda line, key, fields: 
+                     '%d\n' % (9 - int(line)))
+        self.assertEqual(open(output_file).read().splitlines(),
+                         ['4', '5', '6', '8', '7', '9'])
+
+    def test_resume_chunks(self):
+        chunk_dir = os.path.join(self.tmp_dir, "chunks")
+        params = {'input': 'a.gtf'}
+        run_dir, prefixes, chunk_indexes = prepare_chunk_dir(chunk_dir, 
+                                                             params)
+        self.assertEqual((prefixes, chunk_indexes), ([], []))
+        # group 2 has two chunks but the second was not written, and 
+        # the index line of group 3 was cut short
+        prefix = os.path.join(run_dir, "worker000")
+        writer = ChunkWriter(prefix, ['.txt'])
+        # the first field is the number of chunks in the group
+        for key, fields, data in [((1, 0), (1,), 'a\n'), 
+                                  ((2, 0), (2,), 'b\n')]:
+            writer.buffers[0].write(data)
+            writer.write_chunk(key, fields)
+        writer.close()
+        open(prefix + CHUNK_INDEX_SUFFIX, 'a').write('3,0\t1\t')
+        group_func = lambda chunks: len(chunks) == chunks[0][1][0]
+        run_dir2, prefixes, chunk_indexes = \
+            prepare_chunk_dir(chunk_dir, params, resume=True, 
+                              group_func=group_func)
+        self.assertNotEqual(run_dir, run_dir2)
+        self.assertEqual(prefixes, [prefix])
+        self.assertEqual(chunk_indexes, [[((1, 0), (1,), [(0, 2)])]])
+        self.assertEqual(read_chunk_index(prefix), chunk_indexes[0])
+        # the second attempt completes group 2
+        prefix2 = os.path.join(run_dir2, "worker000")
+        writer = ChunkWriter(prefix2, ['.txt'])
+        writer.buffers[0].write('c\n')
+        writer.write_chunk((2, 0), (1,))
+        writer.close()
+        run_dir3, prefixes, chunk_indexes = \
+            prepare_chunk_dir(chunk_dir, params, resume=True, 
+                              group_func=group_func)
+        self.assertEqual(prefixes, [prefix, prefix2])
+        output_file = os.path.join(self.tmp_dir, "merged.txt")
+        merge_chunks(chunk_indexes, [p + '.txt' for p in prefixes], 0,
+                     output_file)
+        self.assertEqual(open(output_file).read(), 'a\nc\n')
+        # runs with different parameters are not resumed
+        run_dir, prefixes, chunk_indexes = \
+            prepare_chunk_dir(chunk_dir, {'input': 'b.gtf'}, resume=True)
+        self.assertEqual((prefixes, chunk_indexes), ([], []))
+        self.assertEqual(os.listdir(chunk_dir), ['params.txt', 
+                                                 os.path.basename(run_dir)])
+
+    def test_sort_gtf_lines(self):
+        lines = ['chr1\ta\texon\t200\t300\n',
+                 'chr1\ta\texon\t100\t150\n',
+                 'chr1\ta\ttranscript\t100\t300\n']
+        sort_gtf_lines(lines)
+        self.assertEqual([x.split('\t')[2] for x in lines],
+                         ['transcript', 'exon', 'exon'])
+        self.assertEqual(lines[2].split('\t')[3], '200')
+        # lines with the same start and feature type are ordered by 
+        # their text as in 'sort_gtf'
+        lines = ['chr1\ta\texon\t100\t300\tgene_id "G2";\n',
+                 'chr1\ta\ttranscript\t100\t300\tgene_id "G2";\n',
+                 'chr1\ta\texon\t100\t300\tgene_id "G1";\n',
+                 'chr1\ta\ttranscript\t100\t300\tgene_id "G1";\n']
+        expected = [lines[3], lines[1], lines[2], lines[0]]
+        self.assertEqual(sorted(lines, key=lambda x: (gtf_sort_key(x), x)),
+                         expected)
+        sort_gtf_lines(lines)
+        self.assertEqual(lines, expected)
+
+    def test_sort_bed_lines(self):
+        lines = ['chr1\t200\t300\tB\n',
+                 'chr1\t100\t300\tB\n',
+                 'chr1\t100\t300\tA\n',
+                 'chr1\t20\t300\tC\n']
+        sort_bed_lines(lines)
+        self.assertEqual([x.split('\t')[3] for x in lines], 
+                         ['C\n', 'A\n', 'B\n', 'B\n'])
+        self.assertEqual(lines[2], 'chr1\t100\t300\tB\n')
+
+if __name__ == "__main__":
+    unittest.main()
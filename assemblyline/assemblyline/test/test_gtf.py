@@ -0,0 +1,194 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import unittest
+import StringIO
+
+from assemblyline.lib.gtf import parse_loci, index_loci, read_locus_lines, \
+    GTFFeature, GTFWriter, AttrTable, decode_attr_string, LocusGuard, \
+    GUARD_QUARANTINE, index_loci_parallel, find_shard_offsets
+from assemblyline.lib.base import GTF_ATTR_DEFS
+from assemblyline.lib.transcript import Exon
+
+from test_base import get_gtf_path
+
+class TestLocusIndex(unittest.TestCase):
+
+    def check_index(self, filename):
+        gtf_file = get_gtf_path(filename)
+        loci = list(parse_loci(open(gtf_file)))
+        index = list(index_loci(open(gtf_file, 'rb')))
+        self.assertEqual(len(loci), len(index))
+        fileh = open(gtf_file, 'rb')
+        for lines, fields in zip(loci, index):
+            chrom, start, end, offset, length = fields[:5]
+            self.assertEqual(lines, read_locus_lines(fileh, offset, length))
+            self.assertEqual(chrom, lines[0].split('\t')[0])
+            features = [line.split('\t')[2] for line in lines]
+            self.assertEqual(fields[5], features.count('transcript'))
+        fileh.close()
+
+    def test_index_loci(self):
+        self.check_index("loci1.gtf")
+        self.check_index("assemble1.gtf")
+        self.check_index("annotate_category1.gtf")
+        self.check_index("trim_bidir1.gtf")
+        index = list(index_loci(open(get_gtf_path("loci1.gtf"), 'rb')))
+        self.assertEqual([x[:3] for x in index],
+                         [('chr1', 0, 1200), ('chr1', 5000, 5500),
+                          ('chr2', 0, 300), ('chr2', 1000, 2000)])
+        self.assertEqual([x[5:] for x in index],
+                         [(3, 6), (1, 2), (2, 4), (1, 2)])
+
+    def test_index_loci_parallel(self):
+        for filename in ("loci1.gtf", "assemble1.gtf", 
+                         "annotate_category1.gtf", "trim_bidir1.gtf"):
+            gtf_file = get_gtf_path(filename)
+            index = list(index_loci(open(gtf_file, 'rb')))
+            for num_processors in (1, 2, 3, 5, 8):
+                offsets = find_shard_offsets(gtf_file, num_processors)
+                self.assertEqual(offsets, sorted(set(offsets)))
+                self.assertTrue(len(offsets) <= num_processors + 1)
+                self.assertEqual(index, index_loci_parallel(gtf_file, 
+                                                            num_processors))
+
+class TestLocusGuard(unittest.TestCase):
+
+    # a long read-through transcript (1) joins three genes
+    INTERVALS = [(0, 100), (0, 5000), (50, 300), (400, 600), (2000, 2200),
+                 (2100, 2500), (4000, 4800)]
+
+    def test_split(self):
+        guard = LocusGuard(max_span=1000)
+        self.assertEqual(guard.split('chr1', self.INTERVALS[:1]), [[0]])
+        self.assertEqual(guard.records, [])
+        pieces = guard.split('chr1', self.INTERVALS, key=1)
+        self.assertEqual(sorted(i for p in pieces for i in p), range(7))
+        self.assertTrue([0, 1, 2] in pieces)
+        self.assertTrue([4, 5] in pieces)
+        self.assertTrue([6] in pieces)
+        self.assertEqual(guard.records, 
+                         [(1, 'chr1', 0, 5000, 7, 'split', len(pieces), 0)])
+        # limit on the number of transcripts
+        guard = LocusGuard(max_transcripts=2)
+        pieces = guard.split('chr1', self.INTERVALS)
+        self.assertTrue(all(len(p) <= 2 for p in pieces))
+        self.assertEqual(sorted(i for p in pieces for i in p), range(7))
+
+    def test_num_pieces(self):
+        # a chain of overlapping transcripts is cut into as few pieces
+        # as the transcript limit needs
+        intervals = [(i * 100, i * 100 + 250) for i in xrange(12)]
+        guard = LocusGuard(max_transcripts=5)
+        pieces = guard.split('chr1', intervals)
+        self.assertEqual(len(pieces), 3)
+        self.assertTrue(all(len(p) <= 5 for p in pieces))
+        self.assertEqual(sum(pieces, []), range(12))
+        # cuts are made where the fewest transcripts cross
+        intervals = ([(0, 10000)] + [(i * 100, i * 100 + 250) 
+                                     for i in xrange(1, 7)] +
+                     [(i * 100, i * 100 + 250) for i in xrange(20, 26)])
+        guard = LocusGuard(max_transcripts=7)
+        self.assertEqual(guard.split('chr1', intervals), 
+                         [range(7), range(7, 13)])
+
+    def test_quarantine(self):
+        guard = LocusGuard(max_span=1000, mode=GUARD_QUARANTINE)
+        pieces = guard.split('chr1', self.INTERVALS)
+        # the read-through transcript is assembled separately at the end
+        self.assertEqual(pieces, [[0, 2, 3], [4, 5], [6], [1]])
+        self.assertEqual(guard.records[0][-1], 1)
+
+    def test_parse_loci(self):
+        lines = []
+        for i, (start, end) in enumerate(self.INTERVALS):
+            for feature_type in ('transcript', 'exon'):
+                lines.append('chr1\tAssemblyLine\t%s\t%d\t%d\t1000\t+\t.\t'
+                             'transcript_id "T%d";' % 
+                             (feature_type, start + 1, end, i))
+        loci = list(parse_loci(lines))
+        self.assertEqual(len(loci), 1)
+        guard = LocusGuard(max_span=1000, mode=GUARD_QUARANTINE)
+        loci = list(parse_loci(lines, guard))
+        self.assertEqual(len(loci), 4)
+        self.assertEqual(sorted(sum(loci, [])), sorted(lines))
+        self.assertEqual(loci[-1], lines[2:4])
+        self.assertEqual(guard.records[0][0], 1)
+
+class TestAttrTable(unittest.TestCase):
+
+    def test_intern(self):
+        table = AttrTable(max_values=2)
+        a = decode_attr_string('lid "L1"; tid "T1";', attr_table=table)
+        b = decode_attr_string('lid "L1"; tid "T2";', attr_table=table)
+        self.assertEqual(a, {'lid': 'L1', 'tid': 'T1'})
+        self.assertTrue(a['lid'] is b['lid'])
+        # attributes with many distinct values are not interned
+        c = decode_attr_string('lid "L1"; tid "T3";', attr_table=table)
+        d = decode_attr_string('lid "L1"; tid "T3";', attr_table=table)
+        self.assertTrue(c['lid'] is a['lid'])
+        self.assertEqual(c['tid'], d['tid'])
+        self.assertFalse(c['tid'] is d['tid'])
+        self.assertEqual(decode_attr_string('.', attr_table=table), {})
+
+    def test_typed_attrs(self):
+        line = ('chr1\tAssemblyLine\texon\t1\t100\t1000\t+\t.\t'
+                'ref "1"; score "12.5"; pct "99.0"; tst "0";')
+        f = GTFFeature.from_string(line, GTF_ATTR_DEFS)
+        self.assertEqual(f.attrs, {'ref': 1, 'score': 12.5, 'pct': 99.0,
+                                   'tst': '0'})
+        g = GTFFeature.from_string(str(f), GTF_ATTR_DEFS)
+        self.assertEqual(g.attrs, f.attrs)
+
+class TestGTFWriter(unittest.TestCase):
+
+    def test_write_transcript(self):
+        fileh = StringIO.StringIO()
+        writer = GTFWriter(fileh, bufsize=0)
+        exons = [Exon(0, 100), Exon(200, 300)]
+        writer.write_transcript('chr1', '+', exons, 
+                                [('gene_id', 'G1'), ('transcript_id', 'TU1')],
+                                score=1000, exon_score=1,
+                                transcript_attrs=[('frac', '1.000')])
+        lines = fileh.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        features = [GTFFeature.from_string(line) for line in lines]
+        f = features[0]
+        self.assertEqual(f.feature_type, 'transcript')
+        self.assertEqual((f.start, f.end), (0, 300))
+        self.assertEqual(f.score, 1000)
+        self.assertEqual(f.attrs, {'gene_id': 'G1', 'transcript_id': 'TU1',
+                                   'frac': '1.000'})
+        for i,f in enumerate(features[1:]):
+            self.assertEqual(f.feature_type, 'exon')
+            self.assertEqual((f.start, f.end), (exons[i].start, exons[i].end))
+            self.assertEqual(f.score, 1)
+            self.assertEqual(f.strand, '+')
+            self.assertEqual(f.attrs, {'gene_id': 'G1', 'transcript_id': 'TU1',
+                                       'exon_number': str(i + 1)})
+
+    def test_exon_scores(self):
+        fileh = StringIO.StringIO()
+        writer = GTFWriter(fileh, bufsize=0)
+        exons = [Exon(200, 300), Exon(0, 100)]
+        writer.write_transcript('chr1', '-', exons, [('gene_id', 'G1')],
+                                score=5.0, exon_scores=[5.0, 0.25],
+                                first_exon_number=None)
+        lines = fileh.getvalue().splitlines()
+        self.assertEqual([line.split('\t')[5] for line in lines],
+                         ['5.0', '5.0', '0.25'])
+        # exons are written in the given order without exon numbers
+        features = [GTFFeature.from_string(line) for line in lines[1:]]
+        self.assertEqual([(f.start, f.end) for f in features], 
+                         [(200, 300), (0, 100)])
+        self.assertEqual(lines[2].split('\t')[8], 'gene_id "G1";')
+
+    def test_buffering(self):
+        fileh = StringIO.StringIO()
+        writer = GTFWriter(fileh)
+        writer.write_transcript('chr1', '-', [Exon(0, 100)], {'gene_id': 'G1'})
+        self.assertEqual(fileh.getvalue(), '')
+        writer.flush()
+        self.assertEqual(len(fileh.getvalue().splitlines()), 2)
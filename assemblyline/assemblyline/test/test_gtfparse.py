@@ -0,0 +1,68 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import pickle
+import unittest
+
+from assemblyline.lib.gtf import GTFFeature
+from assemblyline.lib.transcript import parse_gtf
+from assemblyline.lib import gtfparse
+
+from test_base import get_gtf_path
+
+GTF_FILES = ["annotate_test1.gtf", "assemble1.gtf", "loci1.gtf", 
+             "resolve_strand_scores1.gtf"]
+
+LINE = ('chr1\tCufflinks\ttranscript\t136546\t137059\t1000\t.\t.\t'
+        'gene_id "G1"; transcript_id "T1"; FPKM "100.7"; frac "1.0"; '
+        'xFPKM "3"; FPKM "50.1";')
+
+class TestGTFParse(unittest.TestCase):
+
+    def test_parse(self):
+        for filename in GTF_FILES:
+            correct = list(GTFFeature.parse(open(get_gtf_path(filename))))
+            for attrs in (None, ['ref'], ['score', 'pct']):
+                features = list(gtfparse.parse(open(get_gtf_path(filename)),
+                                               attrs=attrs))
+                self.assertEqual(len(features), len(correct))
+                for f, g in zip(features, correct):
+                    self.assertEqual(str(f), str(g))
+                    self.assertEqual(f.attrs, g.attrs)
+
+    def test_parse_gtf(self):
+        for filename in GTF_FILES:
+            correct = list(parse_gtf(open(get_gtf_path(filename))))
+            loci = list(gtfparse.parse_gtf(open(get_gtf_path(filename)),
+                                           attrs=['score']))
+            self.assertEqual(len(loci), len(correct))
+            for transcripts, correct_transcripts in zip(loci, correct):
+                for t, c in zip(transcripts, correct_transcripts):
+                    self.assertEqual(str(t), str(c))
+
+    def test_lazy_attrs(self):
+        attr_defs = {'FPKM': float}
+        correct = GTFFeature.from_string(LINE, attr_defs)
+        f = gtfparse.parse_gtf_line(LINE, attr_defs, 
+                                    frozenset(['FPKM', 'ref']))
+        # wanted attributes use the last value of duplicate tags
+        self.assertEqual(f.attrs['FPKM'], 50.1)
+        self.assertEqual(f.attrs.get('ref', '0'), '0')
+        self.assertFalse('ref' in f.attrs)
+        self.assertRaises(KeyError, lambda: f.attrs['ref'])
+        # other attributes are decoded when accessed
+        self.assertEqual(f.attrs['frac'], '1.0')
+        self.assertEqual(f.attrs, correct.attrs)
+        self.assertEqual(f.attrs.items(), correct.attrs.items())
+        self.assertEqual(str(f), str(correct))
+        # modification
+        f = gtfparse.parse_gtf_line(LINE, None, frozenset(['gene_id']))
+        f.attrs['gene_id'] = 'G2'
+        self.assertEqual(f.attrs['transcript_id'], 'T1')
+        self.assertEqual(f.attrs.copy()['gene_id'], 'G2')
+        self.assertEqual(pickle.loads(pickle.dumps(f.attrs)), f.attrs)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import random
+import unittest
+import numpy as np
+
+from assemblyline.lib.assemble.array_graph import ArrayGraph
+from assemblyline.lib.assemble.assembler import create_kmer_graph, \
+    kmer_graph_statistics, optimize_k, SubpathIndex
+
+def random_partial_paths(seed, num_nodes=12, num_paths=30):
+    # chain of nodes with random skip edges and random walks as paths
+    rng = random.Random(seed)
+    edges = [(n, n+1) for n in xrange(num_nodes-1)]
+    edges.extend((n, n+2) for n in xrange(num_nodes-2) if rng.random() < 0.5)
+    G = ArrayGraph(num_nodes, edges)
+    succ = G.successor_lists()
+    partial_paths = {}
+    for i in xrange(num_paths):
+        n = rng.randrange(num_nodes)
+        path = [n]
+        while succ[n] and (rng.random() < 0.8):
+            n = rng.choice(succ[n])
+            path.append(n)
+        partial_paths[tuple(path)] = float(rng.randint(1, 10))
+    return G, sorted(partial_paths.items())
+
+class TestKmerGraph(unittest.TestCase):
+
+    def test_subpath_index(self):
+        paths = [(0,1,2,3), (1,2), (2,3,1,2), (4,)]
+        index = SubpathIndex(enumerate(paths))
+        self.assertEqual(index.find((1,2)), set([0,1,2]))
+        self.assertEqual(index.find((2,3)), set([0,2]))
+        self.assertEqual(index.find((3,1,2)), set([2]))
+        self.assertEqual(index.find((0,1,2,3,4)), set())
+        self.assertEqual(index.find((5,)), set())
+        # compare to all substrings of the paths
+        for seed in xrange(10):
+            G, partial_paths = random_partial_paths(seed)
+            paths = [path for path,score in partial_paths]
+            index = SubpathIndex(enumerate(paths))
+            for path in paths:
+                for i in xrange(len(path)):
+                    for j in xrange(i+1, len(path)+1):
+                        subpath = path[i:j]
+                        correct = set(x for x,p in enumerate(paths)
+                                      if any(p[y:y+len(subpath)] == subpath
+                                             for y in xrange(len(p))))
+                        self.assertEqual(index.find(subpath), correct)
+
+    def test_kmer_graph_statistics(self):
+        for seed in xrange(25):
+            G, partial_paths = random_partial_paths(seed)
+            kmax = max(len(path) for path,score in partial_paths)
+            for k, num_nodes, lost_paths in \
+                kmer_graph_statistics(G, partial_paths, 1, kmax):
+                K, correct_lost_paths = create_kmer_graph(G, partial_paths, k)
+                self.assertEqual(num_nodes, len(K))
+                self.assertEqual(lost_paths, correct_lost_paths)
+
+    def test_optimize_k(self):
+        for seed in xrange(25):
+            G, partial_paths = random_partial_paths(seed)
+            kmax = max(len(path) for path,score in partial_paths)
+            K, k = optimize_k(G, partial_paths, 1, kmax, 0.9)
+            Kcorrect, lost_paths = create_kmer_graph(G, partial_paths, k)
+            self.assertTrue(np.array_equal(K.score, Kcorrect.score))
+            # k is the largest k with the most nodes before the 
+            # sensitivity drops below the threshold
+            total_score = sum(score for path,score in partial_paths)
+            sizes = []
+            for i in xrange(1, kmax+1):
+                Ki, lost_paths = create_kmer_graph(G, partial_paths, i)
+                lost_score = sum(score for path,score in lost_paths)
+                if (total_score - lost_score) / total_score < 0.9:
+                    break
+                sizes.append(len(Ki))
+            self.assertEqual(k, max(i+1 for i,size in enumerate(sizes) 
+                                    if size == max(sizes)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import random
+import unittest
+import numpy as np
+
+from assemblyline.lib.assemble.array_graph import ArrayGraph
+from assemblyline.lib.assemble.path_finder import PathFinder, \
+    find_suboptimal_paths
+
+def random_dag(num_nodes, num_edges, seed):
+    # edges point from lower to higher node numbers
+    rng = random.Random(seed)
+    edges = [(0, 1), (num_nodes-2, num_nodes-1)]
+    for i in xrange(num_edges):
+        u, v = sorted(rng.sample(xrange(num_nodes), 2))
+        edges.append((u, v))
+    G = ArrayGraph(num_nodes, edges)
+    G.add_node_attr('score', np.array([rng.choice((1.0, 2.0, 5.0, 8.0))
+                                       for n in xrange(num_nodes)]))
+    return G
+
+class TestPathFinder(unittest.TestCase):
+
+    def test_suboptimal_paths(self):
+        # diamond graph with a stronger upper branch
+        G = ArrayGraph(4, [(0,1), (0,2), (1,3), (2,3)])
+        G.add_node_attr('score', np.array([10.0, 7.0, 3.0, 10.0]))
+        results = find_suboptimal_paths(G, 0, 3)
+        self.assertEqual(results, [((0,1,3), 7.0), ((0,2,3), 3.0)])
+
+    def test_incremental_update(self):
+        # after subtracting paths the incremental state must equal the
+        # state computed from scratch with the same node scores
+        for seed in xrange(20):
+            G = random_dag(40, 100, seed)
+            source, sink = 0, len(G) - 1
+            finder = PathFinder(G, source)
+            for i in xrange(10):
+                path, score = finder.traceback(sink)
+                finder.subtract_path(path, score)
+                G.score = np.array(finder.node_scores)
+                full = PathFinder(G, source)
+                self.assertEqual(finder.path_min_scores, 
+                                 full.path_min_scores)
+                self.assertEqual(finder.path_prev, full.path_prev)
+
+if __name__ == "__main__":
+    unittest.main()
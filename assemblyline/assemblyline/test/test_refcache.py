@@ -0,0 +1,152 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import shutil
+import StringIO
+import multiprocessing
+import tempfile
+import unittest
+
+from assemblyline.lib.gtf import GTFFeature, gtf_sort_key
+from assemblyline.lib.refcache import get_reference_cache, \
+    reference_checksum, REF_CACHE_SUFFIX, REF_CACHE_CHECKSUMS_FILE, \
+    REF_CACHE_FORMAT, REF_CACHE_FORMAT_FILE
+
+# unsorted reference with exons out of order, transcripts with and 
+# without a 'transcript' feature and features that are not exons
+REF_GTF_LINES = [
+    'chr1\tensembl\ttranscript\t5001\t5100\t.\t-\t.\tgene_id "G2"; transcript_id "T3"; transcript_name "N3";',
+    'chr2\tref\texon\t501\t600\t.\t-\t.\tgene_id "G3"; transcript_id "T4"; exon_number "2";',
+    'chr1\tref\tgene\t1\t2100\t.\t+\t.\tgene_id "G1";',
+    'chr1\tref\texon\t2001\t2100\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; exon_number "3";',
+    'chr1\tref\texon\t1\t100\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; exon_number "1";',
+    'chr1\tref\tCDS\t51\t100\t.\t+\t0\tgene_id "G1"; transcript_id "T1";',
+    'chr1\tref\texon\t1001\t1100\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; exon_number "2";',
+    'chr1\tref\texon\t1\t100\t.\t+\t.\tgene_id "G1"; transcript_id "T2"; exon_number "1";',
+    'chr1\tref\texon\t5001\t5100\t.\t-\t.\tgene_id "G2"; transcript_id "T3"; exon_number "1"; exon_id "E3";',
+    'chr2\tref\texon\t101\t200\t.\t-\t.\tgene_id "G3"; transcript_id "T4"; exon_number "1";']
+
+def _compile(args):
+    return get_reference_cache(*args).path
+
+class TestReferenceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ref_gtf_file = os.path.join(self.tmp_dir, 'ref.gtf')
+        fileh = open(self.ref_gtf_file, 'w')
+        for line in REF_GTF_LINES:
+            print >>fileh, line
+        fileh.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_compile(self):
+        ref_cache = get_reference_cache(self.ref_gtf_file)
+        cache_dir = self.ref_gtf_file + REF_CACHE_SUFFIX
+        self.assertEqual(ref_cache.checksum,
+                         reference_checksum(self.ref_gtf_file, cache_dir))
+        self.assertEqual(ref_cache.path,
+                         os.path.join(cache_dir, ref_cache.checksum))
+        lines = [line.rstrip('\n') for line in open(ref_cache.gtf_file)]
+        self.assertEqual(lines, sorted(lines, key=gtf_sort_key))
+        features = [GTFFeature.from_string(line) for line in lines]
+        self.assertTrue(all(f.feature_type in ('transcript', 'exon')
+                            for f in features))
+        transcripts = dict((f.attrs['transcript_id'], f) for f in features
+                           if f.feature_type == 'transcript')
+        self.assertEqual(sorted(transcripts), ['T1', 'T2', 'T3', 'T4'])
+        self.assertEqual((transcripts['T1'].start, transcripts['T1'].end),
+                         (0, 2100))
+        self.assertEqual((transcripts['T4'].start, transcripts['T4'].end),
+                         (100, 600))
+        self.assertFalse('exon_number' in transcripts['T1'].attrs)
+        # 'transcript' features are built from the exons rather than 
+        # taken from the reference
+        f = transcripts['T3']
+        self.assertEqual(f.source, 'ref')
+        self.assertFalse('transcript_name' in f.attrs)
+        # lines are written in the format of 'GTFFeature'
+        self.assertTrue(all(line.split('\t')[5] == '0' for line in lines))
+        # transcript store
+        store = ref_cache.store()
+        self.assertEqual(len(store), 4)
+        loci = list(ref_cache.iterloci())
+        self.assertEqual([len(x) for x in loci], [2, 1, 1])
+        t = [t for t in loci[0] if t.attrs['transcript_id'] == 'T1'][0]
+        self.assertEqual(t.introns(), [(100, 1000), (1100, 2000)])
+        # compiled references are reused
+        mtime = os.path.getmtime(ref_cache.gtf_file)
+        self.assertEqual(get_reference_cache(self.ref_gtf_file).path,
+                         ref_cache.path)
+        self.assertEqual(os.path.getmtime(ref_cache.gtf_file), mtime)
+
+    def test_checksum(self):
+        cache_dir = os.path.join(self.tmp_dir, 'cache')
+        ref_cache = get_reference_cache(self.ref_gtf_file, cache_dir)
+        # a changed reference is compiled again
+        fileh = open(self.ref_gtf_file, 'a')
+        print >>fileh, REF_GTF_LINES[-1].replace('T4', 'T5')
+        fileh.close()
+        new_ref_cache = get_reference_cache(self.ref_gtf_file, cache_dir)
+        self.assertNotEqual(new_ref_cache.checksum, ref_cache.checksum)
+        self.assertEqual(len(new_ref_cache.store()), 5)
+
+    def test_format_version(self):
+        cache_dir = os.path.join(self.tmp_dir, 'cache')
+        path = get_reference_cache(self.ref_gtf_file, cache_dir).path
+        # a cache of an earlier format is compiled again
+        fileh = open(os.path.join(path, REF_CACHE_FORMAT_FILE), 'w')
+        print >>fileh, '\t'.join([REF_CACHE_FORMAT, '0', 'x'])
+        fileh.close()
+        ref_cache = get_reference_cache(self.ref_gtf_file, cache_dir)
+        self.assertEqual(ref_cache.path, path)
+        self.assertEqual(len(ref_cache.store()), 4)
+        self.assertEqual(sorted(os.listdir(cache_dir)),
+                         sorted([os.path.basename(path), 
+                                 REF_CACHE_CHECKSUMS_FILE]))
+
+    def test_fallback_dir(self):
+        # the directory of the reference cannot be written
+        open(self.ref_gtf_file + REF_CACHE_SUFFIX, 'w').close()
+        fallback_dir = os.path.join(self.tmp_dir, 'fallback')
+        ref_cache = get_reference_cache(self.ref_gtf_file, 
+                                        tmp_dir=fallback_dir)
+        self.assertEqual(os.path.dirname(ref_cache.path),
+                         os.path.join(fallback_dir, 
+                                      'ref.gtf' + REF_CACHE_SUFFIX))
+        self.assertEqual(len(ref_cache.store()), 4)
+
+    def test_concurrent(self):
+        cache_dir = os.path.join(self.tmp_dir, 'cache')
+        pool = multiprocessing.Pool(4)
+        paths = pool.map(_compile, [(self.ref_gtf_file, cache_dir)] * 8)
+        pool.close()
+        pool.join()
+        self.assertEqual(len(set(paths)), 1)
+        # the compiled references of the other processes are discarded
+        self.assertEqual(sorted(os.listdir(cache_dir)),
+                         sorted([os.path.basename(paths[0]), 
+                                 REF_CACHE_CHECKSUMS_FILE]))
+        self.assertEqual(len(get_reference_cache(self.ref_gtf_file, 
+                                                 cache_dir).store()), 4)
+
+    def test_write_gtf(self):
+        ref_cache = get_reference_cache(self.ref_gtf_file)
+        fileh = StringIO.StringIO()
+        ref_cache.write_gtf(fileh, lambda g_id: (('ref', '1'),
+                                                 ('test', g_id == 'G1')))
+        lines = fileh.getvalue().splitlines()
+        self.assertEqual(len(lines), 11)
+        self.assertEqual(lines, sorted(lines, key=gtf_sort_key))
+        for f in GTFFeature.parse(lines):
+            self.assertEqual(f.attrs['ref'], '1')
+            self.assertEqual(f.attrs['test'],
+                             str(f.attrs['gene_id'] == 'G1'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import random
+import unittest
+
+from assemblyline.pipeline.assemble_transcripts import estimate_locus_cost, \
+    schedule_loci
+
+class TestScheduleLoci(unittest.TestCase):
+
+    def test_interleave(self):
+        # loci in order of cost are 1, 4, 0, 3, 2, 5
+        costs = [30, 100, 5, 20, 50, 1]
+        # largest, smallest, second largest, second smallest, ...
+        self.assertEqual(schedule_loci(costs), [1, 5, 4, 2, 0, 3])
+        # the middle locus of an odd number of loci appears once
+        costs = [3, 1, 2]
+        self.assertEqual(schedule_loci(costs), [0, 1, 2])
+        self.assertEqual(schedule_loci([7]), [0])
+        self.assertEqual(schedule_loci([]), [])
+
+    def test_each_locus_once(self):
+        random.seed(0)
+        for n in xrange(1, 50):
+            costs = [random.randint(0, 10) for i in xrange(n)]
+            schedule = schedule_loci(costs)
+            self.assertEqual(sorted(schedule), range(n))
+            # the most expensive locus is dispatched first
+            self.assertEqual(costs[schedule[0]], max(costs))
+
+    def test_estimate_cost(self):
+        cost = estimate_locus_cost(10, 20, 1000)
+        self.assertTrue(estimate_locus_cost(20, 20, 1000) > cost)
+        self.assertTrue(estimate_locus_cost(10, 40, 1000) > cost)
+        self.assertTrue(estimate_locus_cost(10, 20, 100000) > cost)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import random
+import unittest
+import numpy as np
+
+from assemblyline.lib.assemble.array_graph import ArrayGraph
+from assemblyline.lib.assemble.smooth import smooth_graph
+
+def smooth_graph_nodes(G):
+    # smooth one node at a time in topological order
+    def smooth_iteration(order, nbrs, scores, smooth_scores, smooth_tmp):
+        for u in order:
+            succ = nbrs[u]
+            if len(succ) == 0:
+                continue
+            total_nbr_score = sum(scores[v] for v in succ)
+            for v in succ:
+                if total_nbr_score == 0:
+                    adj_score = smooth_scores[u] / len(succ)
+                else:
+                    adj_score = smooth_scores[u] * scores[v] / total_nbr_score
+                smooth_tmp[v] += adj_score
+                smooth_scores[v] += adj_score
+    order = G.topological_sort()
+    scores = G.score.tolist()
+    smooth_tmp = [0.0] * len(G)
+    smooth_iteration(order, G.successor_lists(), scores, 
+                     G.smooth_fwd.tolist(), smooth_tmp)
+    smooth_iteration(order[::-1], G.predecessor_lists(), scores, 
+                     G.smooth_rev.tolist(), smooth_tmp)
+    return G.score + np.array(smooth_tmp)
+
+def random_graph(num_nodes, edges, seed):
+    rng = random.Random(seed)
+    G = ArrayGraph(num_nodes, edges)
+    for name in ('score', 'smooth_fwd', 'smooth_rev'):
+        G.add_node_attr(name, np.array([rng.choice((0.0, rng.random()))
+                                        for n in xrange(num_nodes)]))
+    G.add_node_attr('smooth_tmp', np.zeros(num_nodes))
+    return G
+
+class TestSmooth(unittest.TestCase):
+
+    def test_smooth_graph(self):
+        rng = random.Random(0)
+        # long chains are smoothed one edge at a time and wide layers 
+        # of the graph are smoothed together
+        graphs = [(50, [(n, n+1) for n in xrange(49)]),
+                  (400, [(n, (n/100 + 1)*100 + rng.randrange(100))
+                         for n in xrange(300) for i in xrange(3)]),
+                  (400, [(n, min(399, n + rng.randint(1, 50)))
+                         for n in xrange(399) for i in xrange(2)])]
+        for seed, (num_nodes, edges) in enumerate(graphs):
+            G = random_graph(num_nodes, edges, seed)
+            correct = smooth_graph_nodes(G)
+            smooth_graph(G)
+            self.assertTrue(np.allclose(G.score, correct, rtol=1e-12))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import random
+import unittest
+
+from assemblyline.lib.stats import ECDF, scoreatpercentile, \
+    scoresatpercentiles, ScoreSketch, ScoreDistribution
+
+PERCENTILES = [0, 1, 5, 10, 25, 50, 75, 90, 95, 99, 100]
+
+class TestScoreDistribution(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.scores = [random.lognormvariate(0, 3) for i in xrange(2000)]
+        self.scores.extend([0.0] * 100)
+        self.scores.extend(random.randint(1, 10) for i in xrange(100))
+
+    def test_exact(self):
+        dist = ScoreDistribution()
+        for score in self.scores:
+            dist.add(score)
+        self.assertFalse(dist.is_approximate())
+        ecdf = ECDF(self.scores, side="left")
+        for score in self.scores[::10] + [-1.0, 1e9]:
+            self.assertAlmostEqual(dist.pctrank(score), 100.0 * ecdf(score))
+        expected = [scoreatpercentile(self.scores, per)
+                    for per in PERCENTILES]
+        for a, b in zip(dist.scoresatpercentiles(PERCENTILES), expected):
+            self.assertAlmostEqual(a, b)
+
+    def test_sketch(self):
+        accuracy = 0.01
+        dist = ScoreDistribution(max_exact=100, accuracy=accuracy)
+        for score in self.scores:
+            dist.add(score)
+        self.assertTrue(dist.is_approximate())
+        self.assertEqual(len(dist), len(self.scores))
+        ecdf = ECDF(self.scores, side="left")
+        for score in self.scores[::10]:
+            self.assertTrue(abs(dist.pctrank(score) - 100.0 * ecdf(score))
+                            < 1.0)
+        expected = scoresatpercentiles(sorted(self.scores), PERCENTILES)
+        approx = dist.scoresatpercentiles(PERCENTILES)
+        self.assertEqual(approx[0], expected[0])
+        self.assertEqual(approx[-1], expected[-1])
+        # scores are not negative so interpolated scores are within the
+        # accuracy of the sketch
+        for a, b in zip(approx, expected):
+            self.assertTrue(abs(a - b) <= accuracy * abs(b) * (1 + 1e-9))
+
+    def test_empty(self):
+        sketch = ScoreSketch()
+        for scores in (scoresatpercentiles([], [0, 50]),
+                       sketch.scoresatpercentiles([0, 50])):
+            self.assertTrue(all(x != x for x in scores))
+
+if __name__ == "__main__":
+    unittest.main()
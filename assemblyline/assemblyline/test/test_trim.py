@@ -10,6 +10,11 @@ from assemblyline.lib.transcript import POS_STRAND, NEG_STRAND, Exon
 
 from test_base import read_first_locus, get_transcript_graphs
 
+def trim_graph_exons(G, strand, **kwargs):
+    # convert trimmed nodes to Exon objects
+    return set(Exon(int(G.start[n]), int(G.end[n])) 
+               for n in trim_graph(G, strand, **kwargs))
+
 class TestTrim(unittest.TestCase):
 
     def test_trim_bidir(self):
@@ -17,20 +22,20 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[POS_STRAND]
         # trim at three different thresholds
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.015,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(0,100), Exon(900,1000)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.11,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(0,100), Exon(900,1000), 
                        Exon(100,200), Exon(800,900)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.26,
                                 trim_intron_fraction=0.0)
@@ -44,20 +49,20 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[NEG_STRAND]        
         # trim at three different thresholds
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.015,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(0,100), Exon(900,1000)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.11,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(0,100), Exon(900,1000), 
                        Exon(100,200), Exon(800,900)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.26,
                                 trim_intron_fraction=0.0)
@@ -71,19 +76,19 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[POS_STRAND]      
         # trim at different thresholds
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.001)
         correct = set()
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.025)
         correct = set([Exon(1900, 2000), Exon(1000, 1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.2)
@@ -92,7 +97,7 @@ class TestTrim(unittest.TestCase):
                        Exon(1800, 1900), 
                        Exon(1000, 1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.25)
@@ -109,19 +114,19 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[NEG_STRAND]
         # trim at different thresholds
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.001)
         correct = set()
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.025)
         correct = set([Exon(1900, 2000), Exon(1000, 1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.2)
@@ -130,7 +135,7 @@ class TestTrim(unittest.TestCase):
                        Exon(1800, 1900), 
                        Exon(1000, 1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.25)
@@ -148,32 +153,32 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[POS_STRAND]
         # trim at different thresholds
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.009,
                                 trim_intron_fraction=0.0)
         correct = set()
         self.assertTrue(trim_nodes == correct)        
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.015,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.11,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100), Exon(1100,1200)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.26,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100), Exon(1100,1200),
                        Exon(1200,1300)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=1.0,
                                 trim_intron_fraction=0.0)
@@ -186,32 +191,32 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[NEG_STRAND]
         # trim at different thresholds
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.009,
                                 trim_intron_fraction=0.0)
         correct = set()
         self.assertTrue(trim_nodes == correct)  
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.015,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.11,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100), Exon(1100,1200)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.26,
                                 trim_intron_fraction=0.0)
         correct = set([Exon(1000,1100), Exon(1100,1200),
                        Exon(1200,1300)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=1.0,
                                 trim_intron_fraction=0.0)
@@ -224,32 +229,32 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[POS_STRAND]       
         # trim at different thresholds
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.001)
         correct = set()
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.011)
         correct = set([Exon(1000,1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.055)
         correct = set([Exon(1000,1100), Exon(1100,1200)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.15)
         correct = set([Exon(1000,1100), Exon(1100,1200),
                        Exon(1200,1300)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=1.0)
@@ -262,32 +267,32 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[NEG_STRAND]
         # trim at different thresholds
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.001)
         correct = set()
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.011)
         correct = set([Exon(1000,1100)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.055)
         correct = set([Exon(1000,1100), Exon(1100,1200)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.15)
         correct = set([Exon(1000,1100), Exon(1100,1200),
                        Exon(1200,1300)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, NEG_STRAND,
+        trim_nodes = trim_graph_exons(G, NEG_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=1.0)
@@ -300,25 +305,25 @@ class TestTrim(unittest.TestCase):
         GG = get_transcript_graphs(transcripts)
         G,tmap = GG[POS_STRAND]
         # trim at different thresholds
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.01)
         correct = set()
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.11)
         correct = set([Exon(500,1500)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=0.21)
         correct = set([Exon(500,1500), Exon(2000,9000)])
         self.assertTrue(trim_nodes == correct)
-        trim_nodes = trim_graph(G, POS_STRAND,
+        trim_nodes = trim_graph_exons(G, POS_STRAND,
                                 min_trim_length=0, 
                                 trim_utr_fraction=0.0,
                                 trim_intron_fraction=1.0)
@@ -0,0 +1,199 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import pickle
+import random
+import shutil
+import logging
+import tempfile
+import unittest
+
+from assemblyline.lib.gtf import index_loci, sort_gtf, parse_loci
+from assemblyline.lib.transcript import parse_gtf
+from assemblyline.lib.tstore import TranscriptStore, TranscriptStoreWriter, \
+    write_transcript_store
+from assemblyline.pipeline import assemble_transcripts
+
+from test_base import get_gtf_path
+
+GTF_FILES = ["annotate_category1.gtf", "annotate_test1.gtf", 
+             "assemble1.gtf", "loci1.gtf", "trim_bidir1.gtf"]
+
+def write_aggregated_gtf(filename, num_loci, seed):
+    '''
+    write random transcripts in the format of 'aggregate_transcripts'. 
+    the transcripts of each locus share their first exon so that many
+    assembled transcripts start at the same position
+    '''
+    rng = random.Random(seed)
+    fileh = open(filename, 'w')
+    n = 0
+    for locus in xrange(num_loci):
+        base = locus * 10000
+        exons = [(base + i * 500, base + i * 500 + 200) for i in xrange(6)]
+        strand = '+' if (locus % 2) else '-'
+        for i in xrange(30):
+            chosen = [exons[0]] + sorted(rng.sample(exons[1:], 2))
+            attrs = ('transcript_id "T%d"; gene_id "G%d"; pct "%f"; '
+                     'ref "0";' % (n, n, rng.uniform(0, 100)))
+            n += 1
+            fields = ['chr1', 'test', 'transcript', str(chosen[0][0] + 1),
+                      str(chosen[-1][1]), '1000', strand, '.', attrs]
+            print >>fileh, '\t'.join(fields)
+            for start, end in chosen:
+                fields[2:5] = ['exon', str(start + 1), str(end)]
+                print >>fileh, '\t'.join(fields)
+    fileh.close()
+
+class TestTranscriptStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_store(self, filename):
+        path = os.path.join(self.tmp_dir, filename + '.tstore')
+        write_transcript_store(get_gtf_path(filename), path)
+        return TranscriptStore(path)
+
+    def test_transcripts(self):
+        for filename in GTF_FILES:
+            store = self.write_store(filename)
+            correct = list(parse_gtf(open(get_gtf_path(filename))))
+            loci = list(store.iterloci())
+            self.assertEqual(len(loci), len(correct))
+            for transcripts, correct_transcripts in zip(loci, correct):
+                self.assertEqual(len(transcripts), len(correct_transcripts))
+                for t, c in zip(transcripts, correct_transcripts):
+                    self.assertEqual((t.chrom, t.start, t.end, t.strand), 
+                                     (c.chrom, c.start, c.end, c.strand))
+                    self.assertEqual(t.exons, c.exons)
+                    self.assertEqual(t.attrs.items(), c.attrs.items())
+
+    def test_compact_transcripts(self):
+        for filename in GTF_FILES:
+            store = self.write_store(filename)
+            correct = list(parse_gtf(open(get_gtf_path(filename))))
+            loci = list(store.iterloci(compact=True))
+            self.assertEqual(len(loci), len(correct))
+            for transcripts, correct_transcripts in zip(loci, correct):
+                self.assertEqual(len(transcripts), len(correct_transcripts))
+                for t, c in zip(transcripts, correct_transcripts):
+                    self.assertEqual((t.chrom, t.start, t.end, t.strand), 
+                                     (c.chrom, c.start, c.end, c.strand))
+                    self.assertEqual(list(t.exons), c.exons)
+                    self.assertEqual(t.exons[-1], c.exons[-1])
+                    self.assertEqual(t.length, c.length)
+                    self.assertEqual(t.introns(), c.introns())
+                    self.assertEqual(t.attrs, c.attrs)
+                    self.assertEqual(t.attrs.get('not_an_attr'), None)
+                    get_fields = lambda f: (f.feature_type, f.start, f.end, 
+                                            f.strand, f.attrs)
+                    self.assertEqual(map(get_fields, t.to_gtf_features()),
+                                     map(get_fields, c.to_gtf_features()))
+        # attributes are copied when modified
+        transcripts = store.transcripts(0, 2, compact=True)
+        transcripts[0].attrs['category'] = '1'
+        self.assertEqual(transcripts[0].attrs['category'], '1')
+        self.assertFalse('category' in transcripts[1].attrs)
+        # pickled transcripts only keep their own exons
+        t = pickle.loads(pickle.dumps(transcripts[1], 2))
+        self.assertEqual(list(t.exons), list(transcripts[1].exons))
+        self.assertEqual(len(t.exons.starts), len(t.exons))
+
+    def test_loci(self):
+        for filename in GTF_FILES:
+            store = self.write_store(filename)
+            index = list(index_loci(open(get_gtf_path(filename), 'rb')))
+            loci = list(store.loci())
+            self.assertEqual([x[:3] + x[5:] for x in loci],
+                             [x[:3] + x[5:] for x in index])
+            self.assertEqual(sum(x[4] for x in loci), len(store))
+        store = self.write_store("loci1.gtf")
+        self.assertEqual([x[3:5] for x in store.loci()],
+                         [(0, 3), (3, 1), (4, 2), (6, 1)])
+        gene_ids = [t.attrs['gene_id'] for transcripts in 
+                    parse_gtf(open(get_gtf_path("loci1.gtf")))
+                    for t in transcripts]
+        self.assertEqual(store.attr_column('gene_id'), gene_ids)
+        self.assertTrue(store.attr_column('not_an_attr') is None)
+
+    def test_export_gtf(self):
+        for filename in GTF_FILES:
+            # exporting a sorted gtf file gives the same gtf file
+            store = self.write_store(filename)
+            gtf_file = os.path.join(self.tmp_dir, filename)
+            fileh = open(gtf_file, 'w')
+            store.write_gtf(fileh)
+            fileh.close()
+            sorted_gtf_file = os.path.join(self.tmp_dir, 'sorted.gtf')
+            sort_gtf(gtf_file, sorted_gtf_file)
+            self.assertEqual(open(gtf_file).read(),
+                             open(sorted_gtf_file).read())
+            path = os.path.join(self.tmp_dir, 'export.tstore')
+            write_transcript_store(gtf_file, path)
+            fileh = open(os.path.join(self.tmp_dir, 'export.gtf'), 'w')
+            TranscriptStore(path).write_gtf(fileh)
+            fileh.close()
+            self.assertEqual(open(gtf_file).read(),
+                             open(os.path.join(self.tmp_dir, 'export.gtf')).read())
+
+    def test_raw_columns(self):
+        # columns with many distinct values are converted to raw strings
+        # partway through the file
+        for filename in GTF_FILES:
+            path = os.path.join(self.tmp_dir, filename + '.raw.tstore')
+            writer = TranscriptStoreWriter(path, max_codes=2)
+            for lines in parse_loci(open(get_gtf_path(filename))):
+                writer.add_locus(lines)
+                writer.flush()
+            writer.close()
+            store = TranscriptStore(path)
+            if filename == "assemble1.gtf":
+                k = store.keys.index('exon_number')
+                self.assertTrue(('exon_attr%d' % k) in store.raw_columns)
+            correct = list(parse_gtf(open(get_gtf_path(filename))))
+            for transcripts, correct_transcripts in zip(store.iterloci(),
+                                                        correct):
+                for t, c in zip(transcripts, correct_transcripts):
+                    self.assertEqual(t.attrs, c.attrs)
+            # the same lines are exported as from a dictionary-encoded store
+            self.assertEqual(list(store.iter_gtf_lines()),
+                             list(self.write_store(filename).iter_gtf_lines()))
+
+    def test_assembly_round_trip(self):
+        # storing and exporting the output of the assembler gives the
+        # same GTF file
+        unsorted_gtf_file = os.path.join(self.tmp_dir, 'unsorted.gtf')
+        write_aggregated_gtf(unsorted_gtf_file, 12, 0)
+        gtf_file = os.path.join(self.tmp_dir, 'transcripts.gtf')
+        sort_gtf(unsorted_gtf_file, gtf_file)
+        output_dir = os.path.join(self.tmp_dir, 'assembly')
+        argv = sys.argv
+        sys.argv = ['assemble_transcripts.py', '--gtf', '-o', output_dir,
+                    gtf_file]
+        logging.disable(logging.CRITICAL)
+        try:
+            self.assertEqual(assemble_transcripts.main(), 0)
+        finally:
+            sys.argv = argv
+            logging.disable(logging.NOTSET)
+        assembly_gtf_file = os.path.join(output_dir, 'assembly.gtf')
+        path = os.path.join(self.tmp_dir, 'assembly.tstore')
+        write_transcript_store(assembly_gtf_file, path)
+        export_gtf_file = os.path.join(self.tmp_dir, 'export.gtf')
+        fileh = open(export_gtf_file, 'w')
+        TranscriptStore(path).write_gtf(fileh)
+        fileh.close()
+        self.assertTrue(len(open(assembly_gtf_file).readlines()) > 100)
+        self.assertEqual(open(export_gtf_file).read(),
+                         open(assembly_gtf_file).read())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import time
+import logging
+import argparse
+
+from assemblyline.lib.base import GTFAttr
+from assemblyline.lib.gtf import GTFFeature
+from assemblyline.lib.transcript import parse_gtf
+from assemblyline.lib import gtfparse
+
+def time_parser(func, repeat):
+    best = None
+    for i in xrange(repeat):
+        t0 = time.time()
+        n = 0
+        for x in func():
+            n += 1
+        elapsed = time.time() - t0
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    return best, n
+
+def main():
+    logging.basicConfig(level=logging.DEBUG,
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", dest="repeat", type=int, default=3,
+                        help="Number of times to run each parser "
+                        "(best time is reported) [default=%(default)s]")
+    parser.add_argument("--attrs", dest="attrs", 
+                        default=','.join([GTFAttr.REF, GTFAttr.PCTRANK]),
+                        help="Comma-separated list of attributes to "
+                        "decode with the compiled parser "
+                        "[default=%(default)s]")
+    parser.add_argument("gtf_file")
+    args = parser.parse_args()
+    if not os.path.exists(args.gtf_file):
+        parser.error("gtf file %s not found" % (args.gtf_file))
+    gtf_file = args.gtf_file
+    attrs = args.attrs.split(',')
+    benchmarks = [("GTFFeature.parse", 
+                   lambda: GTFFeature.parse(open(gtf_file))),
+                  ("gtfparse.parse", 
+                   lambda: gtfparse.parse(open(gtf_file))),
+                  ("gtfparse.parse attrs=%s" % (args.attrs), 
+                   lambda: gtfparse.parse(open(gtf_file), attrs=attrs)),
+                  ("transcript.parse_gtf", 
+                   lambda: parse_gtf(open(gtf_file))),
+                  ("gtfparse.parse_gtf", 
+                   lambda: gtfparse.parse_gtf(open(gtf_file))),
+                  ("gtfparse.parse_gtf attrs=%s" % (args.attrs), 
+                   lambda: gtfparse.parse_gtf(open(gtf_file), attrs=attrs))]
+    baseline = None
+    for name, func in benchmarks:
+        elapsed, n = time_parser(func, args.repeat)
+        if name == "transcript.parse_gtf":
+            baseline = None
+        if baseline is None:
+            baseline = elapsed
+        logging.info("%-40s items=%d time=%.3fs speedup=%.2fx" % 
+                     (name, n, elapsed, baseline / elapsed))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,9 +30,9 @@ import shutil
 
 import assemblyline
 from assemblyline.lib.bx.intersection import Interval, IntervalTree
-from assemblyline.lib.bx.cluster import ClusterTree
 from assemblyline.lib.base import Category, GTFAttr
-from assemblyline.lib.gtf import GTFFeature, sort_gtf
+from assemblyline.lib.gtf import GTFFeature, sort_gtf, merge_gtf
+from assemblyline.lib.refcache import get_reference_cache, REF_CACHE_SUFFIX
 from assemblyline.lib.transcript import cmp_strand, parse_gtf, \
     strand_int_to_str, NO_STRAND, POS_STRAND, NEG_STRAND
 from assemblyline.lib.assemble.transcript_graph import \
@@ -511,24 +511,17 @@ def compare_locus(transcripts):
             match_stats.append(ms)
         yield (t, match_stats)
 
-def build_locus_trees(gtf_file):
-    transcripts = []
-    locus_cluster_trees = collections.defaultdict(lambda: ClusterTree(0,1))    
-    for locus_transcripts in parse_gtf(open(gtf_file)):
-        for t in locus_transcripts: 
-            is_ref = bool(int(t.attrs[GTFAttr.REF]))
-            if not is_ref:
-                continue
-            i = len(transcripts)
-            transcripts.append(t)
-            locus_cluster_trees[t.chrom].insert(t.start, t.end, i)
-    # build interval trees of loci
+def build_locus_trees(ref_cache):
+    '''
+    build interval trees of the reference loci on each chromosome from
+    the transcript store of a compiled reference
+    '''
+    store = ref_cache.store()
     locus_trees = collections.defaultdict(lambda: IntervalTree())
-    for chrom, cluster_tree in locus_cluster_trees.iteritems():
-        for locus_start, locus_end, indexes in cluster_tree.getregions():
-            for i in indexes:
-                locus_transcripts = [transcripts[i] for i in indexes]
-                locus_trees[chrom].insert_interval(Interval(locus_start, locus_end, value=locus_transcripts))
+    for chrom, locus_start, locus_end, first, count, num_transcripts, \
+        num_boundaries in store.loci():
+        locus_transcripts = store.transcripts(first, count, compact=True)
+        locus_trees[chrom].insert_interval(Interval(locus_start, locus_end, value=locus_transcripts))
     return locus_trees
 
 def find_nearest_transcripts(chrom, start, end, strand, locus_trees):
@@ -610,36 +603,46 @@ def add_gtf_file(gtf_file, outfh, is_ref):
             f.attrs[GTFAttr.REF] = refval
             print >>outfh, str(f)
 
-def compare_assemblies(ref_gtf_file, test_gtf_file, output_dir): 
+def compare_assemblies(ref_gtf_file, test_gtf_file, output_dir, 
+                       ref_cache_dir=None): 
     # output files
     if not os.path.exists(output_dir):
         logging.info('Creating output dir: %s' % (output_dir))
         os.makedirs(output_dir)
+    # the reference is read from its compiled (sorted) form
+    ref_cache = get_reference_cache(ref_gtf_file, ref_cache_dir, 
+                                    tmp_dir=output_dir)
     # merge step
-    merged_gtf_file = os.path.join(output_dir, "merged.gtf")
-    merged_sorted_gtf_file = os.path.splitext(merged_gtf_file)[0] + ".srt.gtf"
+    ref_sorted_gtf_file = os.path.join(output_dir, "ref.srt.gtf")
+    test_gtf_file_tmp = os.path.join(output_dir, "test.gtf")
+    test_sorted_gtf_file = os.path.join(output_dir, "test.srt.gtf")
+    merged_sorted_gtf_file = os.path.join(output_dir, "merged.srt.gtf")
     merge_done_file = os.path.join(output_dir, 'merged.done')
     sort_done_file = os.path.join(output_dir, 'sort.done')
     if not os.path.exists(merge_done_file):
-        # merge and sort ref/test gtf files
-        logging.info("Merging reference and test GTF files")
-        # make temporary file to store merged ref/test gtf files
-        with open(merged_gtf_file, "w") as fileh:
-            logging.info("Adding reference GTF file")
-            add_gtf_file(ref_gtf_file, fileh, is_ref=True)
-            logging.info("Adding test GTF file")
+        # write ref/test gtf files
+        logging.info("Adding reference GTF file")
+        with open(ref_sorted_gtf_file, "w") as fileh:
+            ref_cache.write_gtf(fileh, lambda g_id: ((GTFAttr.REF, '1'),))
+        logging.info("Adding test GTF file")
+        with open(test_gtf_file_tmp, "w") as fileh:
             add_gtf_file(test_gtf_file, fileh, is_ref=False)
         open(merge_done_file, 'w').close()
     if not os.path.exists(sort_done_file):        
-        logging.info("Sorting merged GTF file")
+        logging.info("Sorting test GTF file")
         # create temp directory
         tmp_dir = os.path.join(output_dir, 'tmp')    
         if not os.path.exists(tmp_dir):
             logging.debug("Creating tmp directory '%s'" % (tmp_dir))
             os.makedirs(tmp_dir)
-        sort_gtf(merged_gtf_file, merged_sorted_gtf_file, tmp_dir=tmp_dir)
+        sort_gtf(test_gtf_file_tmp, test_sorted_gtf_file, tmp_dir=tmp_dir)
+        # the sorted reference only needs to be merged with the test file
+        logging.info("Merging reference and test GTF files")
+        merge_gtf([ref_sorted_gtf_file, test_sorted_gtf_file], 
+                  merged_sorted_gtf_file, tmp_dir=tmp_dir)
         # cleanup
         shutil.rmtree(tmp_dir)
+        os.remove(test_sorted_gtf_file)
         open(sort_done_file, 'w').close()
     # compare assemblies
     overlapping_gtf_file = os.path.join(output_dir, 'overlapping.gtf')
@@ -700,7 +703,7 @@ def compare_assemblies(ref_gtf_file, test_gtf_file, output_dir):
     intergenic_done_file = os.path.join(output_dir, 'intergenic.done')
     if not os.path.exists(intergenic_done_file):
         logging.info("Building interval index")
-        locus_trees = build_locus_trees(merged_sorted_gtf_file)
+        locus_trees = build_locus_trees(ref_cache)
         logging.info('Finding nearest matches to intergenic transcripts')
         gtf_fileh = open(intergenic_gtf_file, 'w')
         intergenic_fileh = open(intergenic_file, 'w')
@@ -778,6 +781,13 @@ def main():
                         dest="verbose", default=False)
     parser.add_argument("-o", "--output-dir", dest="output_dir", 
                         default="compare")
+    parser.add_argument("--ref-cache-dir", dest="ref_cache_dir", 
+                        default=None, metavar="DIR",
+                        help="Directory of compiled reference annotations "
+                        "that are reused across runs [default=reference "
+                        "GTF file + '%s', or the output directory when the "
+                        "directory of the reference is not writable]" % 
+                        (REF_CACHE_SUFFIX))
     parser.add_argument("ref_gtf_file")
     parser.add_argument("test_gtf_file")
     args = parser.parse_args()
@@ -803,9 +813,10 @@ def main():
     logging.info("verbose logging:       %s" % (args.verbose))
     logging.info("reference gtf file:    %s" % (args.ref_gtf_file))
     logging.info("test gtf file:         %s" % (args.test_gtf_file))
+    logging.info("reference cache dir:   %s" % (args.ref_cache_dir))
     logging.info("output dir:            %s" % (args.output_dir))
     compare_assemblies(args.ref_gtf_file, args.test_gtf_file, 
-                       args.output_dir)
+                       args.output_dir, args.ref_cache_dir)
     return 0
 
 if __name__ == "__main__":
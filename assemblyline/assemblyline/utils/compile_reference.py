@@ -0,0 +1,46 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import logging
+import argparse
+
+import assemblyline
+from assemblyline.lib.refcache import get_reference_cache, REF_CACHE_SUFFIX
+
+def main():
+    # setup logging
+    logging.basicConfig(level=logging.DEBUG,
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.info("AssemblyLine %s" % (assemblyline.__version__))
+    logging.info("----------------------------------")
+    # parse command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ref-cache-dir", dest="ref_cache_dir", 
+                        default=None, metavar="DIR",
+                        help="Directory of compiled reference annotations "
+                        "[default=reference GTF file + '%s', or the "
+                        "system temporary directory when the directory of "
+                        "the reference is not writable]" % 
+                        (REF_CACHE_SUFFIX))
+    parser.add_argument("ref_gtf_file")
+    args = parser.parse_args()
+    # check command line
+    if not os.path.exists(args.ref_gtf_file):
+        parser.error("reference GTF file %s not found" % (args.ref_gtf_file))
+    logging.info("Parameters:")
+    logging.info("reference GTF file:  %s" % (args.ref_gtf_file))
+    logging.info("reference cache dir: %s" % (args.ref_cache_dir))
+    logging.info("Compiling reference")
+    ref_cache = get_reference_cache(args.ref_gtf_file, args.ref_cache_dir)
+    logging.info("Compiled %d reference transcripts in %d loci to '%s'" % 
+                 (len(ref_cache.store()), ref_cache.store().num_loci, 
+                  ref_cache.path))
+    logging.info("Done")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
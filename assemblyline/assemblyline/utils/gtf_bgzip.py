@@ -0,0 +1,53 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import shutil
+import logging
+import argparse
+
+import assemblyline
+from assemblyline.lib.gtf import open_gtf, write_locus_index, \
+    LOCUS_INDEX_SUFFIX
+
+def main():
+    # setup logging
+    logging.basicConfig(level=logging.DEBUG,
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.info("AssemblyLine %s" % (assemblyline.__version__))
+    logging.info("----------------------------------")
+    # parse command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no-index", dest="index", action="store_false",
+                        default=True, 
+                        help="Do not index the loci of the output file")
+    parser.add_argument("input_gtf_file", 
+                        help="sorted GTF file")
+    parser.add_argument("output_gtf_file", 
+                        help="BGZF compressed output file (.gz)")
+    args = parser.parse_args()
+    # check command line
+    if not os.path.exists(args.input_gtf_file):
+        parser.error("input gtf file %s not found" % (args.input_gtf_file))
+    if not args.output_gtf_file.endswith('.gz'):
+        parser.error("output gtf file must end with '.gz'")
+    logging.info("Parameters:")
+    logging.info("input gtf file:  %s" % (args.input_gtf_file))
+    logging.info("output gtf file: %s" % (args.output_gtf_file))
+    logging.info("Compressing")
+    outfh = open_gtf(args.output_gtf_file, 'w')
+    shutil.copyfileobj(open_gtf(args.input_gtf_file), outfh)
+    outfh.close()
+    if args.index:
+        logging.info("Indexing loci")
+        num_loci = write_locus_index(args.output_gtf_file, 
+                                     args.output_gtf_file + LOCUS_INDEX_SUFFIX)
+        logging.info("Indexed %d loci" % (num_loci))
+    logging.info("Done")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
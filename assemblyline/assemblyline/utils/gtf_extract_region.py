@@ -8,13 +8,22 @@ import argparse
 import sys
 import os
 
-from assemblyline.lib.transcript import parse_gtf
+from assemblyline.lib.gtf import open_gtf, write_locus_index, \
+    locus_index_is_current, query_locus_index, read_locus_lines, \
+    LOCUS_INDEX_SUFFIX
+from assemblyline.lib.transcript import transcripts_from_gtf_lines
 
 def main():
     logging.basicConfig(level=logging.DEBUG,
                         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     parser = argparse.ArgumentParser()
-    parser.add_argument("gtf_file")
+    parser.add_argument("--locus-index", dest="locus_index_file",
+                        default=None, metavar="FILE",
+                        help="Locus index of the GTF file (created if "
+                        "it does not exist) [default=GTF file + '%s']" %
+                        (LOCUS_INDEX_SUFFIX))
+    parser.add_argument("gtf_file", 
+                        help="sorted GTF file (optionally BGZF compressed)")
     parser.add_argument("region")
     args = parser.parse_args()
     if not os.path.exists(args.gtf_file):
@@ -23,16 +32,28 @@ def main():
     start, end = startend.split("-")
     region_start = int(start)
     region_end = int(end)
-    for transcripts in parse_gtf(open(args.gtf_file)):
-        for t in transcripts:
+    index_file = args.locus_index_file
+    if index_file is None:
+        index_file = args.gtf_file + LOCUS_INDEX_SUFFIX
+    if not locus_index_is_current(args.gtf_file, index_file):
+        logging.info("Indexing loci in GTF file")
+        write_locus_index(args.gtf_file, index_file)
+    # read only the loci that overlap the region
+    fileh = open_gtf(args.gtf_file, 'rb')
+    for locus in query_locus_index(index_file, region_chrom, region_start,
+                                   region_end):
+        offset, length = locus[3:5]
+        lines = read_locus_lines(fileh, offset, length)
+        for t in transcripts_from_gtf_lines(lines):
             if ((t.chrom == region_chrom) and
                 (t.start < region_end) and
                 (t.end > region_start)):
                 features = t.to_gtf_features()
                 for f in features:
                     print str(f)
+    fileh.close()
     logging.debug("Done")
     return 0
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,40 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import os
+import sys
+import logging
+import argparse
+
+import assemblyline
+from assemblyline.lib.tstore import write_transcript_store, TranscriptStore
+
+def main():
+    # setup logging
+    logging.basicConfig(level=logging.DEBUG,
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.info("AssemblyLine %s" % (assemblyline.__version__))
+    logging.info("----------------------------------")
+    # parse command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_gtf_file", 
+                        help="sorted GTF file")
+    parser.add_argument("output_store")
+    args = parser.parse_args()
+    # check command line
+    if not os.path.exists(args.input_gtf_file):
+        parser.error("input gtf file %s not found" % (args.input_gtf_file))
+    logging.info("Parameters:")
+    logging.info("input gtf file:  %s" % (args.input_gtf_file))
+    logging.info("output store:    %s" % (args.output_store))
+    logging.info("Writing transcript store")
+    num_loci = write_transcript_store(args.input_gtf_file, args.output_store)
+    logging.info("Wrote %d transcripts in %d loci" % 
+                 (len(TranscriptStore(args.output_store)), num_loci))
+    logging.info("Done")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,7 @@ import argparse
 
 import assemblyline
 from assemblyline.lib.gtf import sort_gtf
+from assemblyline.lib.batch_sort import DEFAULT_SORT_MEMORY
 
 def main():
     # setup logging
@@ -21,6 +22,14 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--tmp-dir', dest="tmp_dir", default=None,
                         help="directory for sort to store temp files")
+    parser.add_argument('-p', '--num-processors', type=int, 
+                        dest="num_processors", default=1,
+                        help="number of processes sorting chunks "
+                        "in parallel")
+    parser.add_argument('--memory', type=int, dest="memory", 
+                        default=DEFAULT_SORT_MEMORY,
+                        help="approximate memory used by the sort "
+                        "in bytes [default=%(default)s]")
     parser.add_argument("input_gtf_file")
     parser.add_argument("output_gtf_file")
     args = parser.parse_args()
@@ -32,7 +41,9 @@ def main():
     logging.info("output gtf file: %s" % (args.output_gtf_file))
     logging.info("Sorting")
     sort_gtf(args.input_gtf_file, args.output_gtf_file, 
-             tmp_dir=args.tmp_dir)
+             tmp_dir=args.tmp_dir, 
+             num_processors=max(1, args.num_processors),
+             memory=args.memory)
     logging.info("Done")
     return 0
 
@@ -0,0 +1,23 @@
+'''
+Created on Oct 16, 2026
+
+@author: mkiyer
+'''
+import sys
+import argparse
+
+from assemblyline.lib.tstore import TranscriptStore, is_transcript_store
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("store")
+    args = parser.parse_args()
+    # check command line
+    if not is_transcript_store(args.store):
+        parser.error("%s is not a transcript store" % (args.store))
+    # write sorted gtf file to stdout
+    TranscriptStore(args.store).write_gtf(sys.stdout)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
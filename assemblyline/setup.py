@@ -31,6 +31,9 @@ def get_extension_modules():
     # Interval intersection
     extensions.append(Extension("assemblyline.lib.bx.intersection", 
                                 ["assemblyline/lib/bx/intersection.pyx"]))
+    # GTF parser
+    extensions.append(Extension("assemblyline.lib.gtfparse", 
+                                ["assemblyline/lib/gtfparse.pyx"]))
     return extensions
 
 def main():